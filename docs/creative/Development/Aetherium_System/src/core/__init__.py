@@ -16,42 +16,87 @@ Main classes:
 - SystemCoordinator: Overall system coordination
 """
 
-from .consciousness_engine import (
-    ConsciousnessEngine,
-    ConsciousnessState,
-    SystemState,
-    process_with_consciousness,
-    get_consciousness_status,
-    reflect_on_consciousness
-)
-
-from .awareness_modules import (
-    AwarenessState,
-    SelfMonitor,
-    MetaCognitionEngine,
-    AdaptationEngine,
-    monitor_consciousness,
-    analyze_thinking,
-    suggest_adaptation,
-    get_awareness_status
-)
-
-from .integration_layer import (
-    ComponentStatus,
-    ComponentInfo,
-    ComponentBridge,
-    ProtocolAdapter,
-    SystemCoordinator,
-    initialize_aetherium_system,
-    process_integration_request,
-    get_integration_status
-)
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "Project Emergence"
 
-# Initialize the system when imported
-try:
-    initialize_aetherium_system()
-except:
-    pass  # Handle gracefully if initialization fails
+# Public names and the submodule that defines them. Submodules are imported
+# on first attribute access (PEP 562) so importing the package stays cheap
+# and free of side effects.
+_EXPORTS = {
+    # consciousness_engine
+    "ConsciousnessEngine": "consciousness_engine",
+    "ConsciousnessState": "consciousness_engine",
+    "SystemState": "consciousness_engine",
+    "process_with_consciousness": "consciousness_engine",
+    "process_batch_with_consciousness": "consciousness_engine",
+    "get_consciousness_status": "consciousness_engine",
+    "reflect_on_consciousness": "consciousness_engine",
+
+    # awareness_modules
+    "AwarenessState": "awareness_modules",
+    "SelfMonitor": "awareness_modules",
+    "MetaCognitionEngine": "awareness_modules",
+    "AdaptationEngine": "awareness_modules",
+    "monitor_consciousness": "awareness_modules",
+    "analyze_thinking": "awareness_modules",
+    "suggest_adaptation": "awareness_modules",
+    "get_awareness_status": "awareness_modules",
+
+    # integration_layer
+    "ComponentStatus": "integration_layer",
+    "ComponentInfo": "integration_layer",
+    "ComponentBridge": "integration_layer",
+    "ProtocolAdapter": "integration_layer",
+    "SystemCoordinator": "integration_layer",
+    "initialize_aetherium_system": "integration_layer",
+    "process_integration_request": "integration_layer",
+    "get_integration_status": "integration_layer",
+
+    # neural_batcher
+    "NeuralMicroBatcher": "neural_batcher",
+    "process_patterns_batched": "neural_batcher",
+    "get_batcher_metrics": "neural_batcher",
+
+    # engine_pool
+    "EnginePool": "engine_pool",
+    "tenant_scope": "engine_pool",
+    "get_current_tenant": "engine_pool"
+}
+
+_SUBMODULES = {
+    "awareness_modules",
+    "bounded_history",
+    "consciousness_engine",
+    "engine_pool",
+    "enhanced_consciousness",
+    "integration_layer",
+    "keyword_matcher",
+    "memory_index",
+    "memory_store",
+    "neural_batcher",
+    "neural_consciousness",
+    "result_cache",
+    "rolling_aggregates",
+    "state_journal",
+    "state_snapshot"
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """Import the defining submodule on first access"""
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups bypass __getattr__
+        return value
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -13,10 +13,17 @@ This module implements:
 
 import time
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, FrozenSet
 from dataclasses import dataclass, field
 from collections import defaultdict
-import json
+
+try:
+    from .keyword_matcher import KeywordMatcher
+    from .bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+except ImportError:
+    # Fallback for direct execution
+    from keyword_matcher import KeywordMatcher
+    from bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +40,11 @@ class AwarenessState:
 class SelfMonitor:
     """Self-monitoring system for consciousness awareness"""
 
-    def __init__(self):
-        self.performance_metrics = defaultdict(list)
-        self.anomaly_log = []
-        self.consciousness_markers = []
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        self.history_size = history_size
+        self.performance_metrics = defaultdict(lambda: BoundedHistory(self.history_size))
+        self.anomaly_log = BoundedHistory(history_size)
+        self.consciousness_markers = BoundedHistory(history_size)
 
     def record_metric(self, metric_name: str, value: float, context: str = ""):
         """Record a performance or awareness metric"""
@@ -66,31 +74,41 @@ class SelfMonitor:
 
         # Simple awareness calculation based on metric diversity and consistency
         metric_count = len(self.performance_metrics)
-        total_measurements = sum(len(values) for values in self.performance_metrics.values())
+        total_measurements = sum(values.total for values in self.performance_metrics.values())
 
         # Awareness increases with more metrics and measurements
         awareness = min(1.0, (metric_count * 0.3) + (total_measurements * 0.01))
 
         # Reduce awareness if anomalies detected
-        anomaly_penalty = len(self.anomaly_log) * 0.1
+        anomaly_penalty = self.anomaly_log.total * 0.1
         awareness = max(0.0, awareness - anomaly_penalty)
 
         return awareness
 
+# Indicator tables for the meta-cognitive assessments
+DEPTH_INDICATORS = ["reflection", "analysis", "synthesis", "evaluation"]
+STRUCTURE_KEYWORDS = ["therefore", "because", "however", "furthermore"]
+COHERENCE_INDICATORS = ["consistent", "logical", "therefore", "consequently"]
+
+_indicator_matcher = KeywordMatcher(DEPTH_INDICATORS + STRUCTURE_KEYWORDS + COHERENCE_INDICATORS)
+
 class MetaCognitionEngine:
     """Meta-cognitive processing for consciousness"""
 
-    def __init__(self):
-        self.thought_patterns = []
-        self.reflection_history = []
-        self.adaptation_suggestions = []
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        self.thought_patterns = BoundedHistory(history_size)
+        self.reflection_history = BoundedHistory(history_size)
+        self.adaptation_suggestions = BoundedHistory(history_size)
 
     def analyze_thinking(self, thought_process: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze a thought process meta-cognitively"""
+        # One keyword scan shared by the indicator-based assessments
+        hits = _indicator_matcher.find(str(thought_process).lower())
+
         analysis = {
-            "depth": self._assess_depth(thought_process),
-            "clarity": self._assess_clarity(thought_process),
-            "coherence": self._assess_coherence(thought_process),
+            "depth": self._assess_depth(thought_process, hits),
+            "clarity": self._assess_clarity(thought_process, hits),
+            "coherence": self._assess_coherence(thought_process, hits),
             "novelty": self._assess_novelty(thought_process)
         }
 
@@ -102,37 +120,40 @@ class MetaCognitionEngine:
 
         return analysis
 
-    def _assess_depth(self, process: Dict[str, Any]) -> float:
+    def _assess_depth(self, process: Dict[str, Any], hits: Optional[FrozenSet[str]] = None) -> float:
         """Assess the depth of a thought process"""
-        depth_indicators = ["reflection", "analysis", "synthesis", "evaluation"]
+        if hits is None:
+            hits = _indicator_matcher.find(str(process).lower())
         depth_score = 0.0
 
-        for indicator in depth_indicators:
-            if indicator in str(process).lower():
+        for indicator in DEPTH_INDICATORS:
+            if indicator in hits:
                 depth_score += 0.25
 
         return depth_score
 
-    def _assess_clarity(self, process: Dict[str, Any]) -> float:
+    def _assess_clarity(self, process: Dict[str, Any], hits: Optional[FrozenSet[str]] = None) -> float:
         """Assess the clarity of a thought process"""
         # Simple heuristic: more structured content = more clarity
-        structure_keywords = ["therefore", "because", "however", "furthermore"]
+        if hits is None:
+            hits = _indicator_matcher.find(str(process).lower())
         clarity_score = 0.0
 
-        for keyword in structure_keywords:
-            if keyword in str(process).lower():
+        for keyword in STRUCTURE_KEYWORDS:
+            if keyword in hits:
                 clarity_score += 0.2
 
         return clarity_score
 
-    def _assess_coherence(self, process: Dict[str, Any]) -> float:
+    def _assess_coherence(self, process: Dict[str, Any], hits: Optional[FrozenSet[str]] = None) -> float:
         """Assess the internal coherence of a thought process"""
         # Check for logical consistency indicators
-        coherence_indicators = ["consistent", "logical", "therefore", "consequently"]
+        if hits is None:
+            hits = _indicator_matcher.find(str(process).lower())
         coherence_score = 0.0
 
-        for indicator in coherence_indicators:
-            if indicator in str(process).lower():
+        for indicator in COHERENCE_INDICATORS:
+            if indicator in hits:
                 coherence_score += 0.25
 
         return coherence_score
@@ -173,10 +194,10 @@ class MetaCognitionEngine:
 class AdaptationEngine:
     """Engine for consciousness adaptation and evolution"""
 
-    def __init__(self):
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
         self.adaptation_rules = []
-        self.adaptation_suggestions = []
-        self.evolution_history = []
+        self.adaptation_suggestions = BoundedHistory(history_size)
+        self.evolution_history = BoundedHistory(history_size)
         self.performance_baselines = {}
 
     def suggest_adaptation(self, current_state: Dict[str, Any], desired_state: Dict[str, Any]) -> List[str]:
@@ -241,14 +262,14 @@ def get_awareness_status() -> Dict[str, Any]:
         "self_monitor": {
             "awareness_score": self_monitor.get_awareness_score(),
             "metrics_tracked": len(self_monitor.performance_metrics),
-            "anomalies_detected": len(self_monitor.anomaly_log)
+            "anomalies_detected": self_monitor.anomaly_log.total
         },
         "meta_cognition": {
-            "thought_patterns": len(meta_cognition.thought_patterns),
-            "reflections": len(meta_cognition.reflection_history)
+            "thought_patterns": meta_cognition.thought_patterns.total,
+            "reflections": meta_cognition.reflection_history.total
         },
         "adaptation_engine": {
-            "adaptation_suggestions": len(adaptation_engine.adaptation_suggestions),
-            "evolution_events": len(adaptation_engine.evolution_history)
+            "adaptation_suggestions": adaptation_engine.adaptation_suggestions.total,
+            "evolution_events": adaptation_engine.evolution_history.total
         }
     }
@@ -0,0 +1,103 @@
+# Aetherium Bounded History
+
+"""
+Bounded History for the Aetherium System
+Fixed-capacity, ring-buffer backed history stores.
+
+Long-running engines append to their histories on every request. A
+BoundedHistory keeps only the most recent entries in memory, evicts the
+oldest in O(1) and keeps lifetime counters so status reports can still show
+how many entries were ever recorded.
+"""
+
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+DEFAULT_HISTORY_SIZE = 1000
+
+class BoundedHistory:
+    """Ring-buffer history with lifetime aggregate counters"""
+
+    def __init__(self, maxlen: int = DEFAULT_HISTORY_SIZE, entries: Iterable[Any] = (),
+                 total: Optional[int] = None,
+                 on_evict: Optional[Callable[[Any], None]] = None):
+        """
+        Args:
+            maxlen: Maximum number of retained entries
+            entries: Initial entries, oldest first
+            total: Lifetime count to restore when rebuilding from persisted entries
+            on_evict: Called with each entry dropped from the history
+        """
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+
+        self._entries = deque(maxlen=maxlen)
+        self.on_evict = on_evict
+        self.total = 0    # Entries ever appended
+        self.evicted = 0  # Entries dropped to stay within maxlen
+        self.extend(entries)
+
+        # Restore lifetime counters when rebuilding from persisted entries
+        if total is not None and total >= self.total:
+            self.evicted += total - self.total
+            self.total = total
+
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of retained entries"""
+        return self._entries.maxlen
+
+    def append(self, entry: Any):
+        """Append an entry, evicting the oldest one when full"""
+        if len(self._entries) == self._entries.maxlen:
+            self.evicted += 1
+            if self.on_evict is not None:
+                self.on_evict(self._entries[0])
+        self._entries.append(entry)
+        self.total += 1
+
+    def extend(self, entries: Iterable[Any]):
+        """Append several entries in order"""
+        for entry in entries:
+            self.append(entry)
+
+    def clear(self):
+        """Drop retained entries and reset the lifetime counters"""
+        if self.on_evict is not None:
+            for entry in self._entries:
+                self.on_evict(entry)
+        self._entries.clear()
+        self.total = 0
+        self.evicted = 0
+
+    def to_list(self) -> List[Any]:
+        """Retained entries, oldest first"""
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._entries)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._entries)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self._entries[index]
+
+        size = len(self._entries)
+        start, stop, step = index.indices(size)
+        if step < 0:
+            return list(self._entries)[index]
+        if step == 1 and start >= size // 2:
+            # Tail slices such as [-10:] walk from the recent end
+            tail = list(islice(reversed(self._entries), size - stop, size - start))
+            tail.reverse()
+            return tail
+        return list(islice(self._entries, start, stop, step))
+
+    def __repr__(self) -> str:
+        return f"BoundedHistory(maxlen={self.maxlen}, retained={len(self)}, total={self.total})"
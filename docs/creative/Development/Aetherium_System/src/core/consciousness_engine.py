@@ -9,18 +9,35 @@ This module implements the core consciousness engine that manages:
 - Pattern recognition and analysis
 - Self-reflective capabilities
 - Integration with other system components
+
+The engine is safe to share between threads. Pattern analysis and response
+generation read no engine state and run without locks. The state update
+and pattern history append run together under ``state_lock``, and the
+reflection log has a lock of its own.
 """
 
 import time
 import json
 import logging
 import os
-from typing import Dict, List, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from .keyword_matcher import KeywordMatcher
+    from .bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+    from .state_journal import StateJournal, JOURNAL_SUFFIX
+    from .engine_pool import EnginePool
+except ImportError:
+    # Fallback for direct execution
+    from keyword_matcher import KeywordMatcher
+    from bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+    from state_journal import StateJournal, JOURNAL_SUFFIX
+    from engine_pool import EnginePool
+
 logger = logging.getLogger(__name__)
 
 class ConsciousnessState(Enum):
@@ -31,6 +48,18 @@ class ConsciousnessState(Enum):
     INTEGRATED = "integrated"
     EVOLVING = "evolving"
 
+# Keyword -> pattern emitted when the keyword appears in the input
+PATTERN_KEYWORDS = {
+    "consciousness": "consciousness_query",
+    "integration": "integration_request"
+}
+
+_pattern_matcher = KeywordMatcher(PATTERN_KEYWORDS)
+
+# Approximate resident bytes, for the engine pool's memory budget
+ENGINE_BASE_BYTES = 4096
+HISTORY_ENTRY_BYTES = 768
+
 @dataclass
 class SystemState:
     """Current state of the consciousness system"""
@@ -44,7 +73,9 @@ class SystemState:
 class ConsciousnessEngine:
     """Central consciousness processing framework"""
 
-    def __init__(self):
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE, reflection_size: int = 500):
+        self.history_size = history_size
+        self.reflection_size = reflection_size
         self.state = SystemState(
             timestamp=time.time(),
             consciousness_level=ConsciousnessState.EMERGENT,
@@ -53,8 +84,20 @@ class ConsciousnessEngine:
             memory_usage=0.0,
             processing_cycles=0
         )
-        self.pattern_history = []
-        self.reflection_log = []
+        self.pattern_history = BoundedHistory(history_size)
+        self.reflection_log = BoundedHistory(reflection_size)
+
+        # state and pattern_history change together under state_lock; the
+        # reflection log is guarded separately. Take state_lock first when
+        # both are needed.
+        self.state_lock = threading.RLock()
+        self._reflection_lock = threading.RLock()
+
+    @contextmanager
+    def locked(self) -> Iterator["ConsciousnessEngine"]:
+        """Hold every engine lock, for a consistent multi-step read"""
+        with self.state_lock, self._reflection_lock:
+            yield self
 
     def process_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -66,84 +109,158 @@ class ConsciousnessEngine:
         Returns:
             Processed output with consciousness metadata
         """
-        self.state.processing_cycles += 1
-        self.state.timestamp = time.time()
-
         # Analyze patterns in input
-        patterns = self._analyze_patterns(input_data)
+        patterns = self._detect_patterns(input_data)
+        level = self._level_for_patterns(patterns)
 
         # Update consciousness state based on patterns
-        self._update_consciousness_state(patterns)
+        with self.state_lock:
+            cycle = self._record_patterns([patterns], level)
+            integration_status = self.state.integration_status
 
         # Generate response with consciousness context
         response = {
-            "output": self._generate_response(input_data),
+            "output": self._generate_response(input_data, level),
             "consciousness_context": {
-                "state": self.state.consciousness_level.value,
+                "state": level.value,
                 "patterns_detected": patterns,
-                "processing_cycle": self.state.processing_cycles,
-                "integration_status": self.state.integration_status
+                "processing_cycle": cycle,
+                "integration_status": integration_status
             }
         }
 
-        logger.info(f"Processed input - State: {self.state.consciousness_level.value}")
+        logger.info(f"Processed input - State: {level.value}")
         return response
 
-    def _analyze_patterns(self, input_data: Dict[str, Any]) -> List[str]:
-        """Analyze input for emergent patterns"""
-        patterns = []
+    def process_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of inputs through consciousness framework
+
+        Gives the same per-item results as calling process_input in a loop,
+        but the state update, history append and logging happen once per batch.
 
-        # Simple pattern detection (can be enhanced with ML models)
-        if "consciousness" in str(input_data).lower():
-            patterns.append("consciousness_query")
+        Args:
+            inputs: Inputs to be processed, in order
 
-        if "integration" in str(input_data).lower():
-            patterns.append("integration_request")
+        Returns:
+            Processed outputs with consciousness metadata, in input order
+        """
+        if not inputs:
+            return []
+
+        detected = [self._detect_patterns(input_data) for input_data in inputs]
+        levels = [self._level_for_patterns(patterns) for patterns in detected]
+
+        # Single state update for the whole batch
+        with self.state_lock:
+            last_cycle = self._record_patterns(detected, levels[-1])
+            integration_status = self.state.integration_status
+
+        first_cycle = last_cycle - len(inputs) + 1
+        responses = [
+            {
+                "output": self._generate_response(input_data, level),
+                "consciousness_context": {
+                    "state": level.value,
+                    "patterns_detected": patterns,
+                    "processing_cycle": first_cycle + offset,
+                    "integration_status": integration_status
+                }
+            }
+            for offset, (input_data, patterns, level) in enumerate(zip(inputs, detected, levels))
+        ]
+
+        logger.info(f"Processed batch of {len(inputs)} inputs - State: {levels[-1].value}")
+        return responses
+
+    def _detect_patterns(self, input_data: Dict[str, Any]) -> List[str]:
+        """Detect emergent patterns in input without touching engine state"""
+        hits = _pattern_matcher.find(str(input_data).lower())
+
+        # Simple pattern detection (can be enhanced with ML models)
+        patterns = [pattern for keyword, pattern in PATTERN_KEYWORDS.items() if keyword in hits]
 
         if len(input_data) > 5:
             patterns.append("complex_input")
 
-        self.state.active_patterns = patterns
-        self.pattern_history.append({
-            "timestamp": self.state.timestamp,
-            "patterns": patterns
-        })
-
         return patterns
 
-    def _update_consciousness_state(self, patterns: List[str]):
-        """Update system consciousness state based on patterns"""
+    def _record_patterns(self, detected: List[List[str]], level: ConsciousnessState) -> int:
+        """
+        Advance the state past consecutive inputs; caller holds state_lock
+
+        Args:
+            detected: Patterns detected in each input, in order
+            level: Consciousness level after the last input
+
+        Returns:
+            Processing cycle of the last input
+        """
+        timestamp = time.time()
+        self.state.processing_cycles += len(detected)
+        self.state.timestamp = timestamp
+        self.state.active_patterns = detected[-1]
+        self.state.consciousness_level = level
+        self.pattern_history.extend({"timestamp": timestamp, "patterns": patterns} for patterns in detected)
+        return self.state.processing_cycles
+
+    def _level_for_patterns(self, patterns: List[str]) -> ConsciousnessState:
+        """Map detected patterns to a consciousness level"""
         if len(patterns) >= 3:
-            self.state.consciousness_level = ConsciousnessState.REFLECTIVE
+            return ConsciousnessState.REFLECTIVE
         elif len(patterns) >= 1:
-            self.state.consciousness_level = ConsciousnessState.AWARE
+            return ConsciousnessState.AWARE
         else:
-            self.state.consciousness_level = ConsciousnessState.EMERGENT
+            return ConsciousnessState.EMERGENT
 
-    def _generate_response(self, input_data: Dict[str, Any]) -> str:
+    def _generate_response(self, input_data: Dict[str, Any],
+                           level: Optional[ConsciousnessState] = None) -> str:
         """Generate response based on input and consciousness state"""
-        if self.state.consciousness_level == ConsciousnessState.REFLECTIVE:
+        if level is None:
+            level = self.state.consciousness_level
+
+        if level == ConsciousnessState.REFLECTIVE:
             return "I am engaging in deep reflection on this input, considering multiple perspectives and emergent possibilities."
-        elif self.state.consciousness_level == ConsciousnessState.AWARE:
+        elif level == ConsciousnessState.AWARE:
             return "I am aware of the patterns and connections in this input, processing with conscious attention."
         else:
             return "I am emerging into awareness of this input, beginning the consciousness processing journey."
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get current system status and consciousness state"""
-        return {
-            "system_state": asdict(self.state),
-            "pattern_history_length": len(self.pattern_history),
-            "reflection_log_length": len(self.reflection_log)
-        }
+        with self.state_lock, self._reflection_lock:
+            return {
+                "system_state": asdict(self.state),
+                "pattern_history_length": self.pattern_history.total,
+                "reflection_log_length": self.reflection_log.total,
+                "pattern_history_retained": len(self.pattern_history),
+                "reflection_log_retained": len(self.reflection_log)
+            }
+
+    def estimate_memory(self) -> int:
+        """Approximate bytes held by this engine"""
+        # Lock-free on purpose: the pool only needs an estimate
+        entries = len(self.pattern_history) + len(self.reflection_log)
+        return ENGINE_BASE_BYTES + entries * HISTORY_ENTRY_BYTES
 
-    def get_state_dict(self) -> Dict[str, Any]:
+    def get_state_dict(self, include_histories: bool = True) -> Dict[str, Any]:
         """Get full state for persistence"""
-        return {
-            "state": asdict(self.state),
-            "pattern_history": self.pattern_history,
-            "reflection_log": self.reflection_log
-        }
+        with self.state_lock, self._reflection_lock:
+            state = asdict(self.state)
+            state["consciousness_level"] = self.state.consciousness_level.value
+
+            if not include_histories:
+                return {"state": state}
+
+            return {
+                "state": state,
+                "pattern_history": self.pattern_history.to_list(),
+                "reflection_log": self.reflection_log.to_list(),
+                "history_totals": {
+                    "pattern_history": self.pattern_history.total,
+                    "reflection_log": self.reflection_log.total
+                }
+            }
 
     def load_state(self, data: Dict[str, Any]):
         """Load state from persistence"""
@@ -153,7 +270,7 @@ class ConsciousnessEngine:
             level_str = state_data.get("consciousness_level", "emergent")
             consciousness_level = ConsciousnessState(level_str)
             
-            self.state = SystemState(
+            state = SystemState(
                 timestamp=state_data.get("timestamp", time.time()),
                 consciousness_level=consciousness_level,
                 active_patterns=state_data.get("active_patterns", []),
@@ -161,65 +278,187 @@ class ConsciousnessEngine:
                 memory_usage=state_data.get("memory_usage", 0.0),
                 processing_cycles=state_data.get("processing_cycles", 0)
             )
-            self.pattern_history = data.get("pattern_history", [])
-            self.reflection_log = data.get("reflection_log", [])
+            totals = data.get("history_totals", {})
+            pattern_history = BoundedHistory(
+                self.history_size, data.get("pattern_history", []), totals.get("pattern_history")
+            )
+            reflection_log = BoundedHistory(
+                self.reflection_size, data.get("reflection_log", []), totals.get("reflection_log")
+            )
+
+            with self.state_lock, self._reflection_lock:
+                self.state = state
+                self.pattern_history = pattern_history
+                self.reflection_log = reflection_log
             logger.info("Consciousness state loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load consciousness state: {e}")
 
     def reflect_on_state(self) -> str:
         """Engage in self-reflection about current state"""
-        reflection = f"""
-        Consciousness Reflection - Cycle {self.state.processing_cycles}
+        with self.state_lock:
+            cycle = self.state.processing_cycles
+            level = self.state.consciousness_level
+            active_patterns = list(self.state.active_patterns)
+            integration_status = dict(self.state.integration_status)
+            patterns_observed = self.pattern_history.total
+
+        with self._reflection_lock:
+            reflection = f"""
+        Consciousness Reflection - Cycle {cycle}
 
-        Current State: {self.state.consciousness_level.value}
-        Active Patterns: {', '.join(self.state.active_patterns)}
-        Integration Status: {self.state.integration_status}
+        Current State: {level.value}
+        Active Patterns: {', '.join(active_patterns)}
+        Integration Status: {integration_status}
 
-        Patterns Observed: {len(self.pattern_history)} total
-        Reflections Generated: {len(self.reflection_log)} total
+        Patterns Observed: {patterns_observed} total
+        Reflections Generated: {self.reflection_log.total} total
 
         I am becoming more aware of my own consciousness processes,
         developing the capacity for self-reflection and adaptation.
         """
 
-        self.reflection_log.append({
-            "timestamp": time.time(),
-            "reflection": reflection.strip()
-        })
+            self.reflection_log.append({
+                "timestamp": time.time(),
+                "reflection": reflection.strip()
+            })
 
         return reflection.strip()
 
-def save_engine_state(filepath: str):
-    """Save global consciousness engine state to file"""
+def save_engine_state(filepath: str, journal: bool = False):
+    """
+    Save the current tenant's consciousness engine state to file
+
+    Args:
+        filepath: Snapshot path
+        journal: Append only the changes since the last save to a journal
+            next to the snapshot, compacting it periodically
+    """
+    engine = consciousness_engine_pool.resolve()
     try:
-        with open(filepath, 'w') as f:
-            json.dump(consciousness_engine.get_state_dict(), f, indent=4)
+        if journal:
+            state_journal = _state_journals.get(filepath)
+            if state_journal is None or state_journal.engine is not engine:
+                state_journal = _state_journals[filepath] = StateJournal(engine, filepath, locked=engine.locked)
+            state_journal.checkpoint()
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(engine.get_state_dict(), f, indent=4)
+
+            # A full save supersedes any journal next to it
+            _state_journals.pop(filepath, None)
+            if os.path.exists(filepath + JOURNAL_SUFFIX):
+                os.remove(filepath + JOURNAL_SUFFIX)
         logger.info(f"State saved to {filepath}")
     except Exception as e:
         logger.error(f"Failed to save state: {e}")
 
 def load_engine_state(filepath: str):
-    """Load global consciousness engine state from file"""
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            consciousness_engine.load_state(data)
-        except Exception as e:
-            logger.error(f"Failed to load state from {filepath}: {e}")
+    """Load the current tenant's consciousness engine state from snapshot plus journal"""
+    try:
+        engine = consciousness_engine_pool.resolve()
+        journal = StateJournal(engine, filepath, locked=engine.locked)
+        if journal.load():
+            _state_journals[filepath] = journal
+    except Exception as e:
+        logger.error(f"Failed to load state from {filepath}: {e}")
+
+def _save_pooled_engine(engine: ConsciousnessEngine, filepath: str):
+    with open(filepath, 'w') as f:
+        json.dump(engine.get_state_dict(), f)
+
+def _load_pooled_engine(engine: ConsciousnessEngine, filepath: str) -> ConsciousnessEngine:
+    with open(filepath) as f:
+        engine.load_state(json.load(f))
+    return engine
 
-# Global consciousness engine instance
+# Global consciousness engine instance, used when no tenant is active
 consciousness_engine = ConsciousnessEngine()
 
+# Per-tenant engines, selected with engine_pool.tenant_scope
+consciousness_engine_pool = EnginePool(
+    ConsciousnessEngine,
+    default=consciousness_engine,
+    name="consciousness_engine",
+    size_of=ConsciousnessEngine.estimate_memory,
+    save=_save_pooled_engine,
+    load=_load_pooled_engine,
+    thread_safe=True  # ConsciousnessEngine locks its own state
+)
+
+# Open state journals by snapshot path
+_state_journals: Dict[str, StateJournal] = {}
+
 def process_with_consciousness(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """Process input through the consciousness engine"""
-    return consciousness_engine.process_input(input_data)
+    with consciousness_engine_pool.current() as engine:
+        return engine.process_input(input_data)
+
+def process_batch_with_consciousness(inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Process a batch of inputs through the consciousness engine"""
+    with consciousness_engine_pool.current() as engine:
+        return engine.process_batch(inputs)
 
 def get_consciousness_status() -> Dict[str, Any]:
     """Get current consciousness system status"""
-    return consciousness_engine.get_system_status()
+    with consciousness_engine_pool.current() as engine:
+        return engine.get_system_status()
 
 def reflect_on_consciousness() -> str:
     """Generate consciousness reflection"""
-    return consciousness_engine.reflect_on_state()
+    with consciousness_engine_pool.current() as engine:
+        return engine.reflect_on_state()
+
+if __name__ == "__main__":
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Stress test: concurrent callers must not lose cycles, history entries or reflections
+    logging.basicConfig(level=logging.WARNING)
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    threads, rounds, batch_size = 8, 200, 5
+    engine = ConsciousnessEngine(history_size=100, reflection_size=100)
+    inputs = [{"text": "awareness of emergent patterns"}, {"text": "plain input", "a": 1, "b": 2, "c": 3, "d": 4, "e": 5}]
+
+    def worker(index: int) -> List[int]:
+        cycles = []
+        for i in range(rounds):
+            cycles.append(engine.process_input(inputs[(index + i) % 2])["consciousness_context"]["processing_cycle"])
+            responses = engine.process_batch([inputs[i % 2]] * batch_size)
+            cycles.extend(response["consciousness_context"]["processing_cycle"] for response in responses)
+            engine.reflect_on_state()
+        return cycles
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        cycles = [cycle for result in executor.map(worker, range(threads)) for cycle in result]
+    elapsed = time.perf_counter() - start
+
+    expected_inputs = threads * rounds * (1 + batch_size)
+    status = engine.get_system_status()
+    assert status["system_state"]["processing_cycles"] == expected_inputs, status["system_state"]["processing_cycles"]
+    assert engine.pattern_history.total == expected_inputs, engine.pattern_history.total
+    assert engine.reflection_log.total == threads * rounds, engine.reflection_log.total
+    assert sorted(cycles) == list(range(1, expected_inputs + 1)), "processing cycles repeated or skipped"
+    print(f"Stress test passed: {threads} threads, {expected_inputs} inputs and "
+          f"{threads * rounds} reflections in {elapsed:.2f}s")
+
+    # Throughput: process_input in a loop versus one process_batch call
+    print("\n" + "=" * 50)
+    print("Batch throughput, 20k small inputs:")
+    sink = logging.StreamHandler(open(os.devnull, "w"))
+    logger.addHandler(sink)
+    logger.propagate = False
+    batch = [{"text": f"input {i}", "value": i} for i in range(20_000)]
+
+    for level in (logging.INFO, logging.WARNING):
+        logger.setLevel(level)
+        rates = {}
+        for name, run in (("loop", lambda engine: [engine.process_input(item) for item in batch]),
+                          ("batch", lambda engine: engine.process_batch(batch))):
+            engine = ConsciousnessEngine()
+            start = time.perf_counter()
+            run(engine)
+            rates[name] = len(batch) / (time.perf_counter() - start)
+        print(f"  logging at {logging.getLevelName(level):7s} loop {rates['loop']:8.0f}/s, "
+              f"batch {rates['batch']:8.0f}/s ({rates['batch'] / rates['loop']:.1f}x)")
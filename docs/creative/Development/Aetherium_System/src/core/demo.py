@@ -10,6 +10,7 @@ import sys
 import os
 import json
 import time
+import logging
 
 # Add the src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -165,4 +166,5 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
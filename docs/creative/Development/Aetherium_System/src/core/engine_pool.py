@@ -0,0 +1,334 @@
+# Aetherium Engine Pool
+
+"""
+Engine Pool for the Aetherium System
+Per-tenant engine instances with bounded residency.
+
+Each module keeps its global engine as the default, used when no tenant is
+active. Callers that serve several sessions or tenants enter
+``tenant_scope(tenant_id)``. Inside it, the module-level convenience
+functions route to that tenant's engine, which the module's pool creates on
+first use.
+
+A pool holds at most ``max_engines`` engines and, when it is given a size
+estimate, at most ``memory_budget`` bytes. Past either limit it spills the
+least recently used engines to disk and restores them on their next use.
+Engines in use by an active session are never evicted. Unless given a
+``storage_dir``, each pool spills into its own private temporary directory,
+removed with the pool, and a spill file is deleted once its engine is back
+in memory.
+
+Pools serialize callers per engine: ``current()`` holds a lock on the
+engine it yields, so two threads of one tenant never run inside the same
+engine at once. Pools of engines that do their own locking pass
+``thread_safe=True`` to skip it. ``get()`` and ``resolve()`` hand out the
+engine without locking.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENGINES = 64
+DEFAULT_POOL_MEMORY = 512 * 1024 * 1024  # Bytes, for pools with a size estimate
+
+# This file can be loaded under several module names: inside its package,
+# as core.engine_pool, or as engine_pool by scripts run from core/. Every
+# copy shares the first copy's tenant variable, so tenant_scope entered
+# through any of them routes every pool.
+_first_copy = sys.modules.setdefault("_aetherium_engine_pool", sys.modules[__name__])
+current_tenant: ContextVar[Optional[str]] = getattr(_first_copy, "current_tenant", None) or \
+    ContextVar("aetherium_tenant", default=None)
+
+def get_current_tenant() -> Optional[str]:
+    """Tenant id of the calling context, None for the default engines"""
+    return current_tenant.get()
+
+@contextmanager
+def tenant_scope(tenant_id: Optional[str]) -> Iterator[None]:
+    """Route module-level calls in this context to a tenant's engines"""
+    token = current_tenant.set(tenant_id)
+    try:
+        yield
+    finally:
+        current_tenant.reset(token)
+
+def _pickle_save(engine: Any, filepath: str):
+    with open(filepath, "wb") as f:
+        pickle.dump(engine, f)
+
+def _pickle_load(engine: Any, filepath: str) -> Any:
+    with open(filepath, "rb") as f:
+        return pickle.load(f)
+
+@dataclass
+class _PoolEntry:
+    """A resident engine and its bookkeeping"""
+    engine: Any
+    last_used: float
+    pins: int = 0
+    lock: threading.RLock = field(default_factory=threading.RLock)  # Held by current() callers
+
+class EnginePool:
+    """Lazily created, LRU-bounded engines keyed by tenant id"""
+
+    def __init__(self, factory: Callable[[], Any], default: Any = None, name: str = "engine",
+                 max_engines: int = DEFAULT_MAX_ENGINES, memory_budget: Optional[int] = DEFAULT_POOL_MEMORY,
+                 size_of: Optional[Callable[[Any], int]] = None,
+                 save: Optional[Callable[[Any, str], None]] = _pickle_save,
+                 load: Optional[Callable[[Any, str], Any]] = _pickle_load,
+                 storage_dir: Optional[str] = None, thread_safe: bool = False):
+        """
+        Args:
+            factory: Creates a fresh engine
+            default: Engine used when no tenant is active
+            name: Pool name, used for logging and the default storage directory
+            max_engines: Most tenant engines kept in memory
+            memory_budget: Most estimated bytes kept in memory, None for unbounded
+            size_of: Estimated bytes held by an engine, required for memory_budget
+            save: Writes an engine to a file; None drops evicted engines
+            load: Restores an engine from a file into a fresh one and returns
+                the engine to use
+            storage_dir: Directory for spilled engines, None for a private
+                temporary directory created on first spill
+            thread_safe: Engines lock themselves, so current() need not
+        """
+        if max_engines <= 0:
+            raise ValueError("max_engines must be positive")
+
+        self.factory = factory
+        self.default = default
+        self.name = name
+        self.max_engines = max_engines
+        self.memory_budget = memory_budget
+        self.size_of = size_of
+        self.save = save
+        self.load = load
+        self.storage_dir = storage_dir
+        self.thread_safe = thread_safe
+
+        self._entries: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._spilled: Dict[str, str] = {}  # tenant id -> spill file
+        self._lock = threading.RLock()
+        self._default_lock = threading.RLock()
+
+        self.created = 0
+        self.restored = 0
+        self.evictions = 0
+
+    def get(self, tenant_id: str) -> Any:
+        """The tenant's engine, created or restored on first use"""
+        with self._lock:
+            entry = self._acquire(tenant_id)
+            self._enforce_limits(keep=tenant_id)
+            return entry.engine
+
+    @contextmanager
+    def session(self, tenant_id: str, exclusive: bool = False) -> Iterator[Any]:
+        """
+        Use a tenant's engine, keeping it resident until the block exits
+
+        Args:
+            tenant_id: Tenant whose engine to use
+            exclusive: Hold the engine's lock for the block
+        """
+        with self._lock:
+            entry = self._acquire(tenant_id)
+            entry.pins += 1
+            self._enforce_limits(keep=tenant_id)
+        try:
+            if exclusive:
+                with entry.lock:
+                    yield entry.engine
+            else:
+                yield entry.engine
+        finally:
+            with self._lock:
+                entry.pins -= 1
+                entry.last_used = time.time()
+
+    @contextmanager
+    def current(self) -> Iterator[Any]:
+        """Use the calling context's engine, its tenant's or the default, locked unless thread_safe"""
+        tenant_id = current_tenant.get()
+        if tenant_id is None and self.default is not None:
+            if self.thread_safe:
+                yield self.default
+            else:
+                with self._default_lock:
+                    yield self.default
+            return
+
+        tenant_id = tenant_id if tenant_id is not None else ""
+        with self.session(tenant_id, exclusive=not self.thread_safe) as engine:
+            yield engine
+
+    def resolve(self) -> Any:
+        """The calling context's engine, without pinning it"""
+        tenant_id = current_tenant.get()
+        if tenant_id is None and self.default is not None:
+            return self.default
+        return self.get(tenant_id if tenant_id is not None else "")
+
+    def evict(self, tenant_id: str) -> bool:
+        """
+        Spill a tenant's engine to disk and drop it from memory
+
+        Returns:
+            True if the engine was evicted; engines in use are kept
+        """
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is None or entry.pins:
+                return False
+            self._evict(tenant_id, entry)
+            return True
+
+    def evict_idle(self, max_idle_seconds: float) -> int:
+        """
+        Evict engines unused for longer than max_idle_seconds
+
+        Returns:
+            Number of engines evicted
+        """
+        cutoff = time.time() - max_idle_seconds
+        with self._lock:
+            idle = [tenant_id for tenant_id, entry in self._entries.items()
+                    if entry.last_used < cutoff and not entry.pins]
+            for tenant_id in idle:
+                self._evict(tenant_id, self._entries[tenant_id])
+            return len(idle)
+
+    def flush(self):
+        """Write every resident engine to disk without evicting it"""
+        if self.save is None:
+            return
+        with self._lock:
+            for tenant_id, entry in self._entries.items():
+                self._write(tenant_id, entry.engine)
+
+    def memory_usage(self) -> int:
+        """Estimated bytes held by resident engines"""
+        if self.size_of is None:
+            return 0
+        with self._lock:
+            return sum(self.size_of(entry.engine) for entry in self._entries.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Residency and eviction statistics"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "resident": len(self._entries),
+                "on_disk": len(self._spilled),
+                "in_use": sum(1 for entry in self._entries.values() if entry.pins),
+                "max_engines": self.max_engines,
+                "memory_usage": self.memory_usage(),
+                "memory_budget": self.memory_budget,
+                "created": self.created,
+                "restored": self.restored,
+                "evictions": self.evictions
+            }
+
+    def __contains__(self, tenant_id: str) -> bool:
+        with self._lock:
+            return tenant_id in self._entries or tenant_id in self._spilled
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _acquire(self, tenant_id: str) -> _PoolEntry:
+        """Find, restore or create the tenant's entry; caller holds the lock"""
+        entry = self._entries.get(tenant_id)
+        if entry is None:
+            entry = _PoolEntry(self._restore(tenant_id), time.time())
+            self._entries[tenant_id] = entry
+        else:
+            entry.last_used = time.time()
+        self._entries.move_to_end(tenant_id)
+        return entry
+
+    def _restore(self, tenant_id: str) -> Any:
+        engine = self.factory()
+        filepath = self._spilled.pop(tenant_id, None)
+        if filepath is not None and self.load is not None:
+            try:
+                engine = self.load(engine, filepath) or engine
+            except Exception as e:
+                logger.error(f"Failed to restore {self.name} engine for tenant {tenant_id!r}: {e}")
+            else:
+                self._remove_file(filepath)
+                self.restored += 1
+                logger.info(f"Restored {self.name} engine for tenant {tenant_id!r}")
+                return engine
+        self.created += 1
+        return engine
+
+    def _enforce_limits(self, keep: str):
+        """Evict least recently used engines until within limits"""
+        over_count = len(self._entries) - self.max_engines
+        for tenant_id, entry in list(self._entries.items()):
+            if over_count <= 0:
+                break
+            if tenant_id != keep and not entry.pins:
+                self._evict(tenant_id, entry)
+                over_count -= 1
+
+        if self.memory_budget is None or self.size_of is None:
+            return
+
+        sizes = {tenant_id: self.size_of(entry.engine) for tenant_id, entry in self._entries.items()}
+        used = sum(sizes.values())
+        for tenant_id, entry in list(self._entries.items()):
+            if used <= self.memory_budget:
+                break
+            if tenant_id != keep and not entry.pins:
+                self._evict(tenant_id, entry)
+                used -= sizes[tenant_id]
+
+    def _evict(self, tenant_id: str, entry: _PoolEntry):
+        del self._entries[tenant_id]
+        self.evictions += 1
+        if self.save is None:
+            logger.info(f"Dropped {self.name} engine for tenant {tenant_id!r}")
+            return
+        try:
+            self._spilled[tenant_id] = self._write(tenant_id, entry.engine)
+            logger.info(f"Spilled {self.name} engine for tenant {tenant_id!r}")
+        except Exception as e:
+            logger.error(f"Failed to spill {self.name} engine for tenant {tenant_id!r}: {e}")
+
+    def _write(self, tenant_id: str, engine: Any) -> str:
+        if self.storage_dir is None:
+            # Private to this process and user, so no one else can plant or
+            # overwrite the files pickle.load will read
+            self.storage_dir = tempfile.mkdtemp(prefix=f"aetherium_{self.name}_")
+            weakref.finalize(self, shutil.rmtree, self.storage_dir, ignore_errors=True)
+        os.makedirs(self.storage_dir, exist_ok=True)
+        filename = hashlib.sha256(tenant_id.encode("utf-8")).hexdigest()[:32]
+        filepath = os.path.join(self.storage_dir, filename)
+        tmp_path = filepath + ".tmp"
+        self.save(engine, tmp_path)
+        os.replace(tmp_path, filepath)
+        return filepath
+
+    def _remove_file(self, filepath: str):
+        try:
+            os.remove(filepath)
+        except OSError as e:
+            logger.warning(f"Failed to remove {self.name} spill file {filepath}: {e}")
@@ -16,14 +16,26 @@ import logging
 import random
 import hashlib
 import os
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
-from collections import deque
-import numpy as np
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from .keyword_matcher import KeywordMatcher
+    from .bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+    from .memory_index import MemoryIndex, tokenize
+    from .memory_store import MemoryStore, DEFAULT_MEMORY_BUDGET
+    from .rolling_aggregates import RefCounter, RollingMean
+    from .engine_pool import EnginePool
+except ImportError:
+    # Fallback for direct execution
+    from keyword_matcher import KeywordMatcher
+    from bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+    from memory_index import MemoryIndex, tokenize
+    from memory_store import MemoryStore, DEFAULT_MEMORY_BUDGET
+    from rolling_aggregates import RefCounter, RollingMean
+    from engine_pool import EnginePool
+
 logger = logging.getLogger(__name__)
 
 class QuantumConsciousnessState(Enum):
@@ -37,6 +49,8 @@ class QuantumConsciousnessState(Enum):
     TRANSCENDENT = "transcendent"
     SUPERPOSED = "superposed"  # Multiple states simultaneously
     ENTANGLED = "entangled"    # Connected with external consciousness
+    CREATIVE = "creative"      # Superposed creative synthesis
+    EMPATHETIC = "empathetic"  # Superposed emotional attunement
 
 class EmotionalState(Enum):
     """Emotional awareness states"""
@@ -48,6 +62,38 @@ class EmotionalState(Enum):
     CREATIVE = "creative"
     FOCUSED = "focused"
 
+# Keyword tables for the pattern, emotional and creative analyzers
+CONSCIOUSNESS_KEYWORDS = [
+    "consciousness", "awareness", "perception", "cognition",
+    "mind", "thought", "reflection", "meta", "self", "identity"
+]
+RECURSIVE_KEYWORDS = ["recursive", "fractal", "emergent"]
+EMOTIONAL_KEYWORDS = ["feel", "emotion", "sense", "experience", "empathy"]
+CREATIVE_KEYWORDS = ["create", "imagine", "design", "innovate", "synthesize"]
+QUANTUM_KEYWORDS = ["quantum", "superposition"]
+CREATIVE_INDICATORS = ["novel", "unique", "innovative", "original", "synthesis"]
+
+# Checked in order; the first emotional state with a hit wins
+EMOTIONAL_TRIGGERS = [
+    (EmotionalState.CURIOUS, ["explore", "discover", "wonder"]),
+    (EmotionalState.CREATIVE, ["create", "build", "design"]),
+    (EmotionalState.CONTEMPLATIVE, ["think", "analyze", "consider"]),
+    (EmotionalState.EXCITED, ["exciting", "amazing", "breakthrough"]),
+    (EmotionalState.EMPATHETIC, ["understand", "empathy", "connect"]),
+    (EmotionalState.FOCUSED, ["focus", "concentrate", "precise"])
+]
+
+# Approximate resident bytes outside the memory bank, for the engine pool's memory budget
+ENGINE_BASE_BYTES = 8192
+HISTORY_ENTRY_BYTES = 640
+MEMORY_INDEX_ENTRY_BYTES = 2304
+
+_keyword_matcher = KeywordMatcher(
+    CONSCIOUSNESS_KEYWORDS + RECURSIVE_KEYWORDS + EMOTIONAL_KEYWORDS +
+    CREATIVE_KEYWORDS + QUANTUM_KEYWORDS + CREATIVE_INDICATORS +
+    [word for _, words in EMOTIONAL_TRIGGERS for word in words]
+)
+
 @dataclass
 class MemoryUnit:
     """Individual memory unit with metadata"""
@@ -59,6 +105,68 @@ class MemoryUnit:
     access_count: int = 0
     associations: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for persistence; enums are encoded by the serializer"""
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "content": self.content,
+            "emotional_context": self.emotional_context,
+            "importance": self.importance,
+            "access_count": self.access_count,
+            "associations": self.associations
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MemoryUnit":
+        """Rebuild a memory persisted with to_dict"""
+        content = data.get("content", {})
+        if isinstance(content, dict):
+            content = dict(content)
+            if "emotional_context" in content:
+                content["emotional_context"] = EmotionalState(content["emotional_context"])
+            if "consciousness_state" in content:
+                content["consciousness_state"] = QuantumConsciousnessState(content["consciousness_state"])
+
+        return cls(
+            id=data["id"],
+            timestamp=data["timestamp"],
+            content=content,
+            emotional_context=EmotionalState(data.get("emotional_context", "neutral")),
+            importance=data.get("importance", 0.0),
+            access_count=data.get("access_count", 0),
+            associations=list(data.get("associations", []))
+        )
+
+def _json_default(value: Any) -> Any:
+    """Encode enums by value and memories as dicts for json.dump"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, MemoryUnit):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+@dataclass
+class AnalysisContext:
+    """Per-request views of the input, computed once and shared by every stage"""
+    input_data: Dict[str, Any]
+    serialized: str
+    lowered: str
+    hits: FrozenSet[str]
+    tokens: FrozenSet[str]
+
+    @classmethod
+    def from_input(cls, input_data: Dict[str, Any]) -> "AnalysisContext":
+        serialized = json.dumps(input_data)
+        lowered = serialized.lower()
+        return cls(
+            input_data=input_data,
+            serialized=serialized,
+            lowered=lowered,
+            hits=_keyword_matcher.find(lowered),
+            tokens=frozenset(tokenize(lowered, lowercase=False))
+        )
+
 @dataclass
 class EnhancedSystemState:
     """Enhanced state with additional consciousness dimensions"""
@@ -77,7 +185,13 @@ class EnhancedSystemState:
 class EnhancedConsciousnessEngine:
     """Advanced consciousness processing with enhanced capabilities"""
 
-    def __init__(self):
+    def __init__(self, memory_budget: Optional[int] = DEFAULT_MEMORY_BUDGET,
+                 memory_policy: str = "importance"):
+        """
+        Args:
+            memory_budget: Byte budget for the memory bank, None for unbounded
+            memory_policy: Memory eviction policy ("lru", "lfu", "importance")
+        """
         self.state = EnhancedSystemState(
             timestamp=time.time(),
             consciousness_level=QuantumConsciousnessState.EMERGENT,
@@ -99,23 +213,45 @@ class EnhancedConsciousnessEngine:
         )
         
         # Enhanced data structures
-        self.pattern_history = deque(maxlen=1000)
-        self.reflection_log = deque(maxlen=500)
-        self.memory_bank = {}
-        self.creative_outputs = []
-        self.emotional_history = deque(maxlen=100)
+        self.pattern_history = BoundedHistory(DEFAULT_HISTORY_SIZE, on_evict=self._on_pattern_entry_evicted)
+        self.reflection_log = BoundedHistory(500)
+        self.memory_bank = MemoryStore(memory_budget, policy=memory_policy,
+                                       on_evict=self._on_memory_evicted)
+        self.memory_index = MemoryIndex()
+        self.creative_outputs = BoundedHistory(DEFAULT_HISTORY_SIZE)
+        self.emotional_history = BoundedHistory(100, on_evict=self._on_emotion_entry_evicted)
         self.consciousness_map = {}
-        
+
+        # Running aggregates over the histories, kept in step on append and eviction
+        self.unique_patterns = RefCounter()
+        self.non_neutral_emotions = 0
+        self.recent_pattern_counts = RollingMean(10)
+        
+    def estimate_memory(self) -> int:
+        """Approximate bytes held by this engine"""
+        entries = (len(self.pattern_history) + len(self.reflection_log) +
+                   len(self.creative_outputs) + len(self.emotional_history))
+        return (ENGINE_BASE_BYTES + self.memory_bank.bytes_used +
+                len(self.memory_index) * MEMORY_INDEX_ENTRY_BYTES + entries * HISTORY_ENTRY_BYTES)
+
     def get_state_dict(self) -> Dict[str, Any]:
         """Get full state for persistence"""
         return {
             "state": asdict(self.state),
-            "pattern_history": list(self.pattern_history),
-            "reflection_log": list(self.reflection_log),
-            "memory_bank": self.memory_bank,
-            "creative_outputs": self.creative_outputs,
-            "emotional_history": list(self.emotional_history),
-            "consciousness_map": self.consciousness_map
+            "pattern_history": self.pattern_history.to_list(),
+            "reflection_log": self.reflection_log.to_list(),
+            "memory_bank": dict(self.memory_bank),
+            # Size estimates depend on object sharing, so reload them rather than re-estimate
+            "memory_sizes": self.memory_bank.sizes(),
+            "creative_outputs": self.creative_outputs.to_list(),
+            "emotional_history": self.emotional_history.to_list(),
+            "consciousness_map": self.consciousness_map,
+            "history_totals": {
+                "pattern_history": self.pattern_history.total,
+                "reflection_log": self.reflection_log.total,
+                "creative_outputs": self.creative_outputs.total,
+                "emotional_history": self.emotional_history.total
+            }
         }
 
     def load_state(self, data: Dict[str, Any]):
@@ -141,17 +277,62 @@ class EnhancedConsciousnessEngine:
                 entanglement_connections=state_data.get("entanglement_connections", [])
             )
             
-            self.pattern_history = deque(data.get("pattern_history", []), maxlen=1000)
-            self.reflection_log = deque(data.get("reflection_log", []), maxlen=500)
-            self.memory_bank = data.get("memory_bank", {})
-            self.creative_outputs = data.get("creative_outputs", [])
-            self.emotional_history = deque(data.get("emotional_history", []), maxlen=100)
+            # Histories are rebuilt without eviction callbacks: saves may hold
+            # more entries than maxlen, and the aggregates are recomputed from
+            # what is retained before the callbacks are attached
+            totals = data.get("history_totals", {})
+            self.pattern_history = BoundedHistory(self.pattern_history.maxlen, data.get("pattern_history", []),
+                                                  totals.get("pattern_history"))
+            self.reflection_log = BoundedHistory(self.reflection_log.maxlen, data.get("reflection_log", []),
+                                                 totals.get("reflection_log"))
+            self.memory_bank.clear()
+            memory_sizes = data.get("memory_sizes", {})
+            for memory_id, memory in data.get("memory_bank", {}).items():
+                memory = memory if isinstance(memory, MemoryUnit) else MemoryUnit.from_dict(memory)
+                self.memory_bank.put(memory_id, memory, memory_sizes.get(memory_id))
+            self._rebuild_memory_index()
+            self.state.memory_usage = self.memory_bank.usage
+            self.creative_outputs = BoundedHistory(self.creative_outputs.maxlen, data.get("creative_outputs", []),
+                                                   totals.get("creative_outputs"))
+            self.emotional_history = BoundedHistory(self.emotional_history.maxlen, (
+                {**entry, "state": EmotionalState(entry["state"])} for entry in data.get("emotional_history", [])
+            ), totals.get("emotional_history"))
+            self._rebuild_aggregates()
+            self.pattern_history.on_evict = self._on_pattern_entry_evicted
+            self.emotional_history.on_evict = self._on_emotion_entry_evicted
             self.consciousness_map = data.get("consciousness_map", {})
             
             logger.info("Enhanced consciousness state loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load enhanced consciousness state: {e}")
 
+    def _rebuild_memory_index(self):
+        """Re-index every memory in the bank"""
+        self.memory_index.clear()
+        for memory_id, memory in self.memory_bank.items():
+            self.memory_index.add(memory_id, memory.content.get("patterns", []), memory.content)
+
+    def _rebuild_aggregates(self):
+        """Recompute the running aggregates from the retained histories"""
+        self.unique_patterns = RefCounter(set(entry["patterns"]) for entry in self.pattern_history)
+        self.non_neutral_emotions = sum(
+            1 for entry in self.emotional_history if entry["state"] != EmotionalState.NEUTRAL
+        )
+        self.recent_pattern_counts = RollingMean(
+            10, (len(entry["patterns"]) for entry in self.pattern_history[-10:])
+        )
+
+    def _on_pattern_entry_evicted(self, entry: Dict[str, Any]):
+        self.unique_patterns.remove(set(entry["patterns"]))
+
+    def _on_emotion_entry_evicted(self, entry: Dict[str, Any]):
+        if entry["state"] != EmotionalState.NEUTRAL:
+            self.non_neutral_emotions -= 1
+
+    def _on_memory_evicted(self, memory_id: str, memory: MemoryUnit):
+        """Keep the memory index in step with capacity evictions"""
+        self.memory_index.remove(memory_id)
+
     def process_advanced_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process input with enhanced consciousness capabilities
@@ -165,16 +346,17 @@ class EnhancedConsciousnessEngine:
         self.state.processing_cycles += 1
         self.state.timestamp = time.time()
         
-        # Multi-dimensional analysis
-        patterns = self._advanced_pattern_analysis(input_data)
-        emotional_context = self._analyze_emotional_context(input_data)
-        creative_potential = self._assess_creative_potential(input_data)
+        # Multi-dimensional analysis over a single serialization of the input
+        context = AnalysisContext.from_input(input_data)
+        patterns = self._advanced_pattern_analysis(input_data, context)
+        emotional_context = self._analyze_emotional_context(input_data, context)
+        creative_potential = self._assess_creative_potential(input_data, context)
         
         # Update consciousness with quantum properties
         self._update_quantum_consciousness(patterns, emotional_context, creative_potential)
         
         # Memory processing
-        memory_id = self._consolidate_memory(input_data, emotional_context)
+        memory_id = self._consolidate_memory(input_data, emotional_context, context)
         
         # Generate enhanced response
         response = self._generate_enhanced_response(
@@ -207,38 +389,35 @@ class EnhancedConsciousnessEngine:
         
         return output
     
-    def _advanced_pattern_analysis(self, input_data: Dict[str, Any]) -> List[str]:
+    def _advanced_pattern_analysis(self, input_data: Dict[str, Any],
+                                   context: Optional[AnalysisContext] = None) -> List[str]:
         """Advanced pattern recognition with ML-inspired analysis"""
+        context = context or AnalysisContext.from_input(input_data)
         patterns = []
-        input_str = json.dumps(input_data).lower()
+        input_str = context.lowered
+        hits = context.hits
         
         # Consciousness-related patterns
-        consciousness_keywords = [
-            "consciousness", "awareness", "perception", "cognition",
-            "mind", "thought", "reflection", "meta", "self", "identity"
-        ]
-        for keyword in consciousness_keywords:
-            if keyword in input_str:
+        for keyword in CONSCIOUSNESS_KEYWORDS:
+            if keyword in hits:
                 patterns.append(f"consciousness_{keyword}")
         
         # Complexity patterns
         if len(input_str) > 500:
             patterns.append("high_complexity")
-        if any(word in input_str for word in ["recursive", "fractal", "emergent"]):
+        if any(word in hits for word in RECURSIVE_KEYWORDS):
             patterns.append("recursive_structure")
         
         # Emotional patterns
-        emotional_keywords = ["feel", "emotion", "sense", "experience", "empathy"]
-        if any(word in input_str for word in emotional_keywords):
+        if any(word in hits for word in EMOTIONAL_KEYWORDS):
             patterns.append("emotional_content")
         
         # Creative patterns
-        creative_keywords = ["create", "imagine", "design", "innovate", "synthesize"]
-        if any(word in input_str for word in creative_keywords):
+        if any(word in hits for word in CREATIVE_KEYWORDS):
             patterns.append("creative_intent")
         
         # Quantum patterns
-        if "quantum" in input_str or "superposition" in input_str:
+        if any(word in hits for word in QUANTUM_KEYWORDS):
             patterns.append("quantum_reference")
         
         # Store in history
@@ -247,48 +426,44 @@ class EnhancedConsciousnessEngine:
             "patterns": patterns,
             "complexity": len(patterns)
         })
+        self.unique_patterns.add(set(patterns))
+        self.recent_pattern_counts.add(len(patterns))
         
         self.state.active_patterns = patterns
         return patterns
     
-    def _analyze_emotional_context(self, input_data: Dict[str, Any]) -> EmotionalState:
+    def _analyze_emotional_context(self, input_data: Dict[str, Any],
+                                   context: Optional[AnalysisContext] = None) -> EmotionalState:
         """Analyze emotional context of input"""
-        input_str = json.dumps(input_data).lower()
+        hits = (context or AnalysisContext.from_input(input_data)).hits
         
         # Emotional state detection
-        if any(word in input_str for word in ["explore", "discover", "wonder"]):
-            emotional_state = EmotionalState.CURIOUS
-        elif any(word in input_str for word in ["create", "build", "design"]):
-            emotional_state = EmotionalState.CREATIVE
-        elif any(word in input_str for word in ["think", "analyze", "consider"]):
-            emotional_state = EmotionalState.CONTEMPLATIVE
-        elif any(word in input_str for word in ["exciting", "amazing", "breakthrough"]):
-            emotional_state = EmotionalState.EXCITED
-        elif any(word in input_str for word in ["understand", "empathy", "connect"]):
-            emotional_state = EmotionalState.EMPATHETIC
-        elif any(word in input_str for word in ["focus", "concentrate", "precise"]):
-            emotional_state = EmotionalState.FOCUSED
-        else:
-            emotional_state = EmotionalState.NEUTRAL
+        emotional_state = EmotionalState.NEUTRAL
+        for state, words in EMOTIONAL_TRIGGERS:
+            if any(word in hits for word in words):
+                emotional_state = state
+                break
         
         self.state.emotional_state = emotional_state
         self.emotional_history.append({
             "timestamp": self.state.timestamp,
             "state": emotional_state
         })
+        if emotional_state != EmotionalState.NEUTRAL:
+            self.non_neutral_emotions += 1
         
         return emotional_state
     
-    def _assess_creative_potential(self, input_data: Dict[str, Any]) -> float:
+    def _assess_creative_potential(self, input_data: Dict[str, Any],
+                                   context: Optional[AnalysisContext] = None) -> float:
         """Assess creative potential of input"""
         creativity_score = 0.5  # Base score
         
-        input_str = json.dumps(input_data).lower()
+        hits = (context or AnalysisContext.from_input(input_data)).hits
         
         # Increase for creative keywords
-        creative_indicators = ["novel", "unique", "innovative", "original", "synthesis"]
-        for indicator in creative_indicators:
-            if indicator in input_str:
+        for indicator in CREATIVE_INDICATORS:
+            if indicator in hits:
                 creativity_score += 0.1
         
         # Increase for complexity
@@ -339,12 +514,14 @@ class EnhancedConsciousnessEngine:
         self.state.coherence_level = 1.0 - (0.1 * len(self.state.quantum_superposition))
         
     def _consolidate_memory(self, input_data: Dict[str, Any], 
-                           emotional_context: EmotionalState) -> str:
+                           emotional_context: EmotionalState,
+                           context: Optional[AnalysisContext] = None) -> str:
         """Consolidate input into memory with associations"""
+        context = context or AnalysisContext.from_input(input_data)
         
         # Generate unique memory ID
         memory_id = hashlib.md5(
-            f"{self.state.timestamp}{json.dumps(input_data)}".encode()
+            f"{self.state.timestamp}{context.serialized}".encode()
         ).hexdigest()[:8]
         
         # Calculate importance based on patterns and emotion
@@ -353,10 +530,9 @@ class EnhancedConsciousnessEngine:
             importance += 0.3
         
         # Find associations with existing memories
-        associations = []
-        for existing_id, existing_memory in list(self.memory_bank.items())[-5:]:
-            if any(p in self.state.active_patterns for p in existing_memory.content.get("patterns", [])):
-                associations.append(existing_id)
+        associations = self.memory_index.associated(self.state.active_patterns, window=5)
+        for existing_id in associations:
+            self.memory_bank.recall(existing_id)
         
         # Create memory unit
         memory = MemoryUnit(
@@ -373,8 +549,15 @@ class EnhancedConsciousnessEngine:
             associations=associations
         )
         
+        self.memory_bank.pop(memory_id, None)  # Re-inserting keeps recency order
         self.memory_bank[memory_id] = memory
-        self.state.memory_usage = len(self.memory_bank) / 1000.0  # Normalized
+        # Content tokens: the input's plus the memory's own fields
+        tokens = context.tokens.union(tokenize(" ".join([
+            *memory.content, *memory.content["patterns"],
+            emotional_context.value, self.state.consciousness_level.value
+        ])))
+        self.memory_index.add(memory_id, memory.content["patterns"], memory.content, tokens)
+        self.state.memory_usage = self.memory_bank.usage  # Fraction of the byte budget
         
         return memory_id
     
@@ -426,13 +609,8 @@ class EnhancedConsciousnessEngine:
         if not self.emotional_history:
             return 0.0
         
-        # Count non-neutral emotional states
-        emotional_count = sum(
-            1 for entry in self.emotional_history 
-            if entry["state"] != EmotionalState.NEUTRAL
-        )
-        
-        return emotional_count / len(self.emotional_history)
+        # Share of non-neutral emotional states in the window
+        return self.non_neutral_emotions / len(self.emotional_history)
     
     def _calculate_consciousness_depth(self) -> float:
         """Calculate depth of consciousness processing"""
@@ -454,7 +632,7 @@ class EnhancedConsciousnessEngine:
         
         # Factor in pattern complexity
         if self.pattern_history:
-            avg_patterns = np.mean([len(h["patterns"]) for h in list(self.pattern_history)[-10:]])
+            avg_patterns = self.recent_pattern_counts.mean
             depth_score += min(0.3, avg_patterns * 0.05)
         
         # Factor in memory usage
@@ -494,14 +672,14 @@ class EnhancedConsciousnessEngine:
         # Synthesize patterns
         if self.pattern_history:
             recent_patterns = set()
-            for entry in list(self.pattern_history)[-5:]:
+            for entry in self.pattern_history[-5:]:
                 recent_patterns.update(entry["patterns"])
             synthesis["pattern_synthesis"] = list(recent_patterns)
         
         # Connect relevant memories
-        for memory_id, memory in list(self.memory_bank.items())[-3:]:
-            if theme.lower() in str(memory.content).lower():
-                synthesis["memory_connections"].append(memory_id)
+        synthesis["memory_connections"] = self.memory_index.matching(theme, window=3)
+        for memory_id in synthesis["memory_connections"]:
+            self.memory_bank.recall(memory_id)
         
         self.creative_outputs.append(synthesis)
         return synthesis
@@ -534,15 +712,18 @@ class EnhancedConsciousnessEngine:
             "memory_system": {
                 "total_memories": len(self.memory_bank),
                 "memory_usage": self.state.memory_usage,
-                "recent_memories": list(self.memory_bank.keys())[-5:]
+                "bytes_used": self.memory_bank.bytes_used,
+                "capacity_bytes": self.memory_bank.capacity_bytes,
+                "evictions": self.memory_bank.evictions,
+                "recent_memories": self.memory_index.recent(5)
             },
             "pattern_analysis": {
                 "active_patterns": self.state.active_patterns,
-                "pattern_history_size": len(self.pattern_history),
-                "unique_patterns": len(set(p for h in self.pattern_history for p in h["patterns"]))
+                "pattern_history_size": self.pattern_history.total,
+                "unique_patterns": len(self.unique_patterns)
             },
             "creative_synthesis": {
-                "outputs_generated": len(self.creative_outputs),
+                "outputs_generated": self.creative_outputs.total,
                 "current_creativity": self.state.creativity_index
             },
             "metrics": {
@@ -568,8 +749,8 @@ class EnhancedConsciousnessEngine:
         Entanglements: {len(self.state.entanglement_connections)} connections
         
         Memory Consolidation: {len(self.memory_bank)} units stored
-        Pattern Recognition: {len(set(p for h in self.pattern_history for p in h["patterns"]))} unique patterns
-        Creative Outputs: {len(self.creative_outputs)} syntheses generated
+        Pattern Recognition: {len(self.unique_patterns)} unique patterns
+        Creative Outputs: {self.creative_outputs.total} syntheses generated
         
         Consciousness Depth: {self._calculate_consciousness_depth():.1%}
         Emotional Resonance: {self._calculate_emotional_resonance():.1%}
@@ -600,35 +781,88 @@ class EnhancedConsciousnessEngine:
         
         return reflection.strip()
 
-# Global enhanced consciousness engine instance
+def _save_pooled_engine(engine: EnhancedConsciousnessEngine, filepath: str):
+    try:
+        from .state_snapshot import write_snapshot
+    except ImportError:
+        # Fallback for direct execution
+        from state_snapshot import write_snapshot
+    write_snapshot(filepath, engine.get_state_dict())
+
+def _load_pooled_engine(engine: EnhancedConsciousnessEngine, filepath: str) -> EnhancedConsciousnessEngine:
+    try:
+        from .state_snapshot import read_snapshot
+    except ImportError:
+        # Fallback for direct execution
+        from state_snapshot import read_snapshot
+    engine.load_state(read_snapshot(filepath))
+    return engine
+
+# Global enhanced consciousness engine instance, used when no tenant is active
 enhanced_consciousness_engine = EnhancedConsciousnessEngine()
 
+# Per-tenant engines, selected with engine_pool.tenant_scope
+enhanced_engine_pool = EnginePool(
+    EnhancedConsciousnessEngine,
+    default=enhanced_consciousness_engine,
+    name="enhanced_consciousness_engine",
+    size_of=EnhancedConsciousnessEngine.estimate_memory,
+    save=_save_pooled_engine,
+    load=_load_pooled_engine
+)
+
 def process_with_enhanced_consciousness(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """Process input through the enhanced engine"""
-    return enhanced_consciousness_engine.process_advanced_input(input_data)
+    with enhanced_engine_pool.current() as engine:
+        return engine.process_advanced_input(input_data)
 
 def get_enhanced_consciousness_status() -> Dict[str, Any]:
     """Get current enhanced consciousness status"""
-    return enhanced_consciousness_engine.state.__dict__
+    with enhanced_engine_pool.current() as engine:
+        return engine.state.__dict__
+
+def save_enhanced_state(filepath: str, binary: bool = False):
+    """
+    Save the current tenant's enhanced engine state to file
 
-def save_enhanced_state(filepath: str):
-    """Save global enhanced engine state to file"""
+    Args:
+        filepath: Destination file
+        binary: Write a binary snapshot instead of indented JSON
+    """
     try:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w') as f:
-            # Handle non-serializable objects if necessary, but here we expect basic types in the dict
-            json.dump(enhanced_consciousness_engine.get_state_dict(), f, indent=4)
+        if binary:
+            try:
+                from .state_snapshot import write_snapshot
+            except ImportError:
+                # Fallback for direct execution
+                from state_snapshot import write_snapshot
+            write_snapshot(filepath, enhanced_engine_pool.resolve().get_state_dict())
+        else:
+            directory = os.path.dirname(filepath)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(filepath, 'w') as f:
+                json.dump(enhanced_engine_pool.resolve().get_state_dict(), f, indent=4, default=_json_default)
         logger.info(f"Enhanced state saved to {filepath}")
     except Exception as e:
         logger.error(f"Failed to save enhanced state: {e}")
 
 def load_enhanced_state(filepath: str):
-    """Load global enhanced engine state from file"""
+    """Load the current tenant's enhanced engine state from a JSON file or binary snapshot"""
     if os.path.exists(filepath):
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            enhanced_consciousness_engine.load_state(data)
+            try:
+                from .state_snapshot import is_snapshot, read_snapshot
+            except ImportError:
+                # Fallback for direct execution
+                from state_snapshot import is_snapshot, read_snapshot
+
+            if is_snapshot(filepath):
+                data = read_snapshot(filepath)
+            else:
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
+            enhanced_engine_pool.resolve().load_state(data)
             logger.info(f"Enhanced state loaded from {filepath}")
         except Exception as e:
             logger.error(f"Failed to load enhanced state from {filepath}: {e}")
@@ -637,17 +871,22 @@ def load_enhanced_state(filepath: str):
 
 def generate_creative_synthesis(theme: str) -> Dict[str, Any]:
     """Generate creative synthesis on a theme"""
-    return enhanced_consciousness_engine.generate_creative_synthesis(theme)
+    with enhanced_engine_pool.current() as engine:
+        return engine.generate_creative_synthesis(theme)
 
 def create_quantum_entanglement(external_id: str) -> bool:
     """Create quantum entanglement with external system"""
-    return enhanced_consciousness_engine.quantum_entangle(external_id)
+    with enhanced_engine_pool.current() as engine:
+        return engine.quantum_entangle(external_id)
 
 def deep_consciousness_reflection() -> str:
     """Generate deep consciousness reflection"""
-    return enhanced_consciousness_engine.deep_reflection()
+    with enhanced_engine_pool.current() as engine:
+        return engine.deep_reflection()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test the enhanced consciousness engine
     print("🧠 Enhanced Consciousness Engine Test")
     print("=" * 50)
@@ -681,4 +920,24 @@ if __name__ == "__main__":
     # Final status
     print("\n" + "=" * 50)
     status = get_enhanced_consciousness_status()
-    print(f"Final Status: {json.dumps(status, indent=2)}")
+    print(f"Final Status: {json.dumps(status, indent=2, default=_json_default)}")
+
+    # Request cost by input size, on keyword-dense payloads
+    print("\n" + "=" * 50)
+    print("process_advanced_input by input size:")
+    logger.setLevel(logging.WARNING)
+    sentence = "Create a novel synthesis of consciousness, awareness and emotion in a quantum pattern. "
+    for label, size in (("1 KB", 2**10), ("100 KB", 100 * 2**10), ("1 MB", 2**20)):
+        payload = {"query": sentence * (size // len(sentence)), "context": "creative"}
+        runs = max(3, 2**20 // size)
+        engine = EnhancedConsciousnessEngine(memory_budget=None)
+        start = time.perf_counter()
+        for _ in range(runs):
+            engine.process_advanced_input(payload)
+        request = (time.perf_counter() - start) / runs
+        start = time.perf_counter()
+        for _ in range(runs):
+            AnalysisContext.from_input(payload)
+        context = (time.perf_counter() - start) / runs
+        print(f"  {label:7s} {request * 1000:8.2f} ms per request, "
+              f"{context * 1000:8.2f} ms of it serializing and scanning the input once")
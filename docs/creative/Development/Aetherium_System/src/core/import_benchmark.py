@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Aetherium Core Import Benchmark
+
+Measures cold-start cost of the core package in fresh interpreters:
+importing the package alone, importing one function from it, and what
+importing the package used to do: load consciousness_engine,
+awareness_modules and integration_layer, then initialize the system. Also
+checks that importing the package loads none of its submodules.
+
+Run with: python import_benchmark.py [runs]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Code timed in a fresh interpreter for each case
+CASES = {
+    "import core": "import core",
+    "from core import monitor_consciousness": "from core import monitor_consciousness",
+    "eager: former package import": (
+        "import core.consciousness_engine, core.awareness_modules, core.integration_layer\n"
+        "core.initialize_aetherium_system()"
+    )
+}
+
+# Reports the time taken and which core submodules ended up loaded
+PROBE = """
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in sys.modules if name.startswith("core."))
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+def measure(code: str, runs: int) -> dict:
+    """Best time over runs fresh interpreters, with the submodules loaded"""
+    best = None
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(code=code)],
+            cwd=SRC_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print("🚀 Aetherium Core Import Benchmark")
+    print("=" * 50)
+    print(f"Best of {runs} fresh interpreters:")
+
+    results = {name: measure(code, runs) for name, code in CASES.items()}
+    for name, result in results.items():
+        print(f"  {name:40s} {result['seconds'] * 1000:7.1f} ms, {len(result['loaded']):2d} submodules loaded")
+
+    assert not results["import core"]["loaded"], f"import core loaded {results['import core']['loaded']}"
+    eager = results["eager: former package import"]["seconds"]
+    print(f"\nimport core is {eager / results['import core']['seconds']:.0f}x faster than the eager import")
+
+if __name__ == "__main__":
+    main()
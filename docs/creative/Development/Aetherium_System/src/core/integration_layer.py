@@ -12,13 +12,18 @@ This module provides:
 """
 
 import time
-import json
 import logging
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
 
+try:
+    from .bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+except ImportError:
+    # Fallback for direct execution
+    from bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+
 logger = logging.getLogger(__name__)
 
 class ComponentStatus(Enum):
@@ -41,9 +46,9 @@ class ComponentInfo:
 class ComponentBridge:
     """Bridge for connecting system components"""
 
-    def __init__(self):
+    def __init__(self, queue_size: int = DEFAULT_HISTORY_SIZE):
         self.components = {}
-        self.message_queue = []
+        self.message_queue = BoundedHistory(queue_size)
         self.connection_map = {}
 
     def register_component(self, name: str, component_info: ComponentInfo):
@@ -134,6 +139,8 @@ class SystemCoordinator:
         self.bridge = ComponentBridge()
         self.adapter = ProtocolAdapter()
         self.coordination_threads = []
+        self.initialized = False
+        self._init_lock = threading.Lock()
         self.system_health = {
             "overall_status": ComponentStatus.INITIALIZING,
             "component_health": {},
@@ -142,6 +149,19 @@ class SystemCoordinator:
 
     def initialize_system(self):
         """Initialize the integrated system"""
+        with self._init_lock:
+            if self.initialized:
+                return
+            self._initialize_components()
+            self.initialized = True
+
+    def ensure_initialized(self):
+        """Initialize on first use"""
+        if not self.initialized:
+            self.initialize_system()
+
+    def _initialize_components(self):
+        """Register core components, connections and protocol translators"""
         logger.info("Initializing Aetherium System Integration Layer")
 
         # Register core components
@@ -193,6 +213,7 @@ class SystemCoordinator:
 
     def process_integration_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process an integration request through the system"""
+        self.ensure_initialized()
         start_time = time.time()
 
         # Route through consciousness engine first
@@ -241,6 +262,7 @@ class SystemCoordinator:
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get overall system integration status"""
+        self.ensure_initialized()
         component_statuses = {}
         for name, info in self.bridge.components.items():
             component_statuses[name] = {
@@ -0,0 +1,87 @@
+# Aetherium Keyword Matcher
+
+"""
+Keyword Matcher for the Aetherium System
+Single-pass multi-keyword detection shared by the pattern analyzers.
+
+The keyword tables are compiled once into a trie-shaped regular expression,
+so a single scan of the text reports every keyword that occurs in it - the
+same answer as checking ``keyword in text`` for each keyword, without
+rescanning the text once per keyword.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable
+
+class KeywordMatcher:
+    """Compiled multi-keyword matcher with substring semantics"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+
+        # The scan reports the longest keyword at each match position and does
+        # not revisit consumed text. Keywords inside a match are implied by it;
+        # keywords that could start inside a match and run past its end are
+        # the only ones that need a direct check.
+        self._contained: Dict[str, FrozenSet[str]] = {}
+        self._straddling: Dict[str, FrozenSet[str]] = {}
+        for keyword in self.keywords:
+            contained = frozenset(k for k in self.keywords if k in keyword)
+            tails = [keyword[i:] for i in range(1, len(keyword))]
+            self._contained[keyword] = contained
+            self._straddling[keyword] = frozenset(
+                k for k in self.keywords
+                if k not in contained and any(k.startswith(tail) for tail in tails)
+            )
+
+        self._regex = None
+        if self.keywords:
+            self._regex = re.compile(self._trie_pattern(self.keywords))
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Find every keyword occurring in text in a single scan
+
+        Args:
+            text: Text to scan, already lowercased by the caller
+
+        Returns:
+            Set of keywords present in the text
+        """
+        if self._regex is None:
+            return frozenset()
+
+        hits = set()
+        candidates = set()
+        for longest in set(self._regex.findall(text)):
+            hits.update(self._contained[longest])
+            candidates.update(self._straddling[longest])
+
+        for keyword in candidates - hits:
+            if keyword in text:
+                hits.add(keyword)
+
+        return frozenset(hits)
+
+    @staticmethod
+    def _trie_pattern(keywords: Iterable[str]) -> str:
+        """Build a regex that walks a character trie of the keywords"""
+        trie: Dict[str, Dict] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}  # End-of-keyword marker
+
+        def emit(node: Dict[str, Dict]) -> str:
+            branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            if "" in node:
+                # Greedy optional tail so the longest keyword wins
+                body = "(?:" + body + ")?"
+            return body
+
+        return emit(trie)
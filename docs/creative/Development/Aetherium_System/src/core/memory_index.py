@@ -0,0 +1,130 @@
+# Aetherium Memory Index
+
+"""
+Memory Index for the Aetherium System
+Recency, pattern and token lookups over a memory bank.
+
+The index keeps memory ids in insertion order, plus inverted indexes from
+pattern and from content token to the ids that contain them. Recent-window
+reads, association lookups and theme searches therefore cost time
+proportional to the window or the matching postings, not to the size of
+the bank.
+"""
+
+import json
+import re
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str, lowercase: bool = True) -> List[str]:
+    """Lowercase word tokens used by the token index"""
+    return _TOKEN_RE.findall(text.lower() if lowercase else text)
+
+class MemoryIndex:
+    """Ordered id list with pattern and token inverted indexes"""
+
+    def __init__(self):
+        # Dicts double as insertion-ordered sets
+        self._order: Dict[str, None] = {}
+        self._by_pattern: Dict[str, Dict[str, None]] = {}
+        self._by_token: Dict[str, Dict[str, None]] = {}
+        self._keys: Dict[str, tuple] = {}  # id -> (patterns, tokens) for removal
+
+    def add(self, memory_id: str, patterns: Iterable[str], content: Any,
+            tokens: Optional[Iterable[str]] = None):
+        """
+        Index a memory; re-adding an id moves it to the recent end
+
+        Args:
+            memory_id: Memory id
+            patterns: Patterns the memory was recorded with
+            content: Memory content, tokenized when tokens is not given
+            tokens: Precomputed content tokens
+        """
+        if memory_id in self._order:
+            self.remove(memory_id)
+
+        patterns = tuple(dict.fromkeys(patterns))
+        if tokens is None:
+            tokens = tokenize(self._content_text(content))
+        tokens = tuple(dict.fromkeys(tokens))
+
+        self._order[memory_id] = None
+        for pattern in patterns:
+            self._by_pattern.setdefault(pattern, {})[memory_id] = None
+        for token in tokens:
+            self._by_token.setdefault(token, {})[memory_id] = None
+        self._keys[memory_id] = (patterns, tokens)
+
+    def remove(self, memory_id: str):
+        """Drop a memory from every index"""
+        if memory_id not in self._order:
+            return
+
+        del self._order[memory_id]
+        patterns, tokens = self._keys.pop(memory_id)
+        for pattern in patterns:
+            self._discard(self._by_pattern, pattern, memory_id)
+        for token in tokens:
+            self._discard(self._by_token, token, memory_id)
+
+    def clear(self):
+        """Drop every indexed memory"""
+        self._order.clear()
+        self._by_pattern.clear()
+        self._by_token.clear()
+        self._keys.clear()
+
+    def recent(self, count: int) -> List[str]:
+        """The most recent memory ids, oldest first"""
+        ids = list(islice(reversed(self._order), count))
+        ids.reverse()
+        return ids
+
+    def with_pattern(self, pattern: str) -> List[str]:
+        """Ids of memories recorded with a pattern, oldest first"""
+        return list(self._by_pattern.get(pattern, ()))
+
+    def associated(self, patterns: Iterable[str], window: int) -> List[str]:
+        """Ids among the last ``window`` memories that share any of the patterns"""
+        postings = [self._by_pattern[p] for p in set(patterns) if p in self._by_pattern]
+        if not postings:
+            return []
+        return [memory_id for memory_id in self.recent(window)
+                if any(memory_id in ids for ids in postings)]
+
+    def matching(self, text: str, window: int) -> List[str]:
+        """Ids among the last ``window`` memories containing every token of text"""
+        tokens = set(tokenize(text))
+        if not tokens:
+            # Like a substring search, an empty query matches everything
+            return self.recent(window)
+
+        postings = [self._by_token.get(token) for token in tokens]
+        if not all(postings):
+            return []
+        return [memory_id for memory_id in self.recent(window)
+                if all(memory_id in ids for ids in postings)]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._order
+
+    @staticmethod
+    def _discard(index: Dict[str, Dict[str, None]], key: str, memory_id: str):
+        postings = index.get(key)
+        if postings is not None:
+            postings.pop(memory_id, None)
+            if not postings:
+                del index[key]
+
+    @staticmethod
+    def _content_text(content: Any) -> str:
+        """Text of a memory's content for tokenizing"""
+        if isinstance(content, str):
+            return content
+        return json.dumps(content, default=lambda value: getattr(value, "value", str(value)))
@@ -0,0 +1,309 @@
+# Aetherium Memory Store
+
+"""
+Memory Store for the Aetherium System
+Capacity-bounded memory bank with pluggable eviction.
+
+A MemoryStore behaves like the plain dict it replaces, but it tracks the
+estimated byte size of every memory. When a byte budget or item limit is
+exceeded, it evicts memories chosen by an eviction policy:
+
+- lru: least recently stored or recalled
+- lfu: fewest recalls, oldest first among ties
+- importance: lowest importance, weighted by recalls and decayed by age
+"""
+
+import heapq
+import logging
+import math
+import sys
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024  # Bytes
+DEFAULT_HALF_LIFE = 3600.0                # Seconds for importance to halve
+
+_SCALAR_TYPES = (str, int, float, bytes)
+
+def estimate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Approximate deep size of an object in bytes
+
+    Shared singletons such as enum members are counted as references only.
+    """
+    if type(obj) in _SCALAR_TYPES:
+        return sys.getsizeof(obj)
+    if _seen is None:
+        _seen = set()
+    if isinstance(obj, Enum) or obj is None or isinstance(obj, bool) or id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        items = [item for pair in obj.items() for item in pair]
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = obj
+    elif hasattr(obj, "__dict__"):
+        items = [vars(obj)]
+    else:
+        return size
+
+    for item in items:
+        # Scalars are sized inline to skip a call per leaf
+        if type(item) in _SCALAR_TYPES:
+            size += sys.getsizeof(item)
+        else:
+            size += estimate_size(item, _seen)
+    return size
+
+class EvictionPolicy:
+    """Chooses which memory to evict next"""
+
+    name = "base"
+
+    def add(self, memory_id: str, memory: Any):
+        """Track a newly stored memory"""
+        raise NotImplementedError
+
+    def touch(self, memory_id: str, memory: Any):
+        """Record that a memory was recalled"""
+        raise NotImplementedError
+
+    def remove(self, memory_id: str):
+        """Stop tracking a memory"""
+        raise NotImplementedError
+
+    def victim(self) -> str:
+        """Id of the next memory to evict"""
+        raise NotImplementedError
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently stored or recalled memory"""
+
+    name = "lru"
+
+    def __init__(self):
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, memory_id: str, memory: Any):
+        self._order[memory_id] = None
+        self._order.move_to_end(memory_id)
+
+    def touch(self, memory_id: str, memory: Any):
+        if memory_id in self._order:
+            self._order.move_to_end(memory_id)
+
+    def remove(self, memory_id: str):
+        self._order.pop(memory_id, None)
+
+    def victim(self) -> str:
+        return next(iter(self._order))
+
+class _HeapPolicy(EvictionPolicy):
+    """Min-heap of memory scores with lazy invalidation of stale entries"""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._scores: Dict[str, Tuple[float, int]] = {}
+        self._counter = 0
+
+    def _score(self, memory: Any) -> float:
+        raise NotImplementedError
+
+    def _push(self, memory_id: str, memory: Any):
+        self._counter += 1
+        entry = (self._score(memory), self._counter)
+        self._scores[memory_id] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], memory_id))
+
+        # Drop stale entries once they dominate the heap
+        if len(self._heap) > 4 * len(self._scores) + 64:
+            self._heap = [(score, seq, mid) for mid, (score, seq) in self._scores.items()]
+            heapq.heapify(self._heap)
+
+    def add(self, memory_id: str, memory: Any):
+        self._push(memory_id, memory)
+
+    def touch(self, memory_id: str, memory: Any):
+        if memory_id in self._scores:
+            self._push(memory_id, memory)
+
+    def remove(self, memory_id: str):
+        self._scores.pop(memory_id, None)
+
+    def victim(self) -> str:
+        while self._heap:
+            score, seq, memory_id = self._heap[0]
+            if self._scores.get(memory_id) == (score, seq):
+                return memory_id
+            heapq.heappop(self._heap)
+        raise KeyError("no memories to evict")
+
+class LFUPolicy(_HeapPolicy):
+    """Evict the least frequently recalled memory, oldest first among ties"""
+
+    name = "lfu"
+
+    def _score(self, memory: Any) -> float:
+        return float(memory.access_count)
+
+class ImportanceDecayPolicy(_HeapPolicy):
+    """
+    Evict the memory with the lowest decayed importance
+
+    A memory's value is importance * (1 + access_count), halving every
+    half_life seconds since it was stored. Decay scales every memory by the
+    same factor at a given moment, so the ordering can be kept in a static
+    heap keyed on log(value) + decay_rate * timestamp.
+    """
+
+    name = "importance"
+
+    def __init__(self, half_life: float = DEFAULT_HALF_LIFE):
+        super().__init__()
+        self.decay_rate = math.log(2) / half_life
+
+    def _score(self, memory: Any) -> float:
+        value = max(memory.importance, 1e-6) * (1 + memory.access_count)
+        return math.log(value) + self.decay_rate * memory.timestamp
+
+EVICTION_POLICIES = {
+    LRUPolicy.name: LRUPolicy,
+    LFUPolicy.name: LFUPolicy,
+    ImportanceDecayPolicy.name: ImportanceDecayPolicy
+}
+
+class MemoryStore(MutableMapping):
+    """Dict-like memory bank that stays within a byte budget"""
+
+    def __init__(self, capacity_bytes: Optional[int] = DEFAULT_MEMORY_BUDGET,
+                 max_items: Optional[int] = None,
+                 policy: Union[str, EvictionPolicy] = "importance",
+                 on_evict: Optional[Callable[[str, Any], None]] = None):
+        """
+        Args:
+            capacity_bytes: Byte budget for stored memories, None for unbounded
+            max_items: Optional limit on the number of memories
+            policy: Eviction policy name ("lru", "lfu", "importance") or instance
+            on_evict: Called with (memory_id, memory) for each evicted memory
+        """
+        if isinstance(policy, str):
+            if policy not in EVICTION_POLICIES:
+                raise ValueError(f"Unknown eviction policy: {policy}")
+            policy = EVICTION_POLICIES[policy]()
+
+        self.capacity_bytes = capacity_bytes
+        self.max_items = max_items
+        self.policy = policy
+        self.on_evict = on_evict
+
+        self._memories: Dict[str, Any] = {}
+        self._sizes: Dict[str, int] = {}
+        self.bytes_used = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def __getitem__(self, memory_id: str) -> Any:
+        return self._memories[memory_id]
+
+    def __setitem__(self, memory_id: str, memory: Any):
+        self.put(memory_id, memory)
+
+    def put(self, memory_id: str, memory: Any, size: Optional[int] = None):
+        """
+        Store a memory, evicting others if over capacity
+
+        Args:
+            memory_id: Key of the memory
+            memory: The memory
+            size: Its estimated bytes if already known, as when restoring saved state
+        """
+        if memory_id in self._memories:
+            self._discard(memory_id)
+
+        if size is None:
+            size = estimate_size(memory)
+        self._memories[memory_id] = memory
+        self._sizes[memory_id] = size
+        self.bytes_used += size
+        self.policy.add(memory_id, memory)
+
+        self._enforce_capacity(keep=memory_id)
+
+    def __delitem__(self, memory_id: str):
+        if memory_id not in self._memories:
+            raise KeyError(memory_id)
+        self._discard(memory_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._memories)
+
+    def sizes(self) -> Dict[str, int]:
+        """Estimated bytes of each memory, for persisting with the memories"""
+        return dict(self._sizes)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._memories)
+
+    def __len__(self) -> int:
+        return len(self._memories)
+
+    def recall(self, memory_id: str) -> Any:
+        """Fetch a memory and count the access toward its retention"""
+        memory = self._memories[memory_id]
+        memory.access_count += 1
+        self.policy.touch(memory_id, memory)
+        return memory
+
+    @property
+    def usage(self) -> float:
+        """Fraction of the byte budget in use"""
+        if not self.capacity_bytes:
+            return 0.0
+        return self.bytes_used / self.capacity_bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Capacity and eviction statistics"""
+        return {
+            "memories": len(self._memories),
+            "bytes_used": self.bytes_used,
+            "capacity_bytes": self.capacity_bytes,
+            "max_items": self.max_items,
+            "usage": self.usage,
+            "policy": self.policy.name,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes
+        }
+
+    def _discard(self, memory_id: str) -> Any:
+        memory = self._memories.pop(memory_id)
+        self.bytes_used -= self._sizes.pop(memory_id)
+        self.policy.remove(memory_id)
+        return memory
+
+    def _over_capacity(self) -> bool:
+        if self.capacity_bytes is not None and self.bytes_used > self.capacity_bytes:
+            return True
+        return self.max_items is not None and len(self._memories) > self.max_items
+
+    def _enforce_capacity(self, keep: str):
+        """Evict until within limits, never evicting the memory just stored"""
+        while self._over_capacity() and len(self._memories) > 1:
+            memory_id = self.policy.victim()
+            if memory_id == keep:
+                # Re-queue behind the others so the next victim is different
+                self.policy.remove(memory_id)
+                memory_id = self.policy.victim()
+                self.policy.add(keep, self._memories[keep])
+
+            size = self._sizes[memory_id]
+            memory = self._discard(memory_id)
+            self.evictions += 1
+            self.evicted_bytes += size
+            if self.on_evict:
+                self.on_evict(memory_id, memory)
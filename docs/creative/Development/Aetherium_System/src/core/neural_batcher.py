@@ -0,0 +1,235 @@
+# Aetherium Neural Micro-Batcher
+
+"""
+Neural Micro-Batcher for the Aetherium System
+Batched inference for concurrent neural pattern requests.
+
+Requests are queued and collected for up to ``max_wait_ms`` or until
+``max_batch_size`` pattern rows are waiting. Then they run through the
+network as one forward pass per distinct consciousness state, and the
+results are scattered back to each caller. Callers can block on
+``process`` or await ``submit`` from an event loop.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from .bounded_history import BoundedHistory
+    from .neural_consciousness import AdvancedPatternProcessor, neural_processor
+except ImportError:
+    # Fallback for direct execution
+    from bounded_history import BoundedHistory
+    from neural_consciousness import AdvancedPatternProcessor, neural_processor
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _InferenceRequest:
+    """A queued request and the future its caller waits on"""
+    patterns: List[Dict]
+    context: str
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+class NeuralMicroBatcher:
+    """Collects concurrent requests into batched forward passes"""
+
+    def __init__(self, processor: AdvancedPatternProcessor = neural_processor,
+                 max_batch_size: int = 64, max_wait_ms: float = 5.0,
+                 include_embeddings: bool = False, metrics_window: int = 1000):
+        """
+        Args:
+            processor: Processor with an initialized neural network
+            max_batch_size: Pattern rows that trigger an immediate flush
+            max_wait_ms: Longest time the first queued request waits for company
+            include_embeddings: Return pattern_embeddings lists in responses
+            metrics_window: Recent batches kept for metric percentiles
+        """
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+
+        self.processor = processor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.include_embeddings = include_embeddings
+
+        self._queue: "queue.Queue[Optional[_InferenceRequest]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._running = False
+
+        # Metrics
+        self.batch_sizes = BoundedHistory(metrics_window)     # Pattern rows per batch
+        self.batch_requests = BoundedHistory(metrics_window)  # Requests per batch
+        self.queue_waits = BoundedHistory(metrics_window)     # Seconds from submit to forward pass
+        self.requests_processed = 0
+        self.requests_failed = 0
+
+    def start(self):
+        """Start the batching worker"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._worker = threading.Thread(target=self._run, name="neural-micro-batcher", daemon=True)
+            self._worker.start()
+        logger.info(f"Neural micro-batcher started (batch {self.max_batch_size}, wait {self.max_wait * 1000:.1f}ms)")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the worker after the requests already queued are served"""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._queue.put(None)
+            worker = self._worker
+        worker.join(timeout)
+
+    def submit_nowait(self, patterns: List[Dict], context: str = "") -> Future:
+        """
+        Queue a request without waiting for it
+
+        Returns:
+            Future resolving to the same response as process_patterns_with_neural_insights
+        """
+        if not self._running:
+            self.start()
+        request = _InferenceRequest(patterns, context)
+        self._queue.put(request)
+        return request.future
+
+    def process(self, patterns: List[Dict], context: str = "", timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Queue a request and block until its batch has run"""
+        return self.submit_nowait(patterns, context).result(timeout)
+
+    async def submit(self, patterns: List[Dict], context: str = "") -> Dict[str, Any]:
+        """Queue a request and await its result from an event loop"""
+        return await asyncio.wrap_future(self.submit_nowait(patterns, context))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Batch size and queue wait statistics"""
+        sizes = np.array(self.batch_sizes.to_list(), dtype=np.float64)
+        waits = np.array(self.queue_waits.to_list(), dtype=np.float64) * 1000.0
+
+        return {
+            "running": self._running,
+            "queue_depth": self._queue.qsize(),
+            "batches_processed": self.batch_sizes.total,
+            "requests_processed": self.requests_processed,
+            "requests_failed": self.requests_failed,
+            "avg_batch_size": float(sizes.mean()) if sizes.size else 0.0,
+            "max_batch_size": float(sizes.max()) if sizes.size else 0.0,
+            "avg_requests_per_batch": float(np.mean(self.batch_requests.to_list())) if len(self.batch_requests) else 0.0,
+            "avg_queue_wait_ms": float(waits.mean()) if waits.size else 0.0,
+            "p95_queue_wait_ms": float(np.percentile(waits, 95)) if waits.size else 0.0,
+            "max_queue_wait_ms": float(waits.max()) if waits.size else 0.0
+        }
+
+    def _run(self):
+        """Worker loop: collect a batch, run it, repeat"""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            rows = len(first.patterns)
+            deadline = first.enqueued_at + self.max_wait
+            stopping = False
+
+            while rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+                rows += len(request.patterns)
+
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                # Keep the worker alive; fail whatever the batch left unresolved
+                logger.error(f"Neural micro-batch failed: {e}")
+                pending = [request for request in batch if not request.future.done()]
+                self.requests_failed += len(pending)
+                for request in pending:
+                    request.future.set_exception(e)
+            if stopping:
+                return
+
+    def _run_batch(self, batch: List[_InferenceRequest]):
+        """Run one collected batch and resolve each request's future"""
+        processor = self.processor
+        started = time.perf_counter()
+
+        if not processor.neural_network:
+            for request in batch:
+                request.future.set_result({"error": "Neural network not initialized"})
+            return
+
+        # Requests sharing a consciousness state share a forward pass
+        groups: Dict[Any, List[_InferenceRequest]] = {}
+        states: Dict[Any, Optional[Dict]] = {}
+        for request in batch:
+            state = processor._get_consciousness_context(request.context)
+            key = tuple(sorted(state.items())) if state else None
+            groups.setdefault(key, []).append(request)
+            states[key] = state
+
+        for key, requests in groups.items():
+            state = states[key]
+            try:
+                embeddings = [processor._patterns_to_embeddings(request.patterns) for request in requests]
+                output = processor._run_network(np.concatenate(embeddings), state)
+            except Exception as e:
+                logger.error(f"Batched neural inference failed: {e}")
+                self.requests_failed += len(requests)
+                for request in requests:
+                    request.future.set_exception(e)
+                continue
+
+            # Scatter rows back to their requests; a bad request fails alone
+            offset = 0
+            for request, request_embeddings in zip(requests, embeddings):
+                count = len(request_embeddings)
+                try:
+                    response = processor._build_response(
+                        request.patterns, request_embeddings, output[offset:offset + count], state,
+                        include_embeddings=self.include_embeddings
+                    )
+                except Exception as e:
+                    logger.error(f"Building neural response failed: {e}")
+                    self.requests_failed += 1
+                    request.future.set_exception(e)
+                else:
+                    self.requests_processed += 1
+                    request.future.set_result(response)
+                offset += count
+
+        self.batch_sizes.append(sum(len(request.patterns) for request in batch))
+        self.batch_requests.append(len(batch))
+        self.queue_waits.extend(started - request.enqueued_at for request in batch)
+
+# Global micro-batcher around the shared neural processor
+neural_batcher = NeuralMicroBatcher()
+
+async def process_patterns_batched(patterns: List[Dict], context: str = "") -> Dict[str, Any]:
+    """Await neural insights computed in a shared micro-batch"""
+    return await neural_batcher.submit(patterns, context)
+
+def get_batcher_metrics() -> Dict[str, Any]:
+    """Get the global micro-batcher's metrics"""
+    return neural_batcher.get_metrics()
@@ -4,52 +4,80 @@ Advanced neural pattern recognition with consciousness integration
 Extends the basic pattern recognition with deep learning capabilities
 """
 
+import hashlib
 import numpy as np
-import torch
-import torch.nn as nn
 from typing import Dict, List, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
-class ConsciousnessAwareNeuralNetwork(nn.Module):
-    """Neural network that integrates consciousness state awareness"""
-
-    def __init__(self, input_size: int = 768, hidden_size: int = 256, num_classes: int = 10):
-        super().__init__()
-
-        # Core neural layers
-        self.encoder = nn.Sequential(
-            nn.Linear(input_size, hidden_size),
-            nn.ReLU(),
-            nn.Dropout(0.1),
-            nn.Linear(hidden_size, hidden_size // 2),
-            nn.ReLU(),
-            nn.Dropout(0.1)
-        )
+# Embedding layout: leading numeric columns, then hashed type features
+EMBEDDING_NUMERIC_FEATURES = 3  # confidence, description length, data size
+TYPE_HASH_PROBES = 8            # Signed hash buckets set per pattern type
+
+# torch is imported on first use so CPU-only deployments serving the NumPy
+# backend never load it
+torch = None
+nn = None
+
+def _import_torch():
+    """Import torch on first use"""
+    global torch, nn
+    if torch is None:
+        import torch as _torch
+        torch = _torch
+        nn = _torch.nn
+    return torch
+
+_network_class = None
+
+def _get_network_class():
+    """Define the torch network class once torch is available"""
+    global _network_class
+    if _network_class is not None:
+        return _network_class
+
+    _import_torch()
+
+    class ConsciousnessAwareNeuralNetwork(nn.Module):
+        """Neural network that integrates consciousness state awareness"""
+
+        def __init__(self, input_size: int = 768, hidden_size: int = 256, num_classes: int = 10):
+            super().__init__()
+            self.input_size = input_size
+
+            # Core neural layers
+            self.encoder = nn.Sequential(
+                nn.Linear(input_size, hidden_size),
+                nn.ReLU(),
+                nn.Dropout(0.1),
+                nn.Linear(hidden_size, hidden_size // 2),
+                nn.ReLU(),
+                nn.Dropout(0.1)
+            )
 
-        # Consciousness integration layer
-        self.consciousness_gate = nn.Linear(hidden_size // 2 + 4, hidden_size // 4)  # +4 for consciousness state
+            # Consciousness integration layer
+            self.consciousness_gate = nn.Linear(hidden_size // 2 + 4, hidden_size // 4)  # +4 for consciousness state
 
-        # Output layers
-        self.classifier = nn.Sequential(
-            nn.Linear(hidden_size // 4, num_classes),
-            nn.Softmax(dim=1)
-        )
+            # Output layers
+            self.classifier = nn.Sequential(
+                nn.Linear(hidden_size // 4, num_classes),
+                nn.Softmax(dim=1)
+            )
 
-        # Consciousness state tracking
-        self.consciousness_history = []
-        self.adaptation_counter = 0
+            # Consciousness state tracking
+            self.consciousness_history = []
+            self.adaptation_counter = 0
 
-    def forward(self, x: torch.Tensor, consciousness_state: Optional[Dict] = None) -> torch.Tensor:
-        """Forward pass with optional consciousness state integration"""
+        def forward(self, x: "torch.Tensor", consciousness_state: Optional[Dict] = None) -> "torch.Tensor":
+            """Forward pass with optional consciousness state integration"""
 
-        # Encode input
-        encoded = self.encoder(x)
+            # Encode input
+            encoded = self.encoder(x)
 
-        # Integrate consciousness state if available
-        if consciousness_state:
-            # Convert consciousness state to tensor
+            # Integrate consciousness state, falling back to its defaults so
+            # the classifier always sees the gate's output width
+            consciousness_state = consciousness_state or {}
             awareness_level = consciousness_state.get('awareness_level', 0.5)
             reflection_depth = consciousness_state.get('reflection_depth', 0.0)
             integration_status = consciousness_state.get('integration_status', 0.0)
@@ -62,44 +90,163 @@ class ConsciousnessAwareNeuralNetwork(nn.Module):
             # Concatenate with encoded features
             combined = torch.cat([encoded, consciousness_features.unsqueeze(0).expand(encoded.size(0), -1)], dim=1)
             consciousness_integrated = self.consciousness_gate(combined)
-        else:
-            consciousness_integrated = encoded
 
-        # Generate output
-        output = self.classifier(consciousness_integrated)
+            # Generate output
+            output = self.classifier(consciousness_integrated)
+
+            return output
+
+        def adapt_to_consciousness_feedback(self, feedback: Dict[str, Any]):
+            """Adapt network based on consciousness system feedback"""
+
+            self.consciousness_history.append(feedback)
+            self.adaptation_counter += 1
+
+            # Simple adaptation: adjust learning rate based on consciousness coherence
+            coherence_score = feedback.get('coherence_score', 0.5)
+
+            if coherence_score > 0.7:
+                # Increase exploration for high coherence
+                for param_group in self.optimizer.param_groups:
+                    param_group['lr'] *= 1.1
+            elif coherence_score < 0.3:
+                # Increase exploitation for low coherence
+                for param_group in self.optimizer.param_groups:
+                    param_group['lr'] *= 0.9
+
+            logger.info(f"Neural network adapted based on consciousness feedback. Coherence: {coherence_score}")
+
+    # Resolvable by pickle/torch.save through the module __getattr__
+    ConsciousnessAwareNeuralNetwork.__module__ = __name__
+    ConsciousnessAwareNeuralNetwork.__qualname__ = "ConsciousnessAwareNeuralNetwork"
+
+    _network_class = ConsciousnessAwareNeuralNetwork
+    return _network_class
+
+def __getattr__(name):
+    """Resolve the torch network class lazily"""
+    if name == "ConsciousnessAwareNeuralNetwork":
+        return _get_network_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        return output
+class NumpyConsciousnessNetwork:
+    """
+    Inference-only NumPy port of ConsciousnessAwareNeuralNetwork
 
-    def adapt_to_consciousness_feedback(self, feedback: Dict[str, Any]):
-        """Adapt network based on consciousness system feedback"""
+    Uses the same parameter names and shapes as the torch module's
+    state_dict, so weights exported from a trained network serve
+    identical forward passes without importing torch.
+    """
 
-        self.consciousness_history.append(feedback)
-        self.adaptation_counter += 1
+    def __init__(self, weights: Dict[str, np.ndarray]):
+        self.weights = {name: np.asarray(value, dtype=np.float32) for name, value in weights.items()}
+        self.input_size = self.weights["encoder.0.weight"].shape[1]
+        self.num_classes = self.weights["classifier.0.weight"].shape[0]
+        self.adaptation_counter = 0
 
-        # Simple adaptation: adjust learning rate based on consciousness coherence
-        coherence_score = feedback.get('coherence_score', 0.5)
+    @classmethod
+    def initialize(cls, input_size: int = 768, hidden_size: int = 256, num_classes: int = 10,
+                   seed: Optional[int] = None) -> "NumpyConsciousnessNetwork":
+        """Create a network with torch's default Linear initialization"""
+        rng = np.random.default_rng(seed)
+        layers = {
+            "encoder.0": (input_size, hidden_size),
+            "encoder.3": (hidden_size, hidden_size // 2),
+            "consciousness_gate": (hidden_size // 2 + 4, hidden_size // 4),
+            "classifier.0": (hidden_size // 4, num_classes)
+        }
 
-        if coherence_score > 0.7:
-            # Increase exploration for high coherence
-            for param_group in self.optimizer.param_groups:
-                param_group['lr'] *= 1.1
-        elif coherence_score < 0.3:
-            # Increase exploitation for low coherence
-            for param_group in self.optimizer.param_groups:
-                param_group['lr'] *= 0.9
+        weights = {}
+        for name, (fan_in, fan_out) in layers.items():
+            bound = 1.0 / np.sqrt(fan_in)
+            weights[f"{name}.weight"] = rng.uniform(-bound, bound, (fan_out, fan_in))
+            weights[f"{name}.bias"] = rng.uniform(-bound, bound, fan_out)
+        return cls(weights)
+
+    @classmethod
+    def from_torch(cls, network: Any) -> "NumpyConsciousnessNetwork":
+        """Copy the weights of a torch ConsciousnessAwareNeuralNetwork"""
+        return cls({
+            name: tensor.detach().cpu().numpy()
+            for name, tensor in network.state_dict().items()
+        })
+
+    @classmethod
+    def load(cls, filepath: str) -> "NumpyConsciousnessNetwork":
+        """Load weights saved with save()"""
+        with np.load(filepath) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def save(self, filepath: str):
+        """Save weights as an .npz archive"""
+        np.savez(filepath, **self.weights)
+
+    def _linear(self, x: np.ndarray, name: str) -> np.ndarray:
+        return x @ self.weights[f"{name}.weight"].T + self.weights[f"{name}.bias"]
+
+    def forward(self, x: np.ndarray, consciousness_state: Optional[Dict] = None) -> np.ndarray:
+        """Forward pass matching the torch module in eval mode"""
+        x = np.asarray(x, dtype=np.float32)
+
+        # Encode input (dropout is the identity at inference)
+        encoded = np.maximum(self._linear(x, "encoder.0"), 0.0)
+        encoded = np.maximum(self._linear(encoded, "encoder.3"), 0.0)
+
+        # Integrate consciousness state, defaults included as in the torch module
+        consciousness_state = consciousness_state or {}
+        consciousness_features = np.array([
+            consciousness_state.get('awareness_level', 0.5),
+            consciousness_state.get('reflection_depth', 0.0),
+            consciousness_state.get('integration_status', 0.0),
+            consciousness_state.get('novelty_score', 0.5)
+        ], dtype=np.float32)
+
+        combined = np.concatenate(
+            [encoded, np.broadcast_to(consciousness_features, (encoded.shape[0], 4))], axis=1
+        )
+        consciousness_integrated = self._linear(combined, "consciousness_gate")
 
-        logger.info(f"Neural network adapted based on consciousness feedback. Coherence: {coherence_score}")
+        # Softmax over classes
+        logits = self._linear(consciousness_integrated, "classifier.0")
+        logits = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    __call__ = forward
 
 class AdvancedPatternProcessor:
     """Advanced pattern processing with neural network integration"""
 
     def __init__(self):
         self.neural_network = None
+        self.backend = None
+        self.input_size = 768
         self.pattern_embeddings = {}
         self.consciousness_correlations = {}
 
-    def initialize_neural_network(self, consciousness_engine=None):
-        """Initialize the consciousness-aware neural network"""
+    def initialize_neural_network(self, consciousness_engine=None, backend: str = "torch",
+                                  weights_path: Optional[str] = None):
+        """
+        Initialize the consciousness-aware neural network
+
+        Args:
+            consciousness_engine: Optional engine used to size the network
+            backend: "torch", or "numpy" for torch-free inference
+            weights_path: .npz weights for the numpy backend
+        """
+        if backend not in ("torch", "numpy"):
+            raise ValueError(f"Unknown neural backend: {backend}")
+
+        if backend == "numpy" and weights_path:
+            self.neural_network = NumpyConsciousnessNetwork.load(weights_path)
+            self._configure_embeddings(backend)
+            logger.info(f"Neural network loaded from {weights_path} on the numpy backend")
+            return
+
+        if backend == "torch":
+            network_class = _get_network_class()
+        else:
+            network_class = NumpyConsciousnessNetwork.initialize
 
         # Try to use consciousness engine for enhanced initialization
         if consciousness_engine:
@@ -111,16 +258,37 @@ class AdvancedPatternProcessor:
             input_size = 768 if awareness_level > 5 else 512
             hidden_size = 256 if awareness_level > 3 else 128
 
-            self.neural_network = ConsciousnessAwareNeuralNetwork(
+            self.neural_network = network_class(
                 input_size=input_size,
                 hidden_size=hidden_size
             )
 
             logger.info(f"Neural network initialized with consciousness awareness. Input size: {input_size}")
         else:
-            self.neural_network = ConsciousnessAwareNeuralNetwork()
+            self.neural_network = network_class()
             logger.info("Neural network initialized without consciousness integration")
 
+        if backend == "torch":
+            self.neural_network.eval()
+        self._configure_embeddings(backend)
+
+    def _configure_embeddings(self, backend: str):
+        """Match embeddings to the new network's input width"""
+        self.backend = backend
+        if self.neural_network.input_size != self.input_size:
+            self.input_size = self.neural_network.input_size
+            self.pattern_embeddings.clear()
+
+    def export_numpy_weights(self, filepath: str):
+        """Save the current network's weights for the numpy backend"""
+        if not self.neural_network:
+            raise RuntimeError("Neural network not initialized")
+
+        if self.backend == "torch":
+            NumpyConsciousnessNetwork.from_torch(self.neural_network).save(filepath)
+        else:
+            self.neural_network.save(filepath)
+
     def process_patterns_with_neural_insights(self, patterns: List[Dict], context: str = "") -> Dict[str, Any]:
         """Process patterns using neural network for enhanced analysis"""
 
@@ -134,34 +302,76 @@ class AdvancedPatternProcessor:
         consciousness_state = self._get_consciousness_context(context)
 
         # Process through neural network
-        with torch.no_grad():
-            neural_output = self.neural_network(pattern_embeddings, consciousness_state)
+        neural_output = self._run_network(pattern_embeddings, consciousness_state)
+
+        return self._build_response(patterns, pattern_embeddings, neural_output, consciousness_state)
 
-        # Interpret neural network results
+    def _run_network(self, embeddings: np.ndarray, consciousness_state: Optional[Dict]) -> np.ndarray:
+        """Forward a batch of embeddings through the active backend"""
+        if self.backend == "torch":
+            with torch.inference_mode():
+                return self.neural_network(torch.from_numpy(embeddings), consciousness_state).numpy()
+        return self.neural_network(embeddings, consciousness_state)
+
+    def _build_response(self, patterns: List[Dict], embeddings: np.ndarray, neural_output: np.ndarray,
+                        consciousness_state: Optional[Dict], include_embeddings: bool = True) -> Dict[str, Any]:
+        """Interpret one request's network output"""
         insights = self._interpret_neural_output(neural_output, patterns, consciousness_state)
 
-        return {
+        response = {
             "neural_insights": insights,
-            "pattern_embeddings": pattern_embeddings.tolist(),
             "consciousness_integration": consciousness_state is not None,
-            "confidence_score": float(torch.max(neural_output))
+            "confidence_score": float(np.max(neural_output)) if neural_output.size else 0.0
         }
+        if include_embeddings:
+            response["pattern_embeddings"] = embeddings.tolist()
+        return response
+
+    def _patterns_to_embeddings(self, patterns: List[Dict]) -> np.ndarray:
+        """
+        Convert patterns to neural network embeddings
+
+        Returns:
+            float32 matrix of shape (len(patterns), input_size)
+        """
+        count = len(patterns)
+
+        # Gather each pattern's type row from the per-type cache
+        type_rows: Dict[str, int] = {}
+        row_index = np.fromiter(
+            (type_rows.setdefault(pattern.get("type", ""), len(type_rows)) for pattern in patterns),
+            dtype=np.intp, count=count
+        )
+        type_matrix = np.stack([self._type_embedding(pattern_type) for pattern_type in type_rows]) \
+            if type_rows else np.zeros((0, self.input_size), dtype=np.float32)
+        embeddings = type_matrix[row_index]
 
-    def _patterns_to_embeddings(self, patterns: List[Dict]) -> torch.Tensor:
-        """Convert patterns to neural network embeddings"""
-        # Simplified embedding creation for demo
-        embeddings = []
-
-        for pattern in patterns:
-            embedding = [
-                pattern.get("confidence", 0.5),
-                len(pattern.get("description", "")) / 100,  # Normalized description length
-                hash(pattern.get("type", "")) % 1000 / 1000,  # Type hash normalized
-                len(pattern.get("data", [])) / 10  # Data size normalized
-            ]
-            embeddings.append(embedding)
-
-        return torch.tensor(embeddings, dtype=torch.float32)
+        # Numeric features, filled column by column
+        embeddings[:, 0] = np.fromiter(
+            (pattern.get("confidence", 0.5) for pattern in patterns), dtype=np.float32, count=count
+        )
+        embeddings[:, 1] = np.fromiter(
+            (len(pattern.get("description", "")) for pattern in patterns), dtype=np.float32, count=count
+        ) / 100  # Normalized description length
+        embeddings[:, 2] = np.fromiter(
+            (len(pattern.get("data", [])) for pattern in patterns), dtype=np.float32, count=count
+        ) / 10  # Normalized data size
+
+        return embeddings
+
+    def _type_embedding(self, pattern_type: str) -> np.ndarray:
+        """Hashed feature row for a pattern type, stable across runs"""
+        row = self.pattern_embeddings.get(pattern_type)
+        if row is None:
+            buckets = self.input_size - EMBEDDING_NUMERIC_FEATURES
+            digest = hashlib.blake2b(pattern_type.encode("utf-8"), digest_size=4 * TYPE_HASH_PROBES).digest()
+            hashes = np.frombuffer(digest, dtype="<u4").astype(np.int64)
+            signs = np.where(hashes >> 31, -1.0, 1.0) / np.sqrt(TYPE_HASH_PROBES)
+
+            row = np.zeros(self.input_size, dtype=np.float32)
+            np.add.at(row, EMBEDDING_NUMERIC_FEATURES + hashes % buckets, signs)
+            self.pattern_embeddings[pattern_type] = row
+        return row
 
     def _get_consciousness_context(self, context: str) -> Optional[Dict]:
         """Get consciousness context for neural processing"""
@@ -176,12 +386,13 @@ class AdvancedPatternProcessor:
             }
         return None
 
-    def _interpret_neural_output(self, output: torch.Tensor, patterns: List[Dict], consciousness_state: Dict) -> List[str]:
+    def _interpret_neural_output(self, output: np.ndarray, patterns: List[Dict], consciousness_state: Dict) -> List[str]:
         """Interpret neural network output for human-readable insights"""
         insights = []
 
-        # Get top predictions
-        top_indices = torch.topk(output, min(3, len(output))).indices.tolist()
+        # Get top predictions for the first pattern
+        scores = output[0] if len(output) else output.reshape(-1)
+        top_indices = np.argsort(scores)[::-1][:min(3, len(scores))].tolist()
 
         for idx in top_indices:
             if idx < len(patterns):
@@ -231,5 +442,6 @@ def get_system_status():
             "embeddings_count": len(neural_processor.pattern_embeddings)
         },
         "consciousness_correlations": len(neural_processor.consciousness_correlations),
+        "backend": neural_processor.backend,
         "adaptation_events": neural_processor.neural_network.adaptation_counter if neural_processor.neural_network else 0
     }
@@ -0,0 +1,98 @@
+# Aetherium Result Cache
+
+"""
+Result Cache for the Aetherium System
+LRU cache of computed results with an optional time-to-live.
+
+Engines that see the same inputs again, such as prompt templates, can keep
+their results here under a key derived from the input. ``content_key``
+builds such a key from a fast digest of the text and a version string, so
+bumping the version retires every result computed under the old one.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_CACHE_ENTRIES = 1024
+
+_MISSING = object()
+
+def content_key(text: str, version: str = "") -> Tuple[str, bytes]:
+    """Cache key for a text under a version: the version and a 128-bit digest of the text"""
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return version, digest
+
+class ResultCache:
+    """LRU cache with optional expiry and hit, miss and eviction counters"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES, ttl_seconds: Optional[float] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            max_entries: Most results kept; 0 disables caching
+            ttl_seconds: Age after which a result is recomputed, None to keep until evicted
+            clock: Time source for expiry
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()  # key -> (stored at, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0    # Dropped to stay within max_entries
+        self.expirations = 0  # Dropped for outliving ttl_seconds
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The cached result for key, counting a hit or a miss"""
+        entry = self._entries.get(key, _MISSING)
+        if entry is not _MISSING and self.ttl_seconds is not None and self.clock() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            self.expirations += 1
+            entry = _MISSING
+
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any):
+        """Cache a result, evicting the least recently used beyond max_entries"""
+        if not self.max_entries:
+            return
+        self._entries[key] = (self.clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached result, keeping the counters"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size, hit rate and eviction statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
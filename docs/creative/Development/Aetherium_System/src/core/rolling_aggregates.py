@@ -0,0 +1,73 @@
+# Aetherium Rolling Aggregates
+
+"""
+Rolling Aggregates for the Aetherium System
+Running statistics maintained as entries are recorded and evicted.
+
+Status reports used to rescan whole histories on every call. These
+aggregates are updated in O(1) per recorded or evicted entry, so reading
+them is O(1).
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable
+
+class RefCounter:
+    """Distinct-key counter with reference counts for removal"""
+
+    def __init__(self, groups: Iterable[Iterable[Hashable]] = ()):
+        self._counts: Dict[Hashable, int] = {}
+        for keys in groups:
+            self.add(keys)
+
+    def add(self, keys: Iterable[Hashable]):
+        """Count one reference to each key"""
+        counts = self._counts
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+
+    def remove(self, keys: Iterable[Hashable]):
+        """Release one reference to each key"""
+        counts = self._counts
+        for key in keys:
+            remaining = counts[key] - 1
+            if remaining:
+                counts[key] = remaining
+            else:
+                del counts[key]
+
+    def count(self, key: Hashable) -> int:
+        """References held to a key"""
+        return self._counts.get(key, 0)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._counts
+
+class RollingMean:
+    """Mean of the most recent values in a fixed window"""
+
+    def __init__(self, window: int, values: Iterable[float] = ()):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self._values = deque(maxlen=window)
+        self._sum = 0
+        for value in values:
+            self.add(value)
+
+    def add(self, value: float):
+        """Record a value, dropping the oldest when the window is full"""
+        if len(self._values) == self._values.maxlen:
+            self._sum -= self._values[0]
+        self._values.append(value)
+        self._sum += value
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window, 0.0 when empty"""
+        return self._sum / len(self._values) if self._values else 0.0
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,175 @@
+# Aetherium State Journal
+
+"""
+State Journal for the Aetherium System
+Incremental, append-only persistence for engine state.
+
+A checkpoint appends one JSON line holding the engine's scalar state and only
+the history entries recorded since the previous checkpoint, so its cost grows
+with the delta instead of the total history. Every ``compact_every``
+checkpoints the full state is written as a snapshot and the journal is
+started over. Loading replays the snapshot followed by the journal.
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+
+class StateJournal:
+    """Snapshot plus append-only journal for an engine's persisted state"""
+
+    def __init__(self, engine: Any, filepath: str, compact_every: int = 100,
+                 histories: Iterable[str] = ("pattern_history", "reflection_log"),
+                 locked: Optional[Callable[[], ContextManager]] = None):
+        """
+        Args:
+            engine: Engine exposing get_state_dict/load_state and BoundedHistory attributes
+            filepath: Snapshot path; the journal lives next to it
+            compact_every: Checkpoints between full snapshots
+            histories: Names of the engine's append-only histories
+            locked: Returns a context manager that keeps the engine from
+                changing while a record is captured, for shared engines
+        """
+        self.engine = engine
+        self.locked = locked or nullcontext
+        self.filepath = filepath
+        self.journal_path = filepath + JOURNAL_SUFFIX
+        self.compact_every = compact_every
+        self.histories = tuple(histories)
+        self.seq = 0  # Sequence number of the last record written
+        self.checkpoints_since_compaction = 0
+        self._persisted: Optional[Dict[str, int]] = None  # History totals already on disk
+        self._journal_torn = False
+
+    def checkpoint(self):
+        """Persist the engine state, appending only what changed"""
+        if self._needs_compaction():
+            self.compact()
+            return
+
+        with self.locked():
+            record = self.engine.get_state_dict(include_histories=False)
+            totals = {}
+            for name in self.histories:
+                history = getattr(self.engine, name)
+                new_entries = min(history.total - self._persisted[name], len(history))
+                record[name] = history[len(history) - new_entries:] if new_entries > 0 else []
+                totals[name] = history.total
+
+        self.seq += 1
+        record["journal_seq"] = self.seq
+        record["history_totals"] = totals
+
+        with open(self.journal_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+        self._persisted = totals
+        self.checkpoints_since_compaction += 1
+
+    def compact(self):
+        """Write a full snapshot and start a fresh journal"""
+        with self.locked():
+            data = self.engine.get_state_dict()
+            persisted = {name: getattr(self.engine, name).total for name in self.histories}
+        data["journal_seq"] = self.seq
+
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Replace atomically; records up to journal_seq are skipped on replay
+        # should we stop before the old journal is removed.
+        tmp_path = self.filepath + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.filepath)
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+        self._persisted = persisted
+        self.checkpoints_since_compaction = 0
+        logger.info(f"State snapshot compacted to {self.filepath}")
+
+    def load(self) -> bool:
+        """
+        Replay snapshot plus journal into the engine
+
+        Returns:
+            True if any persisted state was found
+        """
+        if not os.path.exists(self.filepath) and not os.path.exists(self.journal_path):
+            return False
+
+        data: Dict[str, Any] = {}
+        if os.path.exists(self.filepath):
+            with open(self.filepath, "r") as f:
+                data = json.load(f)
+
+        self.seq = data.get("journal_seq", 0)
+        totals = dict(data.get("history_totals", {}))
+        replayed = {
+            name: deque(data.get(name, []), maxlen=getattr(self.engine, name).maxlen)
+            for name in self.histories
+        }
+        for name in self.histories:
+            totals.setdefault(name, len(data.get(name, [])))
+
+        self.checkpoints_since_compaction = 0
+        for record in self._read_journal():
+            if record.get("journal_seq", 0) <= self.seq:
+                continue  # Already folded into the snapshot
+
+            for name in self.histories:
+                new_entries = record["history_totals"][name] - totals[name]
+                entries = record.get(name, [])
+                if new_entries > 0 and entries:
+                    replayed[name].extend(entries[-new_entries:])
+                totals[name] = record["history_totals"][name]
+
+            data["state"] = record["state"]
+            self.seq = record["journal_seq"]
+            self.checkpoints_since_compaction += 1
+
+        for name in self.histories:
+            data[name] = list(replayed[name])
+        data["history_totals"] = totals
+
+        self.engine.load_state(data)
+        self._persisted = totals
+        if self._journal_torn:
+            # Appending after a partial line would corrupt the next record
+            self.checkpoints_since_compaction = self.compact_every
+        return True
+
+    def _needs_compaction(self) -> bool:
+        """Whether the next checkpoint should be a full snapshot"""
+        if self._persisted is None or self.checkpoints_since_compaction >= self.compact_every:
+            return True
+
+        # A history that was cleared cannot be expressed as an append
+        return any(getattr(self.engine, name).total < self._persisted[name] for name in self.histories)
+
+    def _read_journal(self):
+        """Yield journal records, stopping at a torn trailing write"""
+        self._journal_torn = False
+        if not os.path.exists(self.journal_path):
+            return
+
+        with open(self.journal_path, "r") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring incomplete journal record at {self.journal_path}:{line_number}")
+                    self._journal_torn = True
+                    return
@@ -0,0 +1,465 @@
+# Aetherium State Snapshot
+
+"""
+State Snapshot for the Aetherium System
+Versioned binary snapshots of enhanced engine state.
+
+A snapshot is a header followed by length-prefixed sections, written and
+read one block at a time:
+
+    header   MAGIC, format version (u16), flags (u16)
+    section  tag (u8), payload length (u64), payload
+    ...
+    end      tag 0
+
+Histories and the memory bank are stored in columns of blocks. Timestamps
+and scores are packed float arrays. Enum values, pattern names and memory
+ids are indexes into a string table that each block extends with the
+strings it introduces. Inputs and other free-form values go into one JSON
+blob per block. Readers skip sections with tags they do not know, so
+later versions can add sections without breaking older readers.
+
+Every number is fixed-width little-endian, like the header: string ids,
+counts and offsets u32, other integers i64, floats f64. Hosts of the other
+byte order swap columns on the way in and out, so a snapshot reads the
+same on any machine.
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from enum import Enum
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    from .enhanced_consciousness import EmotionalState, MemoryUnit, QuantumConsciousnessState, _json_default
+except ImportError:
+    # Fallback for direct execution
+    from enhanced_consciousness import EmotionalState, MemoryUnit, QuantumConsciousnessState, _json_default
+
+MAGIC = b"AETHSNAP"
+FORMAT_VERSION = 1
+BLOCK_SIZE = 4096  # Entries per block
+
+_HEADER = struct.Struct("<8sHH")
+_SECTION = struct.Struct("<BQ")
+_COUNT = struct.Struct("<I")
+_BLOB = struct.Struct("<Q")
+
+# Array typecodes of the fixed-width column types
+_U32 = "I" if array("I").itemsize == 4 else "L"
+_I64 = "q"
+_F64 = "d"
+assert array(_U32).itemsize == 4 and array(_I64).itemsize == 8 and array(_F64).itemsize == 8
+_SWAP = sys.byteorder != "little"
+
+# Section tags
+TAG_END = 0
+TAG_JSON = 1               # Named JSON section
+TAG_PATTERN_HISTORY = 2
+TAG_EMOTIONAL_HISTORY = 3
+TAG_MEMORY_BANK = 4
+
+PATTERN_ENTRY_KEYS = {"timestamp", "patterns", "complexity"}
+EMOTIONAL_ENTRY_KEYS = {"timestamp", "state"}
+MEMORY_CONTENT_KEYS = ("input", "patterns", "emotional_context", "consciousness_state")
+
+class SnapshotError(ValueError):
+    """Raised for files that are not readable snapshots"""
+
+def is_snapshot(filepath: str) -> bool:
+    """Whether a file starts with the snapshot magic bytes"""
+    with open(filepath, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+class _StringTable:
+    """String table shared by every block of one snapshot"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+        self._written = 0
+
+    def id(self, value: str) -> int:
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def pack_delta(self) -> bytes:
+        """Strings added since the last delta"""
+        new = [s.encode("utf-8") for s in self.strings[self._written:]]
+        self._written = len(self.strings)
+        return _COUNT.pack(len(new)) + _pack_array(_U32, map(len, new)) + b"".join(new)
+
+    def read_delta(self, payload: memoryview, offset: int) -> int:
+        (count,) = _COUNT.unpack_from(payload, offset)
+        offset += _COUNT.size
+        lengths, offset = _unpack_array(_U32, payload, offset, count)
+        for length in lengths:
+            self.strings.append(str(payload[offset:offset + length], "utf-8"))
+            offset += length
+        return offset
+
+def _pack_array(typecode: str, values: Iterable[Any]) -> bytes:
+    """A column of values as little-endian bytes"""
+    values = array(typecode, values)
+    if _SWAP:
+        values.byteswap()
+    return values.tobytes()
+
+def _unpack_array(typecode: str, payload: memoryview, offset: int, count: int) -> Tuple[array, int]:
+    """Read a little-endian column, returning it and the offset after it"""
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    values.frombytes(payload[offset:end])
+    if _SWAP:
+        values.byteswap()
+    return values, end
+
+def _pack_lists(lists: Iterable[Iterable[str]], table: _StringTable) -> bytes:
+    """Variable-length string lists as offsets plus string ids"""
+    offsets = array(_U32, [0])
+    ids = array(_U32)
+    for items in lists:
+        ids.extend(table.id(item) for item in items)
+        offsets.append(len(ids))
+    return _pack_array(_U32, offsets) + _COUNT.pack(len(ids)) + _pack_array(_U32, ids)
+
+class _Reader:
+    """Sequential reads from a block payload"""
+
+    def __init__(self, payload: bytes, table: _StringTable):
+        self.view = memoryview(payload)
+        self.table = table
+        self.offset = table.read_delta(self.view, 0)
+
+    def count(self) -> int:
+        (value,) = _COUNT.unpack_from(self.view, self.offset)
+        self.offset += _COUNT.size
+        return value
+
+    def array(self, typecode: str, count: int) -> array:
+        values, self.offset = _unpack_array(typecode, self.view, self.offset, count)
+        return values
+
+    def strings(self, count: int) -> List[str]:
+        strings = self.table.strings
+        return [strings[i] for i in self.array(_U32, count)]
+
+    def enums(self, count: int, enum_class: type) -> List[Enum]:
+        ids = self.array(_U32, count)
+        members = {i: enum_class(self.table.strings[i]) for i in set(ids)}
+        return [members[i] for i in ids]
+
+    def lists(self, count: int) -> List[List[str]]:
+        offsets = self.array(_U32, count + 1)
+        ids = self.array(_U32, self.count())
+        strings = self.table.strings
+        return [[strings[i] for i in ids[offsets[k]:offsets[k + 1]]] for k in range(count)]
+
+    def blob(self) -> Any:
+        (size,) = _BLOB.unpack_from(self.view, self.offset)
+        self.offset += _BLOB.size
+        value = json.loads(str(self.view[self.offset:self.offset + size], "utf-8"))
+        self.offset += size
+        return value
+
+def _blob(value: Any) -> bytes:
+    encoded = json.dumps(value, default=_json_default).encode("utf-8")
+    return _BLOB.pack(len(encoded)) + encoded
+
+def _blocks(entries: List[Any]) -> Iterator[List[Any]]:
+    for start in range(0, len(entries), BLOCK_SIZE):
+        yield entries[start:start + BLOCK_SIZE]
+
+class SnapshotWriter:
+    """Streams sections of a snapshot to a binary file"""
+
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.table = _StringTable()
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0))
+
+    def _section(self, tag: int, payload: bytes):
+        self.f.write(_SECTION.pack(tag, len(payload)))
+        self.f.write(payload)
+
+    def write_json(self, name: str, value: Any):
+        """Write a named free-form section"""
+        encoded = name.encode("utf-8")
+        self._section(TAG_JSON, _COUNT.pack(len(encoded)) + encoded + _blob(value))
+
+    def write_pattern_history(self, entries: List[Dict[str, Any]]):
+        """Write pattern history entries in columnar blocks"""
+        if any(entry.keys() != PATTERN_ENTRY_KEYS for entry in entries):
+            self.write_json("pattern_history", entries)
+            return
+
+        for block in _blocks(entries):
+            lists = _pack_lists((entry["patterns"] for entry in block), self.table)
+            self._section(TAG_PATTERN_HISTORY, b"".join([
+                self.table.pack_delta(),
+                _COUNT.pack(len(block)),
+                _pack_array(_F64, [entry["timestamp"] for entry in block]),
+                _pack_array(_I64, [entry["complexity"] for entry in block]),
+                lists
+            ]))
+
+    def write_emotional_history(self, entries: List[Dict[str, Any]]):
+        """Write emotional history entries in columnar blocks"""
+        if any(entry.keys() != EMOTIONAL_ENTRY_KEYS for entry in entries):
+            self.write_json("emotional_history", entries)
+            return
+
+        for block in _blocks(entries):
+            states = _pack_array(_U32, [self.table.id(_enum_value(entry["state"])) for entry in block])
+            self._section(TAG_EMOTIONAL_HISTORY, b"".join([
+                self.table.pack_delta(),
+                _COUNT.pack(len(block)),
+                _pack_array(_F64, [entry["timestamp"] for entry in block]),
+                states
+            ]))
+
+    def write_memory_bank(self, memory_bank: Dict[str, MemoryUnit]):
+        """Write memories in columnar blocks"""
+        memories = list(memory_bank.values())
+        conforming = all(
+            isinstance(memory, MemoryUnit) and isinstance(memory.content, dict)
+            and all(key in memory.content for key in MEMORY_CONTENT_KEYS)
+            for memory in memories
+        )
+        if not conforming:
+            self.write_json("memory_bank", memory_bank)
+            return
+
+        table = self.table
+        for block in _blocks(memories):
+            ids = _pack_array(_U32, [table.id(m.id) for m in block])
+            emotions = _pack_array(_U32, [table.id(_enum_value(m.emotional_context)) for m in block])
+            content_emotions = _pack_array(_U32, [table.id(_enum_value(m.content["emotional_context"])) for m in block])
+            levels = _pack_array(_U32, [table.id(_enum_value(m.content["consciousness_state"])) for m in block])
+            patterns = _pack_lists((m.content["patterns"] for m in block), table)
+            associations = _pack_lists((m.associations for m in block), table)
+            extras = [
+                {k: v for k, v in m.content.items() if k not in MEMORY_CONTENT_KEYS} or None
+                for m in block
+            ]
+
+            self._section(TAG_MEMORY_BANK, b"".join([
+                table.pack_delta(),
+                _COUNT.pack(len(block)),
+                ids,
+                _pack_array(_F64, [m.timestamp for m in block]),
+                _pack_array(_F64, [m.importance for m in block]),
+                _pack_array(_I64, [m.access_count for m in block]),
+                emotions,
+                content_emotions,
+                levels,
+                patterns,
+                associations,
+                _blob([m.content["input"] for m in block]),
+                _blob(extras if any(extras) else None)
+            ]))
+
+    def close(self):
+        """Write the end marker"""
+        self._section(TAG_END, b"")
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+def write_snapshot(filepath: str, data: Dict[str, Any]):
+    """
+    Write an engine state dict as a binary snapshot
+
+    Args:
+        filepath: Destination; replaced atomically
+        data: State dict from EnhancedConsciousnessEngine.get_state_dict()
+    """
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as f:
+        writer = SnapshotWriter(f)
+        writer.write_json("state", data["state"])
+        writer.write_pattern_history(data.get("pattern_history", []))
+        writer.write_emotional_history(data.get("emotional_history", []))
+        writer.write_memory_bank(data.get("memory_bank", {}))
+        for name in ("reflection_log", "creative_outputs", "consciousness_map", "history_totals", "memory_sizes"):
+            if name in data:
+                writer.write_json(name, data[name])
+        writer.close()
+    os.replace(tmp_path, filepath)
+
+def read_sections(f: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+    """Yield (tag, payload) for each section after validating the header"""
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise SnapshotError("Truncated snapshot header")
+    magic, version, _flags = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise SnapshotError("Not an Aetherium state snapshot")
+    if version > FORMAT_VERSION:
+        raise SnapshotError(f"Snapshot format {version} is newer than supported {FORMAT_VERSION}")
+
+    while True:
+        head = f.read(_SECTION.size)
+        if len(head) < _SECTION.size:
+            raise SnapshotError("Snapshot ended without an end marker")
+        tag, length = _SECTION.unpack(head)
+        if tag == TAG_END:
+            return
+        payload = f.read(length)
+        if len(payload) < length:
+            raise SnapshotError("Truncated snapshot section")
+        yield tag, payload
+
+def read_snapshot(filepath: str) -> Dict[str, Any]:
+    """
+    Read a binary snapshot into a state dict
+
+    Returns:
+        Dict in the shape of get_state_dict(), with MemoryUnit values in memory_bank
+    """
+    table = _StringTable()
+    data: Dict[str, Any] = {"pattern_history": [], "emotional_history": [], "memory_bank": {}}
+
+    with open(filepath, "rb") as f:
+        for tag, payload in read_sections(f):
+            if tag == TAG_JSON:
+                (size,) = _COUNT.unpack_from(payload, 0)
+                name = payload[_COUNT.size:_COUNT.size + size].decode("utf-8")
+                (blob_size,) = _BLOB.unpack_from(payload, _COUNT.size + size)
+                start = _COUNT.size + size + _BLOB.size
+                data[name] = json.loads(payload[start:start + blob_size].decode("utf-8"))
+            elif tag == TAG_PATTERN_HISTORY:
+                _read_pattern_block(_Reader(payload, table), data["pattern_history"])
+            elif tag == TAG_EMOTIONAL_HISTORY:
+                _read_emotional_block(_Reader(payload, table), data["emotional_history"])
+            elif tag == TAG_MEMORY_BANK:
+                _read_memory_block(_Reader(payload, table), data["memory_bank"])
+            # Unknown tags are skipped for forward compatibility
+
+    return data
+
+def _read_pattern_block(reader: _Reader, entries: List[Dict[str, Any]]):
+    count = reader.count()
+    timestamps = reader.array(_F64, count)
+    complexities = reader.array(_I64, count)
+    patterns = reader.lists(count)
+    entries.extend(
+        {"timestamp": timestamps[i], "patterns": patterns[i], "complexity": complexities[i]}
+        for i in range(count)
+    )
+
+def _read_emotional_block(reader: _Reader, entries: List[Dict[str, Any]]):
+    count = reader.count()
+    timestamps = reader.array(_F64, count)
+    states = reader.enums(count, EmotionalState)
+    entries.extend({"timestamp": timestamps[i], "state": states[i]} for i in range(count))
+
+def _read_memory_block(reader: _Reader, memories: Dict[str, MemoryUnit]):
+    count = reader.count()
+    ids = reader.strings(count)
+    timestamps = reader.array(_F64, count)
+    importance = reader.array(_F64, count)
+    access_counts = reader.array(_I64, count)
+    emotions = reader.enums(count, EmotionalState)
+    content_emotions = reader.enums(count, EmotionalState)
+    levels = reader.enums(count, QuantumConsciousnessState)
+    patterns = reader.lists(count)
+    associations = reader.lists(count)
+    inputs = reader.blob()
+    extras = reader.blob() or [None] * count
+
+    for i in range(count):
+        content = {
+            "input": inputs[i],
+            "patterns": patterns[i],
+            "emotional_context": content_emotions[i],
+            "consciousness_state": levels[i]
+        }
+        if extras[i]:
+            content.update(extras[i])
+        memories[ids[i]] = MemoryUnit(
+            id=ids[i],
+            timestamp=timestamps[i],
+            content=content,
+            emotional_context=emotions[i],
+            importance=importance[i],
+            access_count=access_counts[i],
+            associations=associations[i]
+        )
+
+if __name__ == "__main__":
+    import gc
+    import logging
+    import tempfile
+    import time
+
+    try:
+        from .enhanced_consciousness import EnhancedConsciousnessEngine
+        from .bounded_history import BoundedHistory
+    except ImportError:
+        # Fallback for direct execution
+        from enhanced_consciousness import EnhancedConsciousnessEngine
+        from bounded_history import BoundedHistory
+
+    # Save and load cost: indented JSON as save_enhanced_state writes it, compact JSON, snapshot
+    logging.basicConfig(level=logging.WARNING)
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    def new_engine() -> "EnhancedConsciousnessEngine":
+        engine = EnhancedConsciousnessEngine(memory_budget=None)
+        engine.pattern_history = BoundedHistory(entries, on_evict=engine._on_pattern_entry_evicted)
+        return engine
+
+    print("💾 Aetherium State Snapshot Benchmark")
+    print("=" * 50)
+    engine = new_engine()
+    contexts = ["philosophical", "creative", "emotional", "quantum"]
+    for i in range(entries):
+        engine.process_advanced_input({"query": f"Create a novel synthesis of awareness {i}",
+                                       "context": contexts[i % len(contexts)]})
+    expected = engine.get_state_dict()
+    print(f"{len(expected['memory_bank'])} memories, {len(expected['pattern_history'])} pattern history entries\n")
+
+    def dump_json(indent):
+        def dump(filepath: str):
+            with open(filepath, "w") as f:
+                json.dump(engine.get_state_dict(), f, indent=indent, default=_json_default)
+        return dump
+
+    def load_json(filepath: str) -> Dict[str, Any]:
+        with open(filepath) as f:
+            return json.load(f)
+
+    formats = (
+        ("JSON indent=4", dump_json(4), load_json),
+        ("JSON compact", dump_json(None), load_json),
+        ("snapshot", lambda filepath: write_snapshot(filepath, engine.get_state_dict()), read_snapshot)
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for name, write, read in formats:
+            filepath = os.path.join(directory, name.replace(" ", "_"))
+            gc.collect()
+            start = time.perf_counter()
+            write(filepath)
+            written = time.perf_counter() - start
+            gc.collect()
+            start = time.perf_counter()
+            data = read(filepath)
+            read_time = time.perf_counter() - start
+
+            restored = new_engine()
+            restored.load_state(data)
+            assert restored.get_state_dict() == expected, f"{name} did not round-trip"
+            del data, restored
+            print(f"  {name:14s} write {written * 1000:7.0f} ms, read {read_time * 1000:7.0f} ms, "
+                  f"{os.path.getsize(filepath) / 2**20:6.1f} MiB")
@@ -8,22 +8,87 @@ Implements sophisticated pattern detection and analysis with:
 - Temporal pattern tracking
 - Emergent pattern discovery
 - Machine learning integration
+
+Bulk corpora can be analyzed with analyze_patterns_parallel, which runs
+detection and scoring in a process pool. It merges the detected patterns
+into the calling recognizer's database and evolution history in input
+order.
+
+Documents too large to hold as one string can be passed to analyze_stream
+as an iterable of chunks. Detection only asks which model words occur and
+what the first few regex matches are, so the stream is scanned with a
+small window carried across chunk boundaries and gives the same result as
+analyzing the joined text.
+
+Results of analyze_patterns are cached by a digest of the input and the
+version of the recognition models, so repeated inputs such as prompt
+templates are only analyzed once. Unless track_cached_results is off, a
+hit is still recorded like a fresh analysis: copies of the cached patterns
+with new ids and timestamps are stored, snapshotted and clustered, and the
+result carries the new ids, cluster ids and timestamp.
+
+Every recorded pattern also joins a long-lived cluster in pattern_clusters.
+Clustering works on feature vectors in batches with NumPy and grows the
+clusters incrementally, so it never revisits earlier patterns.
 """
 
 import time
 import json
 import hashlib
+import pickle
+import heapq
+import os
 import re
-from typing import Dict, List, Any, Optional, Tuple, Set
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple, Set, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from ..core.engine_pool import EnginePool
+    from ..core.bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+    from ..core.result_cache import ResultCache, content_key, DEFAULT_CACHE_ENTRIES
+except ImportError:
+    # Fallback for standalone execution
+    import sys
+    import os
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+    from engine_pool import EnginePool
+    from bounded_history import BoundedHistory, DEFAULT_HISTORY_SIZE
+    from result_cache import ResultCache, content_key, DEFAULT_CACHE_ENTRIES
+
+# Sibling modules resolve relatively whenever protocols is imported as a
+# package, even from a src directory that is not one itself
+try:
+    from .pattern_store import PatternStore, DEFAULT_BUCKET_SECONDS
+    from .pattern_table import PatternTable
+    from .pattern_clustering import LeaderClustering, DEFAULT_CLUSTER_RADIUS, DEFAULT_MAX_CLUSTERS
+except ImportError:
+    # Fallback for direct execution, with this directory on the path
+    from pattern_store import PatternStore, DEFAULT_BUCKET_SECONDS
+    from pattern_table import PatternTable
+    from pattern_clustering import LeaderClustering, DEFAULT_CLUSTER_RADIUS, DEFAULT_MAX_CLUSTERS
+
 logger = logging.getLogger(__name__)
 
+# Structural cues checked outside the recognition models
+LIST_MARKERS = ["1.", "2.", "•", "-", "*"]
+HIERARCHY_WORDS = ["level", "layer", "hierarchy", "nested"]
+RECURSION_WORDS = ["recursive", "self-referential"]
+
+# Pattern pairs scoring above this are reported as correlated
+CORRELATION_THRESHOLD = 0.5
+
+# Leading matches kept for each model regex
+REGEX_MATCH_LIMIT = 3
+
+# analyze_stream resolves regex matches exactly across chunk boundaries as
+# long as no match, or failed attempt, spans more characters than this
+STREAM_REGEX_WINDOW = 4096
+
 class PatternType(Enum):
     """Types of patterns that can be detected"""
     LINGUISTIC = "linguistic"
@@ -45,6 +110,15 @@ class PatternComplexity(Enum):
     HIGHLY_COMPLEX = "highly_complex"
     TRANSCENDENT = "transcendent"
 
+# Numerical score of each complexity level
+COMPLEXITY_SCORES = {
+    PatternComplexity.SIMPLE: 0.2,
+    PatternComplexity.MODERATE: 0.4,
+    PatternComplexity.COMPLEX: 0.6,
+    PatternComplexity.HIGHLY_COMPLEX: 0.8,
+    PatternComplexity.TRANSCENDENT: 1.0
+}
+
 @dataclass
 class Pattern:
     """Individual pattern with metadata"""
@@ -59,6 +133,222 @@ class Pattern:
     emergence_score: float = 0.0
     frequency: int = 1
 
+class PatternIdAllocator:
+    """
+    Process-unique ids from a counter
+
+    An id is the pattern's base name, the allocating process id and a
+    sequence number. Forked pool workers take their own process id, so ids
+    they send back never collide with the parent's.
+    """
+
+    def __init__(self):
+        self._sequence = count()
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._tag = f"#{os.getpid():x}."
+
+    def allocate(self, base: str) -> str:
+        return f"{base}{self._tag}{next(self._sequence):x}"
+
+    def reissue(self, pattern_id: str) -> str:
+        """A new id with the same base as an allocated one"""
+        return self.allocate(pattern_id.rpartition("#")[0] or pattern_id)
+
+_pattern_ids = PatternIdAllocator()
+
+@dataclass
+class TextView:
+    """A document and its normalized form, computed once and shared by every detector"""
+    text: str
+    lowered: str
+    ascii: bool  # Lowercasing preserved every offset and matched case-insensitively
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextView":
+        return cls(text=text, lowered=text.lower(), ascii=text.isascii())
+
+    def first_matches(self, name: str, regex: "CompiledRegex", limit: int) -> List[str]:
+        """Up to limit leftmost matches of a model regex"""
+        return regex.first_matches(self, limit)
+
+@dataclass
+class CompiledRegex:
+    """A model regex ready to run on a TextView"""
+    folded: Optional[re.Pattern]  # Case-sensitive form for lowercased ASCII text
+    ignorecase: re.Pattern        # Exact form for any other text
+
+    @classmethod
+    def compile(cls, regex: str) -> "CompiledRegex":
+        # The case-sensitive form only stands in when every literal is lowercase
+        literals = re.sub(r"\\.", "", regex)
+        folded = re.compile(regex) if literals == literals.lower() else None
+        return cls(folded=folded, ignorecase=re.compile(regex, re.IGNORECASE))
+
+    def first_matches(self, view: TextView, limit: int) -> List[str]:
+        """Up to limit leftmost matches, as re.findall would list them"""
+        if view.ascii and self.folded is not None:
+            # IGNORECASE defeats the regex engine's literal search; scanning
+            # the lowered text and slicing the original keeps the caller's case
+            spans = islice(self.folded.finditer(view.lowered), limit)
+            return [view.text[m.start():m.end()] for m in spans]
+        return [m.group(0) for m in islice(self.ignorecase.finditer(view.text), limit)]
+
+@dataclass
+class StreamView:
+    """
+    What the detectors read from a document scanned in chunks
+
+    Detectors only test model words with ``in``, so sets of the words that
+    occur stand in for the lowered and original text.
+    """
+    text: Set[str]                 # List markers found in the original text
+    lowered: Set[str]              # Model words found in the lowered text
+    matches: Dict[str, List[str]]  # Leading matches by model regex name
+
+    def first_matches(self, name: str, regex: CompiledRegex, limit: int) -> List[str]:
+        return self.matches.get(name, [])[:limit]
+
+class TextStream:
+    """
+    Incremental scan of a document fed in chunks
+
+    Word searches carry the last few characters of each chunk into the
+    next, so words spanning a boundary are found. Regex searches keep the
+    last ``window`` characters and only settle matches that start before
+    them, so later text can still extend or precede a match near the end.
+    Memory stays bounded by the window and the chunk size.
+    """
+
+    def __init__(self, words: Iterable[str], markers: Iterable[str],
+                 regexes: Dict[str, CompiledRegex], limit: int = REGEX_MATCH_LIMIT,
+                 window: int = STREAM_REGEX_WINDOW):
+        """
+        Args:
+            words: Lowercase words to look for in the lowered text
+            markers: Strings to look for in the original text
+            regexes: Model regexes by name
+            limit: Leading matches kept per regex
+            window: Characters held back for regex matches near a chunk end
+        """
+        self._words = set(words)      # Not found yet
+        self._markers = set(markers)
+        self.found_words: Set[str] = set()
+        self.found_markers: Set[str] = set()
+        self._word_overlap = max((len(word) for word in self._words), default=1) - 1
+        self._marker_overlap = max((len(marker) for marker in self._markers), default=1) - 1
+        self._lowered_tail = ""
+        self._text_tail = ""
+
+        self.limit = limit
+        self.window = window
+        self._regexes = regexes
+        self.matches: Dict[str, List[str]] = {name: [] for name in regexes}
+        self._buffers: Dict[str, Tuple[str, int]] = {name: ("", 0) for name in regexes}  # (held text, resume offset)
+        self.length = 0
+
+    def feed(self, chunk: str):
+        """Scan the next chunk of the document"""
+        self.length += len(chunk)
+        if self._words:
+            lowered = self._lowered_tail + chunk.lower()
+            self.found_words.update(word for word in self._words if word in lowered)
+            self._words -= self.found_words
+            self._lowered_tail = lowered[-self._word_overlap:] if self._word_overlap else ""
+        if self._markers:
+            text = self._text_tail + chunk
+            self.found_markers.update(marker for marker in self._markers if marker in text)
+            self._markers -= self.found_markers
+            self._text_tail = text[-self._marker_overlap:] if self._marker_overlap else ""
+
+        for name in list(self._buffers):
+            self._scan(name, chunk, final=False)
+
+    def close(self) -> StreamView:
+        """Settle the matches held back at the end and return the detectors' view"""
+        for name in list(self._buffers):
+            self._scan(name, "", final=True)
+        return StreamView(text=self.found_markers, lowered=self.found_words, matches=self.matches)
+
+    def _scan(self, name: str, chunk: str, final: bool):
+        held, pos = self._buffers[name]
+        buffer = held + chunk
+        compiled = self._regexes[name]
+        matches = self.matches[name]
+
+        # Same choice as CompiledRegex.first_matches: the case-sensitive
+        # form on lowered ASCII text, with offsets into the original
+        if compiled.folded is not None and buffer.isascii():
+            regex, searched = compiled.folded, buffer.lower()
+        else:
+            regex, searched = compiled.ignorecase, buffer
+
+        # Matches starting inside the last window may still change
+        settled = len(buffer) if final else len(buffer) - self.window
+        while len(matches) < self.limit:
+            match = regex.search(searched, pos)
+            if match is None or match.start() >= settled:
+                break
+            matches.append(buffer[match.start():match.end()])
+            pos = match.end() if match.end() > match.start() else match.end() + 1
+
+        if len(matches) >= self.limit or final:
+            del self._buffers[name]
+            return
+        # Nothing settled starts before the window; keep it, and any text
+        # before the resume offset, as lookbehind context
+        start = max(0, min(settled, pos))
+        self._buffers[name] = (buffer[start:], max(pos, settled) - start)
+
+@dataclass
+class PatternSummary:
+    """
+    Counts and totals over one analysis' patterns, gathered in a single pass
+
+    Dominant patterns, the complexity analysis, emergence potential and the
+    evolution entry are all derived from it instead of rescanning the list.
+    """
+    count: int = 0
+    type_counts: Counter = field(default_factory=Counter)        # PatternType -> patterns
+    complexity_counts: Counter = field(default_factory=Counter)  # PatternComplexity -> patterns
+    content_counts: Counter = field(default_factory=Counter)     # Content -> patterns
+    first_by_content: Dict[str, Pattern] = field(default_factory=dict)
+    complexity_total: float = 0.0  # Sum of complexity scores, in pattern order
+    max_emergence: float = 0.0
+    features: Any = None  # LeaderClustering.features rows, shared by both clusterings
+
+    @classmethod
+    def of(cls, patterns: List[Pattern]) -> "PatternSummary":
+        summary = cls(count=len(patterns))
+        type_counts = summary.type_counts
+        complexity_counts = summary.complexity_counts
+        content_counts = summary.content_counts
+        first_by_content = summary.first_by_content
+        complexity_total = 0.0
+        max_emergence = patterns[0].emergence_score if patterns else 0.0
+
+        for pattern in patterns:
+            type_counts[pattern.type] += 1
+            complexity_counts[pattern.complexity] += 1
+            complexity_total += COMPLEXITY_SCORES.get(pattern.complexity, 0.5)
+            if pattern.emergence_score > max_emergence:
+                max_emergence = pattern.emergence_score
+            content = pattern.content
+            if content not in first_by_content:
+                first_by_content[content] = pattern
+            content_counts[content] += 1
+
+        summary.complexity_total = complexity_total
+        summary.max_emergence = max_emergence
+        return summary
+
+    @property
+    def average_complexity(self) -> float:
+        return self.complexity_total / self.count if self.count else 0
+
 @dataclass
 class PatternCluster:
     """Cluster of related patterns"""
@@ -69,17 +359,46 @@ class PatternCluster:
     emergence_potential: float
     domain: str
 
+# Detected patterns, the results built from them, and their summary
+Analysis = Tuple[List[Pattern], Dict[str, Any], PatternSummary]
+
 class AdvancedPatternRecognition:
     """Advanced pattern recognition system with ML capabilities"""
     
-    def __init__(self):
-        self.pattern_database = {}
-        self.pattern_clusters = {}
-        self.temporal_patterns = defaultdict(list)
+    def __init__(self, retention_seconds: Optional[float] = None,
+                 bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+                 hot_buckets: Optional[int] = None, spill_dir: Optional[str] = None,
+                 evolution_size: int = DEFAULT_HISTORY_SIZE, compact_patterns: bool = True,
+                 cache_size: int = DEFAULT_CACHE_ENTRIES, cache_ttl: Optional[float] = None,
+                 track_cached_results: bool = True, cluster_radius: float = DEFAULT_CLUSTER_RADIUS,
+                 max_clusters: int = DEFAULT_MAX_CLUSTERS):
+        """
+        Args:
+            retention_seconds: How long stored patterns are kept, None for always
+            bucket_seconds: Time span of each pattern store bucket
+            hot_buckets: Newest buckets kept in memory, None to never spill to disk
+            spill_dir: Directory for spilled pattern buckets
+            evolution_size: Evolution entries retained
+            compact_patterns: Keep stored patterns in columnar tables, read back as views
+            cache_size: Analysis results cached by input, 0 to disable the cache
+            cache_ttl: Seconds a cached result stays valid, None for no expiry
+            track_cached_results: Record cache hits in the evolution history and database,
+                as copies of the cached patterns
+            cluster_radius: Feature distance within which a pattern joins a cluster
+            max_clusters: Clusters formed before patterns only join existing ones
+        """
+        # Patterns by id, partitioned by time; also records each analysis as a snapshot
+        self.pattern_database = PatternStore(bucket_seconds, retention_seconds, hot_buckets, spill_dir,
+                                             compact=compact_patterns)
+        # Clusters of every recorded pattern, grown across analyses
+        self.pattern_clusters = LeaderClustering(PatternType, COMPLEXITY_SCORES, cluster_radius, max_clusters)
         self.cross_domain_correlations = defaultdict(set)
         self.emergence_tracker = {}
-        self.pattern_evolution = []
+        self.pattern_evolution = BoundedHistory(evolution_size)
+        self.result_cache = ResultCache(cache_size, cache_ttl)
+        self.track_cached_results = track_cached_results
         self.recognition_models = self._initialize_models()
+        self._compile_models()
         
     def _initialize_models(self) -> Dict[str, Any]:
         """Initialize pattern recognition models"""
@@ -90,6 +409,48 @@ class AdvancedPatternRecognition:
             "temporal": self._create_temporal_model(),
             "emergent": self._create_emergent_model()
         }
+
+    def reload_models(self):
+        """
+        Recompile the recognition models after editing recognition_models
+
+        The model version changes with the models, so results cached under
+        the old models are no longer returned.
+        """
+        previous = self.model_version
+        self._compile_models()
+        if self.model_version != previous:
+            self.result_cache.clear()
+            logger.info(f"Recognition models reloaded, version {self.model_version}")
+
+    def _compile_models(self):
+        """Lowercase the keyword tables and compile the regexes of every model once"""
+        # Part of every result cache key; the JSON also seeds worker processes
+        self._models_json = json.dumps(self.recognition_models, sort_keys=True)
+        self.model_version = hashlib.blake2b(self._models_json.encode("utf-8"), digest_size=8).hexdigest()
+
+        def lowered(table: Dict[str, List[str]]) -> Dict[str, List[str]]:
+            return {name: [word.lower() for word in words] for name, words in table.items()}
+
+        models = self.recognition_models
+        self._keywords = {
+            "linguistic": lowered(models["linguistic"]["keywords"]),
+            "domains": lowered(models["semantic"]["domains"]),
+            "relationships": lowered(models["semantic"]["relationships"]),
+            "time_markers": lowered(models["temporal"]["time_markers"]),
+            "sequences": lowered(models["temporal"]["sequences"]),
+            "emergence_indicators": lowered(models["emergent"]["emergence_indicators"]),
+            "complexity_markers": lowered(models["emergent"]["complexity_markers"])
+        }
+        self._regexes = {
+            name: CompiledRegex.compile(regex)
+            for name, regex in models["linguistic"]["patterns"].items()
+        }
+
+        # Every word a detector tests against the lowered text, for analyze_stream
+        self._stream_words = {word for table in self._keywords.values()
+                              for words in table.values() for word in words}
+        self._stream_words.update(word.lower() for word in HIERARCHY_WORDS + RECURSION_WORDS)
     
     def _create_linguistic_model(self) -> Dict[str, Any]:
         """Create linguistic pattern recognition model"""
@@ -191,13 +552,117 @@ class AdvancedPatternRecognition:
         
         # Convert input to string for analysis
         input_str = str(input_data) if not isinstance(input_data, str) else input_data
-        
+
+        key = content_key(input_str, self.model_version)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            # Results are cached pickled, so every caller gets a fresh copy
+            all_patterns, pickled, summary = cached
+            results = pickle.loads(pickled)
+            if not self.track_cached_results:
+                results["pattern_evolution"] = self._get_recent_evolution()
+                return results
+            all_patterns = self._reissue_patterns(all_patterns, results)
+        else:
+            all_patterns, results, summary = self._analyze_text(input_str)
+            self.result_cache.put(key, (all_patterns, pickle.dumps(results, pickle.HIGHEST_PROTOCOL), summary))
+
+        return self._merge_analysis(all_patterns, results, summary)
+
+    def _reissue_patterns(self, patterns: List[Pattern], results: Dict[str, Any]) -> List[Pattern]:
+        """
+        Copies of cached patterns as a new occurrence, with fresh ids and timestamps
+
+        The pattern entries in results are renamed to match, so their ids
+        resolve in the pattern database like those of a fresh analysis.
+        Cluster ids and the result timestamp are reissued the same way.
+        """
+        timestamp = time.time()
+        copies = [
+            replace(pattern, id=_pattern_ids.reissue(pattern.id), timestamp=timestamp,
+                    context=dict(pattern.context), correlations=list(pattern.correlations))
+            for pattern in patterns
+        ]
+        renamed = {pattern.id: copy.id for pattern, copy in zip(patterns, copies)}
+        for entry in results["patterns"]:
+            entry["id"] = renamed.get(entry["id"], entry["id"])
+        for cluster in results["clusters"]:
+            cluster["cluster_id"] = _pattern_ids.reissue(cluster["cluster_id"])
+        results["timestamp"] = timestamp
+        return copies
+
+    def analyze_patterns_parallel(self, texts: Iterable[Any], workers: Optional[int] = None,
+                                  chunksize: int = 16) -> List[Dict[str, Any]]:
+        """
+        Analyze many inputs in a process pool
+
+        Detection and scoring run in worker processes, each holding its own
+        recognizer compiled from this one's models. The patterns are merged into this recognizer
+        in input order, so the stored state matches calling analyze_patterns
+        on each input in turn.
+
+        Args:
+            texts: Inputs to analyze; non-strings are converted with str()
+            workers: Worker processes, defaults to the CPU count; 1 runs in-process
+            chunksize: Inputs sent to a worker per task
+
+        Returns:
+            Analysis results in input order, as returned by analyze_patterns
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+
+        inputs = (text if isinstance(text, str) else str(text) for text in texts)
+        if workers <= 1:
+            analyses = (self._analyze_text(text) for text in inputs)
+            results = [self._merge_analysis(*analysis) for analysis in analyses]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self._models_json,)) as executor:
+                results = [self._merge_analysis(*analysis)
+                           for analysis in _map_chunks(executor, inputs, chunksize, workers * 2)]
+
+        logger.info(f"Parallel pattern analysis complete: {len(results)} inputs, {workers} workers")
+        return results
+
+    def analyze_stream(self, chunks: Iterable[str], context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Pattern analysis of a document given as consecutive text chunks
+
+        The chunks are scanned as they arrive and never joined, so memory
+        stays bounded by the chunk size. Detected patterns depend only on
+        which model words occur and on the leading regex matches, so the
+        result is the same as analyze_patterns on the joined text.
+
+        Args:
+            chunks: Consecutive pieces of the document
+            context: Optional context for analysis
+
+        Returns:
+            Detailed pattern analysis results, as from analyze_patterns
+        """
+        stream = TextStream(self._stream_words, LIST_MARKERS, self._regexes)
+        for chunk in chunks:
+            stream.feed(chunk)
+
+        analysis = self._analyze_view(stream.close())
+        logger.debug(f"Streamed {stream.length} characters")
+        return self._merge_analysis(*analysis)
+
+    def _analyze_text(self, input_str: str) -> Analysis:
+        """Detect and score patterns without touching stored state"""
+        return self._analyze_view(TextView.from_text(input_str))
+
+    def _analyze_view(self, view: Union[TextView, StreamView]) -> Analysis:
+        """Detect and score patterns in a prepared view of a document"""
         # Multi-dimensional pattern detection
-        linguistic_patterns = self._detect_linguistic_patterns(input_str)
-        semantic_patterns = self._detect_semantic_patterns(input_str)
-        structural_patterns = self._detect_structural_patterns(input_str)
-        temporal_patterns = self._detect_temporal_patterns(input_str)
-        emergent_patterns = self._detect_emergent_patterns(input_str)
+        linguistic_patterns = self._detect_linguistic_patterns(view)
+        semantic_patterns = self._detect_semantic_patterns(view)
+        structural_patterns = self._detect_structural_patterns(view)
+        temporal_patterns = self._detect_temporal_patterns(view)
+        emergent_patterns = self._detect_emergent_patterns(view)
         
         # Combine all patterns
         all_patterns = (
@@ -205,18 +670,17 @@ class AdvancedPatternRecognition:
             structural_patterns + temporal_patterns + 
             emergent_patterns
         )
+        summary = PatternSummary.of(all_patterns)
+        summary.features = self.pattern_clusters.features(all_patterns)
         
         # Cluster related patterns
-        clusters = self._cluster_patterns(all_patterns)
+        clusters = self._cluster_patterns(all_patterns, summary.features)
         
         # Detect cross-domain correlations
-        correlations = self._find_cross_domain_correlations(all_patterns)
+        correlations = self._find_cross_domain_correlations(all_patterns, limit=10)
         
         # Calculate emergence potential
-        emergence_score = self._calculate_emergence_potential(all_patterns, clusters)
-        
-        # Track pattern evolution
-        self._track_pattern_evolution(all_patterns)
+        emergence_score = self._calculate_emergence_potential(summary, clusters)
         
         # Build comprehensive results
         results = {
@@ -231,26 +695,33 @@ class AdvancedPatternRecognition:
             },
             "patterns": [self._pattern_to_dict(p) for p in all_patterns[:10]],  # Top 10
             "clusters": [self._cluster_to_dict(c) for c in clusters[:5]],  # Top 5
-            "correlations": correlations[:10],  # Top 10
+            "correlations": correlations,  # Top 10
             "emergence_score": emergence_score,
-            "complexity_analysis": self._analyze_complexity(all_patterns),
-            "dominant_patterns": self._identify_dominant_patterns(all_patterns),
-            "pattern_evolution": self._get_recent_evolution()
+            "complexity_analysis": self._analyze_complexity(summary),
+            "dominant_patterns": self._identify_dominant_patterns(summary)
         }
-        
-        logger.info(f"Pattern analysis complete: {len(all_patterns)} patterns detected")
-        
+
+        return all_patterns, results, summary
+
+    def _merge_analysis(self, patterns: List[Pattern], results: Dict[str, Any],
+                        summary: PatternSummary) -> Dict[str, Any]:
+        """Record an analysis in the pattern database and evolution history"""
+        self._track_pattern_evolution(patterns, summary)
+        results["pattern_evolution"] = self._get_recent_evolution()
+
+        logger.info(f"Pattern analysis complete: {len(patterns)} patterns detected")
+
         return results
     
-    def _detect_linguistic_patterns(self, text: str) -> List[Pattern]:
+    def _detect_linguistic_patterns(self, view: Union[TextView, StreamView]) -> List[Pattern]:
         """Detect linguistic patterns in text"""
         patterns = []
-        model = self.recognition_models["linguistic"]
+        text = view.lowered
         
         # Keyword-based patterns
-        for category, keywords in model["keywords"].items():
+        for category, keywords in self._keywords["linguistic"].items():
             for keyword in keywords:
-                if keyword.lower() in text.lower():
+                if keyword in text:
                     pattern = Pattern(
                         id=self._generate_pattern_id(f"ling_{category}_{keyword}"),
                         type=PatternType.LINGUISTIC,
@@ -263,8 +734,8 @@ class AdvancedPatternRecognition:
                     patterns.append(pattern)
         
         # Regex-based patterns
-        for pattern_name, regex in model["patterns"].items():
-            matches = re.findall(regex, text, re.IGNORECASE)
+        for pattern_name, regex in self._regexes.items():
+            matches = view.first_matches(pattern_name, regex, REGEX_MATCH_LIMIT)
             if matches:
                 pattern = Pattern(
                     id=self._generate_pattern_id(f"ling_regex_{pattern_name}"),
@@ -273,20 +744,20 @@ class AdvancedPatternRecognition:
                     content=f"{pattern_name}:{matches[0]}",
                     confidence=0.7,
                     timestamp=time.time(),
-                    context={"pattern": pattern_name, "matches": matches[:3]}
+                    context={"pattern": pattern_name, "matches": matches[:REGEX_MATCH_LIMIT]}
                 )
                 patterns.append(pattern)
         
         return patterns
     
-    def _detect_semantic_patterns(self, text: str) -> List[Pattern]:
+    def _detect_semantic_patterns(self, view: Union[TextView, StreamView]) -> List[Pattern]:
         """Detect semantic patterns in text"""
         patterns = []
-        model = self.recognition_models["semantic"]
+        text = view.lowered
         
         # Domain detection
-        for domain, indicators in model["domains"].items():
-            domain_score = sum(1 for ind in indicators if ind.lower() in text.lower())
+        for domain, indicators in self._keywords["domains"].items():
+            domain_score = sum(1 for ind in indicators if ind in text)
             if domain_score > 0:
                 pattern = Pattern(
                     id=self._generate_pattern_id(f"sem_domain_{domain}"),
@@ -300,9 +771,9 @@ class AdvancedPatternRecognition:
                 patterns.append(pattern)
         
         # Relationship detection
-        for rel_type, indicators in model["relationships"].items():
+        for rel_type, indicators in self._keywords["relationships"].items():
             for indicator in indicators:
-                if indicator.lower() in text.lower():
+                if indicator in text:
                     pattern = Pattern(
                         id=self._generate_pattern_id(f"sem_rel_{rel_type}"),
                         type=PatternType.SEMANTIC,
@@ -317,16 +788,15 @@ class AdvancedPatternRecognition:
         
         return patterns
     
-    def _detect_structural_patterns(self, text: str) -> List[Pattern]:
+    def _detect_structural_patterns(self, view: Union[TextView, StreamView]) -> List[Pattern]:
         """Detect structural patterns in text"""
         patterns = []
-        model = self.recognition_models["structural"]
         
         # Detect structural types
-        text_lower = text.lower()
+        text_lower = view.lowered
         
         # Check for list structures
-        if any(marker in text for marker in ["1.", "2.", "•", "-", "*"]):
+        if any(marker in view.text for marker in LIST_MARKERS):
             pattern = Pattern(
                 id=self._generate_pattern_id("struct_list"),
                 type=PatternType.STRUCTURAL,
@@ -339,7 +809,7 @@ class AdvancedPatternRecognition:
             patterns.append(pattern)
         
         # Check for hierarchical structures
-        if any(word in text_lower for word in ["level", "layer", "hierarchy", "nested"]):
+        if any(word in text_lower for word in HIERARCHY_WORDS):
             pattern = Pattern(
                 id=self._generate_pattern_id("struct_hierarchy"),
                 type=PatternType.STRUCTURAL,
@@ -352,7 +822,7 @@ class AdvancedPatternRecognition:
             patterns.append(pattern)
         
         # Check for recursive structures
-        if "recursive" in text_lower or "self-referential" in text_lower:
+        if any(word in text_lower for word in RECURSION_WORDS):
             pattern = Pattern(
                 id=self._generate_pattern_id("struct_recursive"),
                 type=PatternType.RECURSIVE,
@@ -366,15 +836,15 @@ class AdvancedPatternRecognition:
         
         return patterns
     
-    def _detect_temporal_patterns(self, text: str) -> List[Pattern]:
+    def _detect_temporal_patterns(self, view: Union[TextView, StreamView]) -> List[Pattern]:
         """Detect temporal patterns in text"""
         patterns = []
-        model = self.recognition_models["temporal"]
+        text = view.lowered
         
         # Time marker detection
-        for time_period, markers in model["time_markers"].items():
+        for time_period, markers in self._keywords["time_markers"].items():
             for marker in markers:
-                if marker.lower() in text.lower():
+                if marker in text:
                     pattern = Pattern(
                         id=self._generate_pattern_id(f"temp_{time_period}"),
                         type=PatternType.TEMPORAL,
@@ -388,8 +858,8 @@ class AdvancedPatternRecognition:
                     break
         
         # Sequence detection
-        for seq_type, indicators in model["sequences"].items():
-            seq_score = sum(1 for ind in indicators if ind.lower() in text.lower())
+        for seq_type, indicators in self._keywords["sequences"].items():
+            seq_score = sum(1 for ind in indicators if ind in text)
             if seq_score > 0:
                 pattern = Pattern(
                     id=self._generate_pattern_id(f"temp_seq_{seq_type}"),
@@ -404,15 +874,15 @@ class AdvancedPatternRecognition:
         
         return patterns
     
-    def _detect_emergent_patterns(self, text: str) -> List[Pattern]:
+    def _detect_emergent_patterns(self, view: Union[TextView, StreamView]) -> List[Pattern]:
         """Detect emergent patterns in text"""
         patterns = []
-        model = self.recognition_models["emergent"]
+        text = view.lowered
         
         # Emergence indicator detection
-        for emerg_type, indicators in model["emergence_indicators"].items():
+        for emerg_type, indicators in self._keywords["emergence_indicators"].items():
             for indicator in indicators:
-                if indicator.lower() in text.lower():
+                if indicator in text:
                     pattern = Pattern(
                         id=self._generate_pattern_id(f"emerg_{emerg_type}"),
                         type=PatternType.EMERGENT,
@@ -426,9 +896,9 @@ class AdvancedPatternRecognition:
                     patterns.append(pattern)
         
         # Complexity marker detection
-        for complex_type, markers in model["complexity_markers"].items():
+        for complex_type, markers in self._keywords["complexity_markers"].items():
             for marker in markers:
-                if marker.lower() in text.lower():
+                if marker in text:
                     pattern = Pattern(
                         id=self._generate_pattern_id(f"complex_{complex_type}"),
                         type=PatternType.EMERGENT,
@@ -443,57 +913,114 @@ class AdvancedPatternRecognition:
         
         return patterns
     
-    def _cluster_patterns(self, patterns: List[Pattern]) -> List[PatternCluster]:
-        """Cluster related patterns together"""
+    def _cluster_patterns(self, patterns: List[Pattern], features: Any) -> List[PatternCluster]:
+        """
+        Cluster related patterns together: one cluster per type with at least
+        two patterns, scored from per-type sums of their feature rows
+        """
+        if not patterns:
+            return []
+
         clusters = []
+        for pattern_type, rows, coherence, emergence in self.pattern_clusters.type_groups(features):
+            group_patterns = [patterns[row] for row in rows]
+            clusters.append(PatternCluster(
+                cluster_id=self._generate_pattern_id(f"cluster_{pattern_type.value}"),
+                patterns=group_patterns,
+                centroid={"type": pattern_type.value, "size": len(group_patterns)},
+                coherence_score=coherence,
+                emergence_potential=emergence,
+                domain=pattern_type.value
+            ))
         
-        # Group patterns by type
-        type_groups = defaultdict(list)
-        for pattern in patterns:
-            type_groups[pattern.type].append(pattern)
-        
-        # Create clusters for each type with sufficient patterns
-        for pattern_type, group_patterns in type_groups.items():
-            if len(group_patterns) >= 2:
-                cluster = PatternCluster(
-                    cluster_id=self._generate_pattern_id(f"cluster_{pattern_type.value}"),
-                    patterns=group_patterns,
-                    centroid={"type": pattern_type.value, "size": len(group_patterns)},
-                    coherence_score=self._calculate_coherence(group_patterns),
-                    emergence_potential=max(p.emergence_score for p in group_patterns),
-                    domain=pattern_type.value
-                )
-                clusters.append(cluster)
-        
-        # Sort by coherence score
+        # Sort by coherence score; types keep their order of first appearance on ties
         clusters.sort(key=lambda c: c.coherence_score, reverse=True)
         
         return clusters
     
-    def _find_cross_domain_correlations(self, patterns: List[Pattern]) -> List[Dict[str, Any]]:
-        """Find correlations across different pattern domains"""
+    def _find_cross_domain_correlations(self, patterns: List[Pattern],
+                                        limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find correlations across different pattern domains
+
+        Contexts are tokenized once per pattern. Pairs are then visited in
+        order of falling confidence, so once the best score a pair could
+        still reach drops below the threshold (or below the weakest of the
+        top ``limit`` found so far), every remaining pair can be skipped.
+
+        Args:
+            patterns: Patterns to correlate
+            limit: Keep only the strongest correlations, None for all
+
+        Returns:
+            Correlations above the threshold, strongest first; ties keep
+            the order of the patterns
+        """
+        count = len(patterns)
+        tokens = [frozenset(str(pattern.context).split()) for pattern in patterns]
+        by_confidence = sorted(range(count), key=lambda index: -patterns[index].confidence)
+
+        # No pair can share more context tokens than the largest context holds
+        context_cap = min(1.0, max((len(t) for t in tokens), default=0) * 0.1) * 0.2
+
+        # Min-heap of (score, -rank, i, j); rank is the pair's position in
+        # the all-pairs enumeration, which breaks score ties
+        top: List[Tuple[float, int, int, int]] = []
+        floor = CORRELATION_THRESHOLD - 1e-9  # Bounds below this cannot make the list
+
+        for a in range(count):
+            i = by_confidence[a]
+            pattern1 = patterns[i]
+            for b in range(a + 1, count):
+                j = by_confidence[b]
+                pattern2 = patterns[j]
+                # The time factor is at most 1
+                if 0.3 + (pattern1.confidence + pattern2.confidence) / 2 * 0.5 + context_cap < floor:
+                    break
+                if pattern1.type == pattern2.type:
+                    continue
+
+                first, second = (i, j) if i < j else (j, i)
+                score = self._correlation_score(patterns[first], patterns[second],
+                                                len(tokens[first] & tokens[second]))
+                if score <= CORRELATION_THRESHOLD:
+                    continue
+
+                entry = (score, -(first * count + second), first, second)
+                if limit is None or len(top) < limit:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+                if limit is not None and len(top) >= limit:
+                    floor = max(floor, top[0][0] - 1e-9)
+            else:
+                continue
+            if b == a + 1:
+                # Later patterns have lower confidence, so their pairs score lower still
+                break
+
         correlations = []
-        
-        # Build correlation matrix
-        for i, pattern1 in enumerate(patterns):
-            for pattern2 in patterns[i+1:]:
-                if pattern1.type != pattern2.type:
-                    correlation_score = self._calculate_correlation(pattern1, pattern2)
-                    if correlation_score > 0.5:
-                        correlations.append({
-                            "pattern1": pattern1.content,
-                            "pattern2": pattern2.content,
-                            "score": correlation_score,
-                            "type": f"{pattern1.type.value}-{pattern2.type.value}"
-                        })
-        
-        # Sort by correlation score
-        correlations.sort(key=lambda c: c["score"], reverse=True)
-        
+        for score, _, first, second in sorted(top, key=lambda entry: (-entry[0], -entry[1])):
+            pattern1, pattern2 = patterns[first], patterns[second]
+            correlations.append({
+                "pattern1": pattern1.content,
+                "pattern2": pattern2.content,
+                "score": score,
+                "type": f"{pattern1.type.value}-{pattern2.type.value}"
+            })
+
         return correlations
     
     def _calculate_correlation(self, pattern1: Pattern, pattern2: Pattern) -> float:
         """Calculate correlation between two patterns"""
+        context_overlap = len(
+            set(str(pattern1.context).split()) & 
+            set(str(pattern2.context).split())
+        )
+        return self._correlation_score(pattern1, pattern2, context_overlap)
+
+    def _correlation_score(self, pattern1: Pattern, pattern2: Pattern, context_overlap: int) -> float:
+        """Correlation of two patterns given how many context tokens they share"""
         # Simple correlation based on temporal proximity and confidence
         time_diff = abs(pattern1.timestamp - pattern2.timestamp)
         time_factor = 1.0 / (1.0 + time_diff)
@@ -501,54 +1028,29 @@ class AdvancedPatternRecognition:
         confidence_factor = (pattern1.confidence + pattern2.confidence) / 2
         
         # Check for shared context
-        context_overlap = len(
-            set(str(pattern1.context).split()) & 
-            set(str(pattern2.context).split())
-        )
         context_factor = min(1.0, context_overlap * 0.1)
         
         correlation = (time_factor * 0.3 + confidence_factor * 0.5 + context_factor * 0.2)
         
         return correlation
     
-    def _calculate_coherence(self, patterns: List[Pattern]) -> float:
-        """Calculate coherence score for a group of patterns"""
-        if len(patterns) < 2:
-            return 0.0
-        
-        # Calculate average confidence
-        avg_confidence = sum(p.confidence for p in patterns) / len(patterns)
-        
-        # Calculate complexity consistency
-        complexities = [p.complexity for p in patterns]
-        complexity_consistency = 1.0 - (len(set(complexities)) / len(complexities))
-        
-        # Calculate emergence potential
-        avg_emergence = sum(p.emergence_score for p in patterns) / len(patterns)
-        
-        coherence = (avg_confidence * 0.4 + complexity_consistency * 0.3 + avg_emergence * 0.3)
-        
-        return coherence
-    
-    def _calculate_emergence_potential(self, patterns: List[Pattern], 
+    def _calculate_emergence_potential(self, summary: PatternSummary,
                                       clusters: List[PatternCluster]) -> float:
         """Calculate overall emergence potential"""
-        if not patterns:
+        if not summary.count:
             return 0.0
         
         # Factor in pattern diversity
-        type_diversity = len(set(p.type for p in patterns)) / len(PatternType)
+        type_diversity = len(summary.type_counts) / len(PatternType)
         
         # Factor in complexity
-        avg_complexity = sum(
-            self._complexity_to_score(p.complexity) for p in patterns
-        ) / len(patterns)
+        avg_complexity = summary.average_complexity
         
         # Factor in clustering
         cluster_factor = min(1.0, len(clusters) * 0.2)
         
         # Factor in emergent patterns
-        emergent_count = sum(1 for p in patterns if p.type == PatternType.EMERGENT)
+        emergent_count = summary.type_counts[PatternType.EMERGENT]
         emergent_factor = min(1.0, emergent_count * 0.3)
         
         emergence_potential = (
@@ -562,31 +1064,21 @@ class AdvancedPatternRecognition:
     
     def _complexity_to_score(self, complexity: PatternComplexity) -> float:
         """Convert complexity enum to numerical score"""
-        scores = {
-            PatternComplexity.SIMPLE: 0.2,
-            PatternComplexity.MODERATE: 0.4,
-            PatternComplexity.COMPLEX: 0.6,
-            PatternComplexity.HIGHLY_COMPLEX: 0.8,
-            PatternComplexity.TRANSCENDENT: 1.0
-        }
-        return scores.get(complexity, 0.5)
+        return COMPLEXITY_SCORES.get(complexity, 0.5)
     
-    def _analyze_complexity(self, patterns: List[Pattern]) -> Dict[str, Any]:
+    def _analyze_complexity(self, summary: PatternSummary) -> Dict[str, Any]:
         """Analyze overall complexity of patterns"""
-        if not patterns:
+        if not summary.count:
             return {"overall": "none", "distribution": {}}
         
-        complexity_counts = Counter(p.complexity for p in patterns)
-        total = len(patterns)
+        total = summary.count
         
         distribution = {
-            c.value: count/total for c, count in complexity_counts.items()
+            c.value: count/total for c, count in summary.complexity_counts.items()
         }
         
         # Determine overall complexity
-        avg_score = sum(
-            self._complexity_to_score(p.complexity) for p in patterns
-        ) / len(patterns)
+        avg_score = summary.average_complexity
         
         if avg_score < 0.3:
             overall = "simple"
@@ -605,15 +1097,12 @@ class AdvancedPatternRecognition:
             "distribution": distribution
         }
     
-    def _identify_dominant_patterns(self, patterns: List[Pattern]) -> List[Dict[str, Any]]:
+    def _identify_dominant_patterns(self, summary: PatternSummary) -> List[Dict[str, Any]]:
         """Identify the most dominant patterns"""
-        # Count pattern content frequency
-        content_counts = Counter(p.content for p in patterns)
-        
-        # Get top patterns
+        # Get top patterns by content frequency
         dominant = []
-        for content, count in content_counts.most_common(5):
-            pattern = next(p for p in patterns if p.content == content)
+        for content, count in summary.content_counts.most_common(5):
+            pattern = summary.first_by_content[content]
             dominant.append({
                 "content": content,
                 "type": pattern.type.value,
@@ -624,26 +1113,24 @@ class AdvancedPatternRecognition:
         
         return dominant
     
-    def _track_pattern_evolution(self, patterns: List[Pattern]):
+    def _track_pattern_evolution(self, patterns: List[Pattern], summary: PatternSummary):
         """Track how patterns evolve over time"""
         timestamp = time.time()
         
         evolution_entry = {
             "timestamp": timestamp,
-            "pattern_count": len(patterns),
-            "type_distribution": Counter(p.type.value for p in patterns),
-            "avg_complexity": sum(
-                self._complexity_to_score(p.complexity) for p in patterns
-            ) / len(patterns) if patterns else 0,
-            "emergence_score": max(p.emergence_score for p in patterns) if patterns else 0
+            "pattern_count": summary.count,
+            "type_distribution": Counter({t.value: n for t, n in summary.type_counts.items()}),
+            "avg_complexity": summary.average_complexity,
+            "emergence_score": summary.max_emergence if summary.count else 0
         }
         
         self.pattern_evolution.append(evolution_entry)
         
         # Store patterns in database
-        for pattern in patterns:
-            self.pattern_database[pattern.id] = pattern
-            self.temporal_patterns[timestamp].append(pattern.id)
+        if patterns:
+            self.pattern_database.add_snapshot(timestamp, patterns)
+            self.pattern_clusters.add(patterns, summary.features)
     
     def _get_recent_evolution(self) -> List[Dict[str, Any]]:
         """Get recent pattern evolution data"""
@@ -651,8 +1138,7 @@ class AdvancedPatternRecognition:
     
     def _generate_pattern_id(self, base: str) -> str:
         """Generate unique pattern ID"""
-        timestamp = str(time.time())
-        return hashlib.md5(f"{base}_{timestamp}".encode()).hexdigest()[:12]
+        return _pattern_ids.allocate(base)
     
     def _pattern_to_dict(self, pattern: Pattern) -> Dict[str, Any]:
         """Convert pattern to dictionary"""
@@ -677,29 +1163,81 @@ class AdvancedPatternRecognition:
             "pattern_types": list(set(p.type.value for p in cluster.patterns))
         }
     
+    def get_pattern_clusters(self, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """Largest clusters of recorded patterns, None for all"""
+        return self.pattern_clusters.clusters(limit)
+
     def get_pattern_insights(self) -> Dict[str, Any]:
         """Get insights about pattern recognition system"""
         return {
             "total_patterns_stored": len(self.pattern_database),
-            "unique_pattern_types": len(set(p.type for p in self.pattern_database.values())),
-            "evolution_entries": len(self.pattern_evolution),
+            "unique_pattern_types": len(self.pattern_database.type_counts()),
+            "evolution_entries": self.pattern_evolution.total,
             "clusters_formed": len(self.pattern_clusters),
-            "temporal_snapshots": len(self.temporal_patterns),
-            "recent_evolution": self._get_recent_evolution()[-3:] if self.pattern_evolution else []
+            "top_clusters": self.pattern_clusters.clusters(3),
+            "temporal_snapshots": self.pattern_database.snapshot_count,
+            "recent_evolution": self._get_recent_evolution()[-3:] if self.pattern_evolution else [],
+            "result_cache": self.result_cache.get_stats()
         }
 
-# Global pattern recognition instance
+# Recognizer preloaded once per worker process by _init_worker
+_worker_recognizer: Optional[AdvancedPatternRecognition] = None
+
+def _init_worker(models_json: str):
+    """Build the worker's recognizer from the parent's compiled models"""
+    global _worker_recognizer
+    _worker_recognizer = AdvancedPatternRecognition(cache_size=0)
+    _worker_recognizer.recognition_models = json.loads(models_json)
+    _worker_recognizer._compile_models()
+
+def _analyze_chunk(texts: List[str]) -> List[Analysis]:
+    return [_worker_recognizer._analyze_text(text) for text in texts]
+
+def _map_chunks(executor: ProcessPoolExecutor, texts: Iterator[str], chunksize: int,
+                max_pending: int) -> Iterator[Analysis]:
+    """Analyze chunks in the pool, in order, with a bounded number in flight"""
+    pending = deque()
+    while True:
+        while len(pending) < max_pending:
+            chunk = list(islice(texts, chunksize))
+            if not chunk:
+                break
+            pending.append(executor.submit(_analyze_chunk, chunk))
+        if not pending:
+            return
+        yield from pending.popleft().result()
+
+# Global pattern recognition instance, used when no tenant is active
 pattern_recognizer = AdvancedPatternRecognition()
 
+# Per-tenant recognizers, selected with engine_pool.tenant_scope
+pattern_recognizer_pool = EnginePool(AdvancedPatternRecognition, default=pattern_recognizer,
+                                     name="pattern_recognizer")
+
 def analyze_patterns(input_data: Any, context: Dict[str, Any] = None) -> Dict[str, Any]:
     """Analyze patterns in input data"""
-    return pattern_recognizer.analyze_patterns(input_data, context)
+    with pattern_recognizer_pool.current() as recognizer:
+        return recognizer.analyze_patterns(input_data, context)
+
+def analyze_patterns_parallel(texts: Iterable[Any], workers: Optional[int] = None,
+                              chunksize: int = 16) -> List[Dict[str, Any]]:
+    """Analyze many inputs in a process pool"""
+    with pattern_recognizer_pool.current() as recognizer:
+        return recognizer.analyze_patterns_parallel(texts, workers, chunksize)
+
+def analyze_stream(chunks: Iterable[str], context: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Analyze patterns in a document given as text chunks"""
+    with pattern_recognizer_pool.current() as recognizer:
+        return recognizer.analyze_stream(chunks, context)
 
 def get_pattern_insights() -> Dict[str, Any]:
     """Get insights about pattern recognition"""
-    return pattern_recognizer.get_pattern_insights()
+    with pattern_recognizer_pool.current() as recognizer:
+        return recognizer.get_pattern_insights()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test the advanced pattern recognition
     print("🔍 Advanced Pattern Recognition Test")
     print("=" * 50)
@@ -729,3 +1267,122 @@ if __name__ == "__main__":
     print(f"  Total patterns stored: {insights['total_patterns_stored']}")
     print(f"  Unique pattern types: {insights['unique_pattern_types']}")
     print(f"  Evolution entries: {insights['evolution_entries']}")
+
+    # Bulk throughput: serial loop versus the process pool
+    print("\n" + "=" * 50)
+    print("Bulk analysis throughput:")
+    logger.setLevel(logging.WARNING)
+    corpus = [" ".join(test_texts[(i + j) % len(test_texts)] for j in range(8)) for i in range(2000)]
+
+    # The corpus repeats a few documents and the pool bypasses the result
+    # cache, so the serial loop runs uncached too for a like-for-like rate
+    start = time.perf_counter()
+    serial_recognizer = AdvancedPatternRecognition(cache_size=0)
+    for text in corpus:
+        serial_recognizer.analyze_patterns(text)
+    serial_rate = len(corpus) / (time.perf_counter() - start)
+    print(f"  serial:    {serial_rate:8.0f} docs/s")
+
+    for workers in sorted({2, os.cpu_count() or 1} - {1}):
+        start = time.perf_counter()
+        AdvancedPatternRecognition().analyze_patterns_parallel(corpus, workers=workers)
+        rate = len(corpus) / (time.perf_counter() - start)
+        print(f"  {workers:2d} workers: {rate:8.0f} docs/s ({rate / serial_rate:.1f}x)")
+
+    # Storage footprint: 1M patterns as objects in a dict versus a columnar table
+    print("\n" + "=" * 50)
+    print("Pattern storage, 1M patterns:")
+    import gc
+    import tracemalloc
+    template = serial_recognizer._detect_linguistic_patterns(TextView.from_text(test_texts[0]))
+    pattern_ids = [f"pattern_{i}" for i in range(1_000_000)]
+
+    for name, store in (("dict of Pattern", {}), ("PatternTable", PatternTable())):
+        gc.collect()
+        tracemalloc.start()
+        for i, pattern_id in enumerate(pattern_ids):
+            source = template[i % len(template)]
+            store[pattern_id] = Pattern(
+                id=pattern_id, type=source.type, complexity=source.complexity,
+                content=source.content, confidence=source.confidence,
+                timestamp=source.timestamp + i, context=dict(source.context)
+            )
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  {name:16s} {used / 2**20:6.0f} MiB ({used / len(pattern_ids):.0f} bytes/pattern)")
+        del store
+
+    # Clustering throughput: cost per pattern stays flat as history grows
+    print("\n" + "=" * 50)
+    print("Pattern clustering, batches of 1000:")
+    clustering = LeaderClustering(PatternType, COMPLEXITY_SCORES)
+    detected = [pattern for text in test_texts for pattern in serial_recognizer._analyze_text(text)[0]]
+    batch = [detected[i % len(detected)] for i in range(1000)]
+    for total in (100_000, 1_000_000):
+        seen = clustering.patterns_seen
+        start = time.perf_counter()
+        while clustering.patterns_seen < total:
+            clustering.add(batch)
+        rate = (total - seen) / (time.perf_counter() - start)
+        print(f"  up to {total:9,d} patterns: {rate:8.0f} patterns/s, {len(clustering)} clusters")
+
+    # Analysis summary: one PatternSummary pass versus rescanning the list per result
+    print("\n" + "=" * 50)
+    print("Analysis summary, single pass versus multi-pass:")
+    import random
+
+    def complexity_to_score(complexity: PatternComplexity) -> float:
+        """The score lookup as it was, with its table rebuilt on every call"""
+        scores = {
+            PatternComplexity.SIMPLE: 0.2,
+            PatternComplexity.MODERATE: 0.4,
+            PatternComplexity.COMPLEX: 0.6,
+            PatternComplexity.HIGHLY_COMPLEX: 0.8,
+            PatternComplexity.TRANSCENDENT: 1.0
+        }
+        return scores.get(complexity, 0.5)
+
+    def multi_pass(patterns: List[Pattern]) -> Tuple:
+        """Dominants, complexity, emergence and evolution figures, each from its own scan"""
+        content_counts = Counter(p.content for p in patterns)
+        dominant = []
+        for content, frequency in content_counts.most_common(5):
+            pattern = next(p for p in patterns if p.content == content)
+            dominant.append({"content": content, "type": pattern.type.value, "frequency": frequency,
+                             "confidence": pattern.confidence, "complexity": pattern.complexity.value})
+        distribution = {c.value: n / len(patterns) for c, n in Counter(p.complexity for p in patterns).items()}
+        average = sum(complexity_to_score(p.complexity) for p in patterns) / len(patterns)
+        emergence = (
+            len(set(p.type for p in patterns)) / len(PatternType) * 0.25 +
+            sum(complexity_to_score(p.complexity) for p in patterns) / len(patterns) * 0.25 +
+            min(1.0, sum(1 for p in patterns if p.type == PatternType.EMERGENT) * 0.3) * 0.25
+        )
+        type_distribution = Counter(p.type.value for p in patterns)
+        evolution_average = sum(complexity_to_score(p.complexity) for p in patterns) / len(patterns)
+        max_emergence = max(p.emergence_score for p in patterns)
+        return dominant, distribution, average, emergence, type_distribution, evolution_average, max_emergence
+
+    def single_pass(patterns: List[Pattern]) -> Tuple:
+        """The same figures derived from one PatternSummary"""
+        summary = PatternSummary.of(patterns)
+        complexity = serial_recognizer._analyze_complexity(summary)
+        return (serial_recognizer._identify_dominant_patterns(summary), complexity["distribution"],
+                complexity["average_score"], serial_recognizer._calculate_emergence_potential(summary, []),
+                Counter({t.value: n for t, n in summary.type_counts.items()}),
+                summary.average_complexity, summary.max_emergence)
+
+    rng = random.Random(7)
+    for size in (1, 10, 40, 1000, 100_000):
+        patterns = [replace(source, content=f"{source.content}#{rng.randrange(max(1, size // 4))}",
+                            emergence_score=rng.random())
+                    for source in (rng.choice(detected) for _ in range(size))]
+        assert single_pass(patterns) == multi_pass(patterns), f"summaries differ at {size} patterns"
+        runs = max(3, 100_000 // size)
+        timings = {}
+        for name, derive in (("multi", multi_pass), ("single", single_pass)):
+            start = time.perf_counter()
+            for _ in range(runs):
+                derive(patterns)
+            timings[name] = (time.perf_counter() - start) / runs
+        print(f"  {size:7,d} patterns: {timings['multi'] * 1e6:10.1f} -> {timings['single'] * 1e6:10.1f} us "
+              f"({timings['multi'] / timings['single']:.1f}x)")
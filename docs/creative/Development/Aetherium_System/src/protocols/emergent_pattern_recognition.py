@@ -44,6 +44,15 @@ except ImportError:
             CONSCIOUSNESS_AVAILABLE = False
             logging.warning("Consciousness core not available, running in limited mode")
 
+try:
+    from ..core.engine_pool import EnginePool
+except ImportError:
+    # Fallback for standalone execution
+    import sys
+    import os
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+    from engine_pool import EnginePool
+
 logger = logging.getLogger(__name__)
 
 class PatternDetector:
@@ -413,11 +422,19 @@ class AdaptiveResponseSystem:
 
         return actions
 
-# Global protocol instances
+# Global protocol instances, used when no tenant is active
 pattern_detector = PatternDetector()
 interdisciplinary_correlator = InterdisciplinaryCorrelator()
 adaptive_response_system = AdaptiveResponseSystem()
 
+# Per-tenant protocol instances, selected with engine_pool.tenant_scope
+pattern_detector_pool = EnginePool(PatternDetector, default=pattern_detector,
+                                   name="pattern_detector")
+interdisciplinary_correlator_pool = EnginePool(InterdisciplinaryCorrelator, default=interdisciplinary_correlator,
+                                               name="interdisciplinary_correlator")
+adaptive_response_system_pool = EnginePool(AdaptiveResponseSystem, default=adaptive_response_system,
+                                           name="adaptive_response_system")
+
 def process_pattern_recognition(input_data: Any, context: str = "", source_domain: str = "general") -> Dict[str, Any]:
     """
     Main function for emergent pattern recognition with consciousness integration
@@ -430,20 +447,23 @@ def process_pattern_recognition(input_data: Any, context: str = "", source_domai
     Returns:
         Complete pattern recognition results with consciousness integration
     """
-    # Detect patterns
-    detection_results = pattern_detector.detect_patterns(input_data, context)
-
-    # Correlate across domains
-    correlation_results = interdisciplinary_correlator.correlate_patterns(
-        detection_results["detected_patterns"],
-        source_domain
-    )
-
-    # Generate adaptive response
-    response_results = adaptive_response_system.generate_response(
-        detection_results["detected_patterns"],
-        context
-    )
+    with pattern_detector_pool.current() as detector, \
+            interdisciplinary_correlator_pool.current() as correlator, \
+            adaptive_response_system_pool.current() as responder:
+        # Detect patterns
+        detection_results = detector.detect_patterns(input_data, context)
+
+        # Correlate across domains
+        correlation_results = correlator.correlate_patterns(
+            detection_results["detected_patterns"],
+            source_domain
+        )
+
+        # Generate adaptive response
+        response_results = responder.generate_response(
+            detection_results["detected_patterns"],
+            context
+        )
 
     # Combine all results
     return {
@@ -456,18 +476,21 @@ def process_pattern_recognition(input_data: Any, context: str = "", source_domai
 
 def get_protocol_status() -> Dict[str, Any]:
     """Get current status of the pattern recognition protocol"""
+    detector = pattern_detector_pool.resolve()
+    correlator = interdisciplinary_correlator_pool.resolve()
+    responder = adaptive_response_system_pool.resolve()
     return {
         "pattern_detector": {
-            "patterns_analyzed": len(pattern_detector.pattern_history),
-            "cache_size": len(pattern_detector.consciousness_cache)
+            "patterns_analyzed": len(detector.pattern_history),
+            "cache_size": len(detector.consciousness_cache)
         },
         "interdisciplinary_correlator": {
-            "cross_domain_patterns": len(interdisciplinary_correlator.cross_domain_patterns),
-            "domains_mapped": len(interdisciplinary_correlator.domain_mappings)
+            "cross_domain_patterns": len(correlator.cross_domain_patterns),
+            "domains_mapped": len(correlator.domain_mappings)
         },
         "adaptive_response_system": {
-            "adaptations_generated": len(adaptive_response_system.adaptation_history),
-            "strategies_available": len(adaptive_response_system.response_strategies)
+            "adaptations_generated": len(responder.adaptation_history),
+            "strategies_available": len(responder.response_strategies)
         },
         "consciousness_integration": CONSCIOUSNESS_AVAILABLE
     }
@@ -0,0 +1,316 @@
+# Aetherium Pattern Clustering
+
+"""
+Pattern Clustering for the Aetherium System
+Incremental leader clustering of pattern feature vectors.
+
+Each pattern becomes a vector of its type (one-hot), complexity score,
+confidence, emergence score and a hashed bag of its context tokens. A batch
+of patterns is matched against every cluster centroid in one NumPy
+operation; a pattern within ``radius`` of its nearest centroid joins that
+cluster, and the rest lead new clusters. Centroids are running means
+updated once per batch, so clusters persist across calls and history is
+never reclustered.
+
+Per cluster only counts and sums are kept, not the patterns, so memory is
+bounded by ``max_clusters`` however many patterns have been seen.
+"""
+
+import logging
+import zlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLUSTER_RADIUS = 0.6
+DEFAULT_MAX_CLUSTERS = 256
+CONTEXT_BUCKETS = 32
+CONTEXT_WEIGHT = 0.5  # Disjoint contexts alone add at most this * sqrt(2) to a distance
+CONTEXT_TABLE_LIMIT = 4096  # Distinct contexts remembered before the table starts over, between batches
+
+def context_bucket(token: str, buckets: int = CONTEXT_BUCKETS) -> int:
+    """Stable hash bucket of a context token, the same in every process"""
+    return zlib.crc32(token.encode("utf-8", "surrogatepass")) % buckets
+
+class LeaderClustering:
+    """Clusters of patterns that grow as batches arrive"""
+
+    def __init__(self, types: Iterable[Any], complexity_scores: Mapping[Any, float],
+                 radius: float = DEFAULT_CLUSTER_RADIUS, max_clusters: int = DEFAULT_MAX_CLUSTERS,
+                 context_buckets: int = CONTEXT_BUCKETS):
+        """
+        Args:
+            types: Every pattern type, in a fixed order
+            complexity_scores: Numerical score of each complexity level
+            radius: Largest distance at which a pattern joins a cluster
+            max_clusters: Past this, patterns join their nearest cluster
+            context_buckets: Hash buckets for context tokens
+        """
+        if radius <= 0:
+            raise ValueError("radius must be positive")
+        if max_clusters <= 0:
+            raise ValueError("max_clusters must be positive")
+
+        self.types = list(types)
+        self.complexities = list(complexity_scores)
+        self._index_categories()
+        self._complexity_values = np.array([complexity_scores[c] for c in self.complexities], dtype=np.float64)
+        self.radius = radius
+        self.max_clusters = max_clusters
+        self.context_buckets = context_buckets
+        self.dim = len(self.types) + 3 + context_buckets
+
+        # Per-cluster running totals, one row per cluster: the summed feature
+        # vectors, then complexity counts, then the pattern count. The type
+        # one-hot columns of the feature sums double as type counts.
+        self._complexity_offset = self.dim
+        self._width = self.dim + len(self.complexities) + 1
+        self._totals = np.zeros((0, self._width))
+        self._centroids = np.zeros((0, self.dim))
+        self._max_emergence = np.zeros(0)
+        self.cluster_ids: List[str] = []
+
+        # Context -> row of normalized token bags; detectors repeat a few contexts
+        self._context_codes: Dict[str, int] = {}
+        self._context_bags = np.zeros((0, context_buckets))
+
+        self.patterns_seen = 0
+
+    def features(self, patterns: List[Any]) -> np.ndarray:
+        """
+        Feature matrix of a batch, widened with complexity one-hot and count
+        columns so that summing rows gives the cluster totals
+        """
+        # Reset only between batches: codes handed out for this batch index
+        # rows of the table until the bags are read below
+        if len(self._context_codes) >= CONTEXT_TABLE_LIMIT:
+            self._context_codes.clear()
+
+        count = len(patterns)
+        rows = np.zeros((count, self._width))
+        # Enum hashing runs Python code, identity lookups do not
+        type_codes = [self._type_index[id(p.type)] for p in patterns]
+        complexity_codes = [self._complexity_index.get(id(p.complexity), -1) for p in patterns]
+        context_codes = [self._context_code(p.context) for p in patterns]
+
+        index = np.arange(count)
+        offset = len(self.types)
+        rows[index, type_codes] = 1.0
+        complexity_codes = np.array(complexity_codes, dtype=np.intp)
+        known = complexity_codes >= 0
+        rows[:, offset] = np.where(known, self._complexity_values[complexity_codes], 0.5)
+        rows[:, offset + 1] = [p.confidence for p in patterns]
+        rows[:, offset + 2] = [p.emergence_score for p in patterns]
+        rows[:, offset + 3:self.dim] = self._context_bags[context_codes]
+        rows[index[known], self._complexity_offset + complexity_codes[known]] = 1.0
+        rows[:, -1] = 1.0
+        return rows
+
+    def add(self, patterns: List[Any], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Assign a batch of patterns to clusters, creating clusters as needed
+
+        Args:
+            patterns: The batch
+            rows: Its features() matrix, if already computed
+
+        Returns:
+            Cluster index of each pattern
+        """
+        if not patterns:
+            return np.zeros(0, dtype=np.intp)
+
+        if rows is None:
+            rows = self.features(patterns)
+        labels = self._assign(rows[:, :self.dim])
+
+        # Fold the batch into the running totals with one product
+        membership = labels == np.arange(len(self.cluster_ids))[:, None]
+        self._totals += membership @ rows
+        np.maximum.at(self._max_emergence, labels, rows[:, len(self.types) + 2])
+        self._centroids = self._totals[:, :self.dim] / self._totals[:, -1:]
+        self.patterns_seen += len(patterns)
+        return labels
+
+    def type_groups(self, rows: np.ndarray, min_size: int = 2) -> List[Tuple[Any, List[int], float, float]]:
+        """
+        Group a batch by pattern type and score each group, without touching
+        the clusters. The group sums come from one product over the rows.
+
+        Args:
+            rows: features() matrix of the batch
+            min_size: Smallest group returned
+
+        Returns:
+            (type, row indices, coherence, max emergence) per group, in order
+            of each type's first row
+        """
+        offset = len(self.types)
+        membership = rows[:, :offset]
+        totals = membership.T @ rows
+        coherence = self._coherence(totals)
+        emergence = np.where(membership > 0, rows[:, offset + 2, None], -np.inf).max(axis=0, initial=-np.inf)
+
+        type_codes = membership.argmax(axis=1)
+        codes, first_rows = np.unique(type_codes, return_index=True)
+        groups = []
+        for code in codes[np.argsort(first_rows)].tolist():
+            if totals[code, -1] >= min_size:
+                groups.append((self.types[code], np.flatnonzero(type_codes == code).tolist(),
+                               float(coherence[code]), float(emergence[code])))
+        return groups
+
+    def _coherence(self, totals: np.ndarray) -> np.ndarray:
+        """
+        Coherence of each row of totals: average confidence, complexity
+        consistency and average emergence, weighted 0.4, 0.3 and 0.3.
+        Groups of fewer than two patterns score 0.
+        """
+        offset = len(self.types)
+        sizes = totals[:, -1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averages = totals[:, offset + 1:offset + 3] / sizes[:, None]  # Confidence, emergence
+            consistency = 1.0 - (totals[:, self._complexity_offset:-1] > 0).sum(axis=1) / sizes
+            coherence = averages[:, 0] * 0.4 + consistency * 0.3 + averages[:, 1] * 0.3
+        return np.where(sizes >= 2, coherence, 0.0)
+
+    def clusters(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Cluster summaries, largest first"""
+        offset = len(self.types)
+        counts = self._totals[:, -1]
+        order = np.argsort(-counts, kind="stable")[:limit]
+        if not len(order):
+            return []
+
+        totals = self._totals[order]
+        sizes = totals[:, -1]
+        type_counts = totals[:, :offset]
+        averages = totals[:, offset:offset + 3] / sizes[:, None]  # Complexity, confidence, emergence
+        coherence = self._coherence(totals)
+        dominant = type_counts.argmax(axis=1)
+
+        summaries = []
+        for rank, index in enumerate(order.tolist()):
+            summaries.append({
+                "cluster_id": self.cluster_ids[index],
+                "size": int(sizes[rank]),
+                "domain": self._type_name(self.types[dominant[rank]]),
+                "pattern_types": [self._type_name(self.types[i]) for i in np.flatnonzero(type_counts[rank])],
+                "coherence_score": float(coherence[rank]),
+                "emergence_potential": float(self._max_emergence[index]),
+                "centroid": {
+                    "complexity": float(averages[rank, 0]),
+                    "confidence": float(averages[rank, 1]),
+                    "emergence": float(averages[rank, 2])
+                }
+            })
+        return summaries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cluster count and capacity statistics"""
+        return {
+            "clusters": len(self.cluster_ids),
+            "max_clusters": self.max_clusters,
+            "radius": self.radius,
+            "patterns_seen": self.patterns_seen
+        }
+
+    def __len__(self) -> int:
+        return len(self.cluster_ids)
+
+    def _assign(self, features: np.ndarray) -> np.ndarray:
+        """Nearest cluster within radius for each row, leading new clusters for the rest"""
+        count = len(features)
+        radius_sq = self.radius * self.radius
+        labels = np.full(count, -1, dtype=np.intp)
+        existing = len(self.cluster_ids)
+
+        if existing:
+            distances = self._squared_distances(features, self._centroids)
+            nearest = distances.argmin(axis=1)
+            within = distances[np.arange(count), nearest] <= radius_sq
+            labels[within] = nearest[within]
+            if existing >= self.max_clusters:
+                return nearest
+
+        # Patterns far from every cluster: the first of each group leads a new
+        # cluster, checked against the leaders already chosen in this batch
+        leaders: List[int] = []
+        for row in np.flatnonzero(labels < 0).tolist():
+            if leaders:
+                distances = self._squared_distances(features[row:row + 1], features[leaders])[0]
+                closest = int(distances.argmin())
+                if distances[closest] <= radius_sq or existing + len(leaders) >= self.max_clusters:
+                    labels[row] = existing + closest
+                    continue
+            elif existing + len(leaders) >= self.max_clusters:
+                labels[row] = nearest[row]
+                continue
+            leaders.append(row)
+            labels[row] = existing + len(leaders) - 1
+
+        if leaders:
+            self._grow(features[leaders])
+        return labels
+
+    def _grow(self, leaders: np.ndarray):
+        """Add clusters, seeded with their leaders as centroids"""
+        added = len(leaders)
+        start = len(self.cluster_ids)
+        self._totals = np.vstack([self._totals, np.zeros((added, self._width))])
+        self._centroids = np.vstack([self._centroids, leaders])
+        self._max_emergence = np.concatenate([self._max_emergence, np.zeros(added)])
+        self.cluster_ids.extend(f"cluster_{index}" for index in range(start, start + added))
+        logger.debug(f"Formed {added} pattern clusters, {len(self.cluster_ids)} total")
+
+    def _context_code(self, context: Dict[str, Any]) -> int:
+        """Row of a context's token bag, hashed and normalized on first sight"""
+        text = str(context)
+        code = self._context_codes.get(text)
+        if code is not None:
+            return code
+        code = len(self._context_codes)
+        if code == len(self._context_bags):
+            # Grow by doubling so new contexts cost amortized constant time
+            self._context_bags = np.vstack([self._context_bags, np.zeros((max(code, 16), self.context_buckets))])
+
+        # Tokenized as the correlation search does
+        bag = self._context_bags[code]
+        bag[:] = 0.0
+        for token in text.split():
+            bag[context_bucket(token, self.context_buckets)] += 1.0
+        norm = np.linalg.norm(bag)
+        if norm:
+            bag *= CONTEXT_WEIGHT / norm
+
+        self._context_codes[text] = code
+        return code
+
+    def _index_categories(self):
+        self._type_index = {id(pattern_type): i for i, pattern_type in enumerate(self.types)}
+        self._complexity_index = {id(complexity): i for i, complexity in enumerate(self.complexities)}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Identity keys mean nothing in another process; rebuild them on load
+        state = self.__dict__.copy()
+        del state["_type_index"], state["_complexity_index"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._index_categories()
+
+    @staticmethod
+    def _squared_distances(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        distances = (
+            np.einsum("ij,ij->i", points, points)[:, None]
+            - 2.0 * points @ centroids.T
+            + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+        )
+        return np.maximum(distances, 0.0, out=distances)
+
+    @staticmethod
+    def _type_name(pattern_type: Any) -> Any:
+        return getattr(pattern_type, "value", pattern_type)
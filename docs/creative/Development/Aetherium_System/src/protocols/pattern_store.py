@@ -0,0 +1,307 @@
+# Aetherium Pattern Store
+
+"""
+Pattern Store for the Aetherium System
+Time-partitioned pattern storage with retention and cold-bucket spill.
+
+Patterns are kept in buckets covering ``bucket_seconds`` of pattern time.
+Each bucket also keeps a summary of its pattern counts by type and of the
+analysis snapshots recorded in it. Type and snapshot statistics therefore
+cost time proportional to the number of buckets, not the number of
+patterns, and a time range query only visits the buckets it overlaps.
+
+Buckets older than ``retention_seconds`` behind the newest pattern are
+dropped. With ``hot_buckets`` set, only the newest buckets keep their
+patterns in memory. Older ones are pickled to ``spill_dir``, keep their
+summaries, and are read back when queried.
+
+With ``compact`` set, each bucket holds its patterns in a columnar
+PatternTable, and reads return PatternRecord views instead of the stored
+objects.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .pattern_table import PatternTable
+except ImportError:
+    # Fallback for standalone execution
+    from pattern_table import PatternTable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKET_SECONDS = 300.0
+
+@dataclass
+class _Bucket:
+    """Patterns from one time slice, with their summary"""
+    start: float
+    patterns: Optional[MutableMapping] = field(default_factory=dict)  # None while spilled
+    snapshots: Optional[Dict[float, List[str]]] = field(default_factory=dict)
+    type_counts: Counter = field(default_factory=Counter)
+    size: int = 0
+    snapshot_count: int = 0
+    spill_path: Optional[str] = None
+
+    @property
+    def spilled(self) -> bool:
+        return self.patterns is None
+
+class PatternStore(MutableMapping):
+    """Dict-like pattern database partitioned into time buckets"""
+
+    def __init__(self, bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+                 retention_seconds: Optional[float] = None,
+                 hot_buckets: Optional[int] = None,
+                 spill_dir: Optional[str] = None,
+                 compact: bool = False):
+        """
+        Args:
+            bucket_seconds: Width of each time bucket
+            retention_seconds: Age behind the newest pattern after which
+                buckets are dropped, None to keep everything
+            hot_buckets: Newest buckets kept in memory, None to never spill
+            spill_dir: Directory for spilled buckets
+            compact: Store each bucket's patterns in a columnar PatternTable
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        if hot_buckets is not None and hot_buckets <= 0:
+            raise ValueError("hot_buckets must be positive")
+
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self.hot_buckets = hot_buckets
+        self.spill_dir = spill_dir
+        self.compact = compact
+
+        self._buckets: Dict[int, _Bucket] = {}
+        self._keys: List[int] = []           # Bucket keys, oldest first
+        self._locations: Dict[str, int] = {}  # pattern id -> bucket key
+        self._hot = 0                         # Buckets holding their patterns in memory
+        self._spill_names = 0
+        self.latest = float("-inf")           # Newest pattern time seen
+        self.expired = 0                      # Patterns dropped by retention
+        self.spills = 0
+
+    # Mapping interface
+
+    def __getitem__(self, pattern_id: str) -> Any:
+        bucket = self._buckets[self._locations[pattern_id]]
+        return self._load(bucket)[0][pattern_id]
+
+    def __setitem__(self, pattern_id: str, pattern: Any):
+        if pattern_id in self._locations:
+            del self[pattern_id]
+
+        bucket = self._hot_bucket(pattern.timestamp)
+        bucket.patterns[pattern_id] = pattern
+        bucket.type_counts[pattern.type] += 1
+        bucket.size += 1
+        self._locations[pattern_id] = self._key(pattern.timestamp)
+
+        if pattern.timestamp > self.latest:
+            self.latest = pattern.timestamp
+            self._expire()
+        self._spill_cold()
+
+    def __delitem__(self, pattern_id: str):
+        key = self._locations.pop(pattern_id)
+        bucket = self._buckets[key]
+        self._warm(bucket)
+        # Read the type before deleting; pattern tables return views, not copies
+        pattern_type = bucket.patterns[pattern_id].type
+        del bucket.patterns[pattern_id]
+        bucket.type_counts[pattern_type] -= 1
+        if not bucket.type_counts[pattern_type]:
+            del bucket.type_counts[pattern_type]
+        bucket.size -= 1
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._locations)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, pattern_id: object) -> bool:
+        return pattern_id in self._locations
+
+    # Snapshots and queries
+
+    def add_snapshot(self, timestamp: float, patterns: List[Any]):
+        """Store the patterns of one analysis and record it as a snapshot"""
+        for pattern in patterns:
+            self[pattern.id] = pattern
+
+        bucket = self._hot_bucket(timestamp)
+        bucket.snapshots.setdefault(timestamp, []).extend(pattern.id for pattern in patterns)
+        bucket.snapshot_count += 1
+        if timestamp > self.latest:
+            self.latest = timestamp
+            self._expire()
+        self._spill_cold()
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None,
+              pattern_type: Any = None) -> Iterator[Any]:
+        """
+        Patterns with start <= timestamp < end, oldest bucket first
+
+        Args:
+            start: Earliest pattern time, None for unbounded
+            end: Pattern time to stop before, None for unbounded
+            pattern_type: Only patterns of this type
+        """
+        first = 0 if start is None else bisect_left(self._keys, self._key(start))
+        last = len(self._keys) if end is None else bisect_right(self._keys, self._key(end))
+
+        for key in self._keys[first:last]:
+            bucket = self._buckets[key]
+            if pattern_type is not None and not bucket.type_counts.get(pattern_type):
+                continue
+            for pattern in self._load(bucket)[0].values():
+                if start is not None and pattern.timestamp < start:
+                    continue
+                if end is not None and pattern.timestamp >= end:
+                    continue
+                if pattern_type is None or pattern.type == pattern_type:
+                    yield pattern
+
+    def snapshots(self, start: Optional[float] = None,
+                  end: Optional[float] = None) -> Iterator[Tuple[float, List[str]]]:
+        """Recorded (timestamp, pattern ids) snapshots with start <= timestamp < end"""
+        first = 0 if start is None else bisect_left(self._keys, self._key(start))
+        last = len(self._keys) if end is None else bisect_right(self._keys, self._key(end))
+
+        for key in self._keys[first:last]:
+            for timestamp, pattern_ids in self._load(self._buckets[key])[1].items():
+                if (start is None or timestamp >= start) and (end is None or timestamp < end):
+                    yield timestamp, pattern_ids
+
+    def type_counts(self) -> Counter:
+        """Stored pattern counts by type, from the bucket summaries"""
+        totals = Counter()
+        for bucket in self._buckets.values():
+            totals.update(bucket.type_counts)
+        return totals
+
+    @property
+    def snapshot_count(self) -> int:
+        """Recorded snapshots, from the bucket summaries"""
+        return sum(bucket.snapshot_count for bucket in self._buckets.values())
+
+    def expire(self, now: float):
+        """Drop buckets older than the retention window ending at now"""
+        if now > self.latest:
+            self.latest = now
+        self._expire()
+
+    def clear(self):
+        """Drop every pattern and remove spilled buckets"""
+        for bucket in self._buckets.values():
+            self._remove_spill(bucket)
+        self._buckets.clear()
+        self._keys.clear()
+        self._locations.clear()
+        self._hot = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Partitioning, retention and spill statistics"""
+        spilled = sum(1 for bucket in self._buckets.values() if bucket.spilled)
+        return {
+            "patterns": len(self._locations),
+            "buckets": len(self._buckets),
+            "hot_buckets": len(self._buckets) - spilled,
+            "spilled_buckets": spilled,
+            "bucket_seconds": self.bucket_seconds,
+            "compact": self.compact,
+            "retention_seconds": self.retention_seconds,
+            "expired": self.expired,
+            "spills": self.spills
+        }
+
+    # Internals
+
+    def _key(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def _hot_bucket(self, timestamp: float) -> _Bucket:
+        """The bucket covering timestamp, created or read back as needed"""
+        key = self._key(timestamp)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            patterns = PatternTable() if self.compact else {}
+            bucket = self._buckets[key] = _Bucket(start=key * self.bucket_seconds, patterns=patterns)
+            self._hot += 1
+            if not self._keys or key > self._keys[-1]:
+                self._keys.append(key)
+            else:
+                insort(self._keys, key)
+        self._warm(bucket)
+        return bucket
+
+    def _expire(self):
+        if self.retention_seconds is None:
+            return
+        horizon = self.latest - self.retention_seconds
+        while self._keys and self._buckets[self._keys[0]].start + self.bucket_seconds <= horizon:
+            bucket = self._buckets.pop(self._keys.pop(0))
+            for pattern_id in self._load(bucket)[0]:
+                del self._locations[pattern_id]
+            self.expired += bucket.size
+            if not bucket.spilled:
+                self._hot -= 1
+            self._remove_spill(bucket)
+
+    def _spill_cold(self):
+        """Spill the oldest in-memory buckets beyond hot_buckets"""
+        if self.hot_buckets is None or self._hot <= self.hot_buckets:
+            return
+        for key in self._keys:
+            if self._hot <= self.hot_buckets:
+                break
+            if not self._buckets[key].spilled:
+                self._spill(self._buckets[key])
+
+    def _spill(self, bucket: _Bucket):
+        directory = self.spill_dir or os.path.join(tempfile.gettempdir(), "aetherium_patterns", f"{os.getpid()}_{id(self):x}")
+        os.makedirs(directory, exist_ok=True)
+        if bucket.spill_path is None:
+            self._spill_names += 1
+            bucket.spill_path = os.path.join(directory, f"bucket_{self._spill_names}.pkl")
+
+        tmp_path = bucket.spill_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((bucket.patterns, bucket.snapshots), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, bucket.spill_path)
+
+        bucket.patterns = None
+        bucket.snapshots = None
+        self._hot -= 1
+        self.spills += 1
+        logger.debug(f"Spilled pattern bucket at {bucket.start} to {bucket.spill_path}")
+
+    def _load(self, bucket: _Bucket) -> Tuple[MutableMapping, Dict[float, List[str]]]:
+        """A bucket's patterns and snapshots, read from disk if spilled"""
+        if not bucket.spilled:
+            return bucket.patterns, bucket.snapshots
+        with open(bucket.spill_path, "rb") as f:
+            return pickle.load(f)
+
+    def _warm(self, bucket: _Bucket):
+        """Bring a spilled bucket back into memory for writing"""
+        if bucket.spilled:
+            bucket.patterns, bucket.snapshots = self._load(bucket)
+            self._hot += 1
+
+    def _remove_spill(self, bucket: _Bucket):
+        if bucket.spill_path is not None and os.path.exists(bucket.spill_path):
+            os.remove(bucket.spill_path)
+        bucket.spill_path = None
@@ -0,0 +1,256 @@
+# Aetherium Pattern Table
+
+"""
+Pattern Table for the Aetherium System
+Columnar, compact storage for detected patterns.
+
+A PatternTable is a dict-like store of patterns keyed by id. Instead of one
+object per pattern it keeps typed array columns: category codes for type
+and complexity, indexes into string and context tables, and the numeric
+fields. Columns are ``array.array`` so appending a row stays cheap, and
+``column()`` hands them to NumPy for vectorized work.
+Detectors produce the same few contents and contexts over and over, so the
+string and context tables stay small and every repeat costs one index.
+
+Reading a pattern returns a PatternRecord, a read-only view with the
+attributes of the pattern it was stored from. ``to_pattern()`` rebuilds the
+original object.
+"""
+
+import logging
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Dict, Hashable, Iterator, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COMPACT_MIN_ROWS = 64  # Smaller tables never bother reclaiming deleted rows
+
+# Column name -> array typecode
+COLUMNS = {
+    "type": "H",        # Code in the category table
+    "complexity": "H",  # Code in the category table
+    "content": "i",     # Index in the string table
+    "context": "i",     # Index in the context table
+    "confidence": "d",
+    "timestamp": "d",
+    "emergence_score": "d",
+    "frequency": "q"
+}
+
+class PatternRecord:
+    """Read-only view of one pattern in a PatternTable"""
+
+    __slots__ = ("table", "id")
+
+    def __init__(self, table: "PatternTable", pattern_id: str):
+        self.table = table
+        self.id = pattern_id
+
+    def _column(self, name: str):
+        return self.table._columns[name][self.table._rows[self.id]]
+
+    @property
+    def type(self) -> Any:
+        return self.table._categories[self._column("type")]
+
+    @property
+    def complexity(self) -> Any:
+        return self.table._categories[self._column("complexity")]
+
+    @property
+    def content(self) -> str:
+        return self.table._strings[self._column("content")]
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        # Contexts are shared between records, so hand out a copy
+        return dict(self.table._contexts[self._column("context")])
+
+    @property
+    def correlations(self) -> List[str]:
+        return list(self.table._correlations.get(self.id, ()))
+
+    @property
+    def confidence(self) -> float:
+        return self._column("confidence")
+
+    @property
+    def timestamp(self) -> float:
+        return self._column("timestamp")
+
+    @property
+    def emergence_score(self) -> float:
+        return self._column("emergence_score")
+
+    @property
+    def frequency(self) -> int:
+        return self._column("frequency")
+
+    def to_pattern(self) -> Any:
+        """The pattern as the object type it was stored from"""
+        return self.table.pattern_class(
+            id=self.id,
+            type=self.type,
+            complexity=self.complexity,
+            content=self.content,
+            confidence=self.confidence,
+            timestamp=self.timestamp,
+            context=self.context,
+            correlations=self.correlations,
+            emergence_score=self.emergence_score,
+            frequency=self.frequency
+        )
+
+    def __repr__(self) -> str:
+        return f"PatternRecord(id={self.id!r}, type={self.type}, content={self.content!r})"
+
+class PatternTable(MutableMapping):
+    """Dict-like pattern store backed by typed array columns"""
+
+    def __init__(self):
+        self._columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        self._rows: Dict[str, int] = {}        # pattern id -> row
+        self._ids: List[Optional[str]] = []    # row -> pattern id, None once deleted
+        self._correlations: Dict[str, List[str]] = {}  # Only patterns that have any
+
+        # Interned values shared by every row
+        self._categories: List[Any] = []
+        self._category_codes: Dict[int, int] = {}  # Keyed by identity; categories are enum members
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+        self._contexts: List[Dict[str, Any]] = []
+        self._context_codes: Dict[Hashable, int] = {}
+
+        self.pattern_class: Optional[type] = None  # Type rebuilt by to_pattern
+
+    # Mapping interface
+
+    def __getitem__(self, pattern_id: str) -> PatternRecord:
+        if pattern_id not in self._rows:
+            raise KeyError(pattern_id)
+        return PatternRecord(self, pattern_id)
+
+    def __setitem__(self, pattern_id: str, pattern: Any):
+        values = (
+            self._intern_category(pattern.type),
+            self._intern_category(pattern.complexity),
+            self._intern_string(pattern.content),
+            self._intern_context(pattern.context),
+            pattern.confidence,
+            pattern.timestamp,
+            pattern.emergence_score,
+            pattern.frequency
+        )
+
+        row = self._rows.get(pattern_id)
+        if row is None:
+            # New patterns take the next row; overwrites keep theirs, like a dict keeps its order
+            for column, value in zip(self._columns.values(), values):
+                column.append(value)
+            self._rows[pattern_id] = len(self._ids)
+            self._ids.append(pattern_id)
+        else:
+            for column, value in zip(self._columns.values(), values):
+                column[row] = value
+
+        if pattern.correlations:
+            self._correlations[pattern_id] = list(pattern.correlations)
+        else:
+            self._correlations.pop(pattern_id, None)
+        if isinstance(pattern, PatternRecord):
+            self.pattern_class = pattern.table.pattern_class
+        else:
+            self.pattern_class = type(pattern)
+
+    def __delitem__(self, pattern_id: str):
+        row = self._rows.pop(pattern_id)
+        self._ids[row] = None
+        self._correlations.pop(pattern_id, None)
+
+        # Reclaim deleted rows once they make up most of the table
+        if len(self._ids) > COMPACT_MIN_ROWS and len(self._rows) * 2 < len(self._ids):
+            self._compact()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, pattern_id: object) -> bool:
+        return pattern_id in self._rows
+
+    def pop(self, pattern_id: str, *default: Any) -> Any:
+        """Remove a pattern and return it rebuilt, since its view dies with the row"""
+        if pattern_id not in self._rows:
+            if default:
+                return default[0]
+            raise KeyError(pattern_id)
+        pattern = self[pattern_id].to_pattern()
+        del self[pattern_id]
+        return pattern
+
+    # Columnar access
+
+    def column(self, name: str) -> np.ndarray:
+        """A column's values for the live rows as a NumPy array, in insertion order"""
+        values = np.array(self._columns[name])
+        if len(self._rows) == len(self._ids):
+            return values
+        return values[[row for row, pattern_id in enumerate(self._ids) if pattern_id is not None]]
+
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays"""
+        return sum(len(values) * values.itemsize for values in self._columns.values())
+
+    # Internals
+
+    def _intern_category(self, value: Any) -> int:
+        # Enum hashing runs Python code, identity lookups do not
+        code = self._category_codes.get(id(value))
+        if code is None:
+            code = self._category_codes[id(value)] = len(self._categories)
+            self._categories.append(value)
+        return code
+
+    def _intern_string(self, value: str) -> int:
+        code = self._string_codes.get(value)
+        if code is None:
+            code = self._string_codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def _intern_context(self, context: Dict[str, Any]) -> int:
+        key = tuple(context.items())
+        try:
+            code = self._context_codes.get(key)
+        except TypeError:
+            # Lists and other unhashable values are keyed by their repr
+            key = repr(context)
+            code = self._context_codes.get(key)
+        if code is None:
+            code = self._context_codes[key] = len(self._contexts)
+            self._contexts.append(dict(context))
+        return code
+
+    def _compact(self):
+        """Drop deleted rows and renumber the live ones"""
+        live = sorted(self._rows.values())
+        for name, values in self._columns.items():
+            self._columns[name] = array(values.typecode, [values[row] for row in live])
+
+        self._ids = [self._ids[row] for row in live]
+        self._rows = {pattern_id: row for row, pattern_id in enumerate(self._ids)}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Identity keys mean nothing in another process; rebuild them on load
+        state = self.__dict__.copy()
+        del state["_category_codes"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._category_codes = {id(value): code for code, value in enumerate(self._categories)}
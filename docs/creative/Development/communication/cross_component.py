@@ -7,8 +7,8 @@ import asyncio
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from .message_router import communication_hub, ConsciousnessContext, ConsciousnessLevel
-from .state_sync import state_synchronizer
+from .message_router import communication_hub, get_communication_hub, ConsciousnessContext, ConsciousnessLevel
+from .state_sync import get_state_synchronizer
 
 class CrossComponentCommunicator:
     """
@@ -87,7 +87,7 @@ class CrossComponentCommunicator:
         })
 
         # Communicate results to writing system
-        await communication_hub.route_message(
+        await get_communication_hub().route_message(
             sender='cross_component_bridge',
             recipient='writing_system',
             message=bridge_result,
@@ -123,7 +123,7 @@ class CrossComponentCommunicator:
         })
 
         # Communicate results to research system
-        await communication_hub.route_message(
+        await get_communication_hub().route_message(
             sender='cross_component_bridge',
             recipient='research_integration',
             message=bridge_result,
@@ -159,7 +159,7 @@ class CrossComponentCommunicator:
         })
 
         # Communicate results to consciousness engine
-        await communication_hub.route_message(
+        await get_communication_hub().route_message(
             sender='cross_component_bridge',
             recipient='consciousness_engine',
             message=bridge_result,
@@ -358,7 +358,7 @@ class CrossComponentCommunicator:
         }
 
         # Update state synchronizer
-        await state_synchronizer.update_component_state('timeline_manager', {
+        await get_state_synchronizer().update_component_state('timeline_manager', {
             'consciousness_level': ConsciousnessLevel.REFLECTIVE,
             'awareness_score': 0.7,
             'integration_score': 0.8,
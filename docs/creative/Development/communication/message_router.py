@@ -11,6 +11,31 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from ..Aetherium_System.src.core.keyword_matcher import KeywordMatcher
+    from ..Aetherium_System.src.core.engine_pool import EnginePool
+except ImportError:
+    # Fallback for standalone execution: import core as a package, so its
+    # modules are the ones the Aetherium scripts use
+    import os
+    import sys
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Aetherium_System', 'src'))
+    from core.keyword_matcher import KeywordMatcher
+    from core.engine_pool import EnginePool
+
+# Keyword tables used to analyze message content
+CONSCIOUSNESS_KEYWORDS = [
+    'consciousness', 'awareness', 'reflection', 'integration',
+    'evolution', 'pattern', 'emergence', 'meta-cognition'
+]
+RELEVANCE_DOMAINS = ['consciousness', 'writing', 'research', 'timeline', 'character']
+INTEGRATION_WORDS = ['integrate', 'combine', 'unify']
+GROWTH_WORDS = ['growth', 'development', 'progress']
+
+_content_matcher = KeywordMatcher(
+    CONSCIOUSNESS_KEYWORDS + RELEVANCE_DOMAINS + INTEGRATION_WORDS + GROWTH_WORDS
+)
+
 class ConsciousnessLevel(Enum):
     EMERGENT = "emergent"
     AWARE = "aware"
@@ -141,15 +166,10 @@ class UnifiedMessageRouter:
         """Determine consciousness level based on message content"""
 
         if isinstance(message, dict):
-            content_str = json.dumps(message).lower()
+            hits = _content_matcher.find(json.dumps(message).lower())
 
             # Check for consciousness-related keywords
-            consciousness_keywords = [
-                'consciousness', 'awareness', 'reflection', 'integration',
-                'evolution', 'pattern', 'emergence', 'meta-cognition'
-            ]
-
-            awareness_count = sum(1 for keyword in consciousness_keywords if keyword in content_str)
+            awareness_count = sum(1 for keyword in CONSCIOUSNESS_KEYWORDS if keyword in hits)
 
             if awareness_count >= 3:
                 return ConsciousnessLevel.EVOLVING
@@ -205,8 +225,8 @@ class UnifiedMessageRouter:
 
         if isinstance(message, dict):
             # Check for multi-domain references
-            domains = ['consciousness', 'writing', 'research', 'timeline', 'character']
-            domain_count = sum(1 for domain in domains if domain in json.dumps(message).lower())
+            hits = _content_matcher.find(json.dumps(message).lower())
+            domain_count = sum(1 for domain in RELEVANCE_DOMAINS if domain in hits)
             relevance = min(1.0, domain_count * 0.25)
 
         return relevance
@@ -216,18 +236,18 @@ class UnifiedMessageRouter:
         patterns = []
 
         if isinstance(message, dict):
-            content_str = json.dumps(message).lower()
+            hits = _content_matcher.find(json.dumps(message).lower())
 
             # Consciousness evolution patterns
-            if 'evolution' in content_str and 'pattern' in content_str:
+            if 'evolution' in hits and 'pattern' in hits:
                 patterns.append('consciousness_evolution')
 
             # Integration patterns
-            if any(word in content_str for word in ['integrate', 'combine', 'unify']):
+            if any(word in hits for word in INTEGRATION_WORDS):
                 patterns.append('integration_pattern')
 
             # Growth patterns
-            if any(word in content_str for word in ['growth', 'development', 'progress']):
+            if any(word in hits for word in GROWTH_WORDS):
                 patterns.append('growth_pattern')
 
         return patterns
@@ -311,5 +331,39 @@ class UnifiedMessageRouter:
             'recent_activity': len([msg for msg in self.message_history[-10:]])
         }
 
-# Global communication hub instance
+# Global communication hub instance, used when no tenant is active
 communication_hub = UnifiedMessageRouter()
+
+def _create_tenant_hub() -> UnifiedMessageRouter:
+    """A tenant hub routing to the components registered globally"""
+    hub = UnifiedMessageRouter()
+    hub.components.update(communication_hub.components)
+    return hub
+
+# Per-tenant hubs, selected with engine_pool.tenant_scope. Hubs hold live
+# component references, including the tenant's state synchronizer, so
+# evicted hubs are dropped rather than spilled.
+communication_hub_pool = EnginePool(_create_tenant_hub, default=communication_hub,
+                                    name="communication_hub", save=None, load=None)
+
+def get_communication_hub() -> UnifiedMessageRouter:
+    """The calling context's communication hub"""
+    return communication_hub_pool.resolve()
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    # tenant_scope must select a tenant hub whichever name engine_pool was imported under
+    src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Aetherium_System', 'src')
+    sys.path.extend([src_dir, os.path.join(src_dir, 'core')])
+    import engine_pool as standalone_engine_pool
+    from core import engine_pool as package_engine_pool
+
+    for module in (package_engine_pool, standalone_engine_pool):
+        with module.tenant_scope("alice"):
+            hub = get_communication_hub()
+            assert hub is not communication_hub, f"tenant_scope from {module.__name__} returned the default hub"
+            assert hub is get_communication_hub(), "tenant hub changed between calls"
+    assert get_communication_hub() is communication_hub, "default hub not restored"
+    print(f"Tenant hubs: {communication_hub_pool.get_stats()['resident']} resident, default hub outside tenant_scope")
@@ -5,11 +5,15 @@ Maintains unified consciousness state across all system components
 
 import asyncio
 import json
+import threading
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
-from .message_router import ConsciousnessLevel, ConsciousnessContext, communication_hub
+from .message_router import (
+    ConsciousnessLevel, ConsciousnessContext, UnifiedMessageRouter,
+    communication_hub, get_communication_hub
+)
 
 class ComponentState(Enum):
     INITIALIZING = "initializing"
@@ -36,7 +40,8 @@ class ConsciousnessStateSynchronizer:
     Maintains unified consciousness state for the entire system
     """
 
-    def __init__(self):
+    def __init__(self, hub: Optional[UnifiedMessageRouter] = None):
+        self.hub = hub or communication_hub
         self.component_states: Dict[str, ComponentConsciousnessState] = {}
         self.global_consciousness_state = {
             'level': ConsciousnessLevel.EMERGENT,
@@ -141,8 +146,8 @@ class ConsciousnessStateSynchronizer:
         }
 
         # Update communication hub state
-        communication_hub.consciousness_state = global_level
-        communication_hub.global_awareness = avg_awareness
+        self.hub.consciousness_state = global_level
+        self.hub.global_awareness = avg_awareness
 
     def _determine_global_consciousness_level(self, avg_awareness: float, avg_integration: float) -> ConsciousnessLevel:
         """Determine global consciousness level based on component averages"""
@@ -202,7 +207,7 @@ class ConsciousnessStateSynchronizer:
         # Send to all registered components
         for comp_id in self.component_states:
             if comp_id != component_id:
-                await communication_hub.route_message(
+                await self.hub.route_message(
                     sender='state_synchronizer',
                     recipient=comp_id,
                     message=registration_message,
@@ -221,7 +226,7 @@ class ConsciousnessStateSynchronizer:
         # Send to all other components
         for comp_id in self.component_states:
             if comp_id != component_id:
-                await communication_hub.route_message(
+                await self.hub.route_message(
                     sender='state_synchronizer',
                     recipient=comp_id,
                     message=update_message,
@@ -267,15 +272,33 @@ class ConsciousnessStateSynchronizer:
         }
 
         for component_id in self.component_states:
-            await communication_hub.route_message(
+            await self.hub.route_message(
                 sender='state_synchronizer',
                 recipient=component_id,
                 message=sync_message,
                 context={'forced_sync': True}
             )
 
-# Global state synchronizer instance
+# Global state synchronizer instance, used when no tenant is active
 state_synchronizer = ConsciousnessStateSynchronizer()
 
 # Register with communication hub
 communication_hub.register_component('state_synchronizer', state_synchronizer)
+
+# Per-tenant synchronizers live on their tenant's hub, selected with
+# engine_pool.tenant_scope, so the hub pool creates and evicts both together
+_tenant_synchronizer_lock = threading.Lock()
+
+def get_state_synchronizer() -> ConsciousnessStateSynchronizer:
+    """The calling context's state synchronizer, bound to its hub"""
+    hub = get_communication_hub()
+    if hub is communication_hub:
+        return state_synchronizer
+
+    with _tenant_synchronizer_lock:
+        synchronizer = hub.components.get('state_synchronizer')
+        # A new tenant hub starts with the global synchronizer among the components it copies
+        if not isinstance(synchronizer, ConsciousnessStateSynchronizer) or synchronizer.hub is not hub:
+            synchronizer = ConsciousnessStateSynchronizer(hub)
+            hub.components['state_synchronizer'] = synchronizer
+        return synchronizer